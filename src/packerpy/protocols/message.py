@@ -1,6 +1,9 @@
 """Message abstraction for protocol communication."""
 
 from abc import ABC
+from base64 import b64encode
+from functools import lru_cache
+import sys
 from typing import Any, Dict, List, Optional, Tuple, Union, Type
 
 from packerpy.protocols.message_partial import (
@@ -10,10 +13,66 @@ from packerpy.protocols.message_partial import (
     FieldEncoder,
     BitPackingContext,
     BitUnpackingContext,
+    FieldSchemaMeta,
+    _compile_bit_functions,
+    _compile_bit_layout,
+    _compile_field_plan,
+    _install_field_plan,
+    _deserialize_view,
+    _dict_converters,
+    _is_partial_type,
+    _load_view_field,
+    _load_view_fields,
+    _fields_equal,
+    _fill_partial_dicts,
+    _partial_dict,
+    _items_struct,
+    _scalar_struct,
+    _LENGTH_PREFIX,
+    _NO_STATIC,
+    _PLAIN_DICT_TYPES,
+    _UNSET,
+    _unpack_items,
+    _value_packer,
 )
 
+# Spec keys marking a field as computed or conditional, so validate() does
+# not require it to be set.
+_OPTIONAL_FIELD_KEYS = frozenset(
+    {"compute", "length_of", "size_of", "value_from", "condition"}
+)
+
+
+@lru_cache(maxsize=None)
+def _resolve_message_cls(name: str) -> Type["Message"]:
+    """
+    Find the Message subclass with the given class name.
 
-class Message(ABC):
+    The subclass tree is walked once per name; the cache is cleared whenever
+    a new Message subclass is defined.
+
+    Raises:
+        ValueError: If no Message subclass has that name, or several do
+    """
+    pending = list(Message.__subclasses__())
+    seen = set(pending)
+    matches = []
+    for candidate in pending:
+        if candidate.__name__ == name:
+            matches.append(candidate)
+        for subclass in candidate.__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                pending.append(subclass)
+    if not matches:
+        raise ValueError(f"Unknown message type: {name}")
+    if len(matches) > 1:
+        found = sorted(f"{cls.__module__}.{cls.__qualname__}" for cls in matches)
+        raise ValueError(f"Ambiguous message type: {name} ({', '.join(found)})")
+    return matches[0]
+
+
+class Message(ABC, metaclass=FieldSchemaMeta):
     """
     Base class for protocol messages with declarative field definitions.
 
@@ -32,6 +91,7 @@ class Message(ABC):
     - numlist: Fixed array size
     - serializer: Serializer instance (BytesSerializer/JSONSerializer) for this field
     - static: Static/constant value for this field (always this value)
+    - intern: sys.intern decoded 'str' values (for strings that repeat a lot)
 
     Supported built-in types:
     - Native Python: "int", "str", "float", "double", "bool", "bytes"
@@ -89,17 +149,64 @@ class Message(ABC):
     encoding: Encoding = Encoding.BIG_ENDIAN
     fields: Dict[str, Dict[str, Any]] = {}
     bitwise: bool = False  # Set to True to enable bitwise packing
+    # Set to True to reuse serialize_bytes() output until an attribute is
+    # assigned (in-place changes to nested values are not detected)
+    cache_serialized: bool = False
+    # Static field values are enforced and stored as class attributes
+    _honor_static: bool = True
 
     def __init__(self, **kwargs):
         """Initialize with field values."""
-        for field_name, field_spec in self.fields.items():
-            # Check if field has a static value
-            if "static" in field_spec:
-                # Always use the static value, ignore kwargs
-                setattr(self, field_name, field_spec["static"])
+        for field_name, static in self._init_fields:
+            # Static fields always use their declared value, ignoring kwargs
+            if static is not _NO_STATIC:
+                setattr(self, field_name, static)
             # Only set attributes that are provided in kwargs
             elif field_name in kwargs:
-                setattr(self, field_name, kwargs.get(field_name))
+                setattr(self, field_name, kwargs[field_name])
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _resolve_message_cls.cache_clear()
+
+    @classmethod
+    def _compile_fields(cls) -> None:
+        """Compile the field plan for this class (called by the metaclass)."""
+        # (name, static value or _NO_STATIC) for __init__, in field order.
+        # Statics already provided by a class attribute need no assignment.
+        cls._init_fields = tuple(
+            (name, static)
+            for name, static in (
+                (name, spec.get("static", _NO_STATIC))
+                for name, spec in cls.fields.items()
+            )
+            if static is _NO_STATIC or getattr(cls, name, _NO_STATIC) is not static
+        )
+        # Fields validate() requires; computed and conditional ones are skipped
+        cls._required_fields = tuple(
+            name
+            for name, spec in cls.fields.items()
+            if not _OPTIONAL_FIELD_KEYS & spec.keys()
+        )
+        cls._from_dict_converters = _dict_converters(cls.fields)
+        # (field_name, declared as a nested partial) pairs read by to_dict
+        cls._dict_plan = tuple(
+            (name, _is_partial_type(spec["type"])) for name, spec in cls.fields.items()
+        )
+        cls._is_bitwise = cls.bitwise or cls._has_bitwise_fields_static()
+        cls._bit_pack = cls._bit_unpack = None
+        plan = None
+        if not cls._is_bitwise:
+            plan = _compile_field_plan(
+                cls.fields, cls.encoding.value, honor_static=True
+            )
+        else:
+            layout = _compile_bit_layout(cls.fields)
+            if layout is not None:
+                cls._bit_pack, cls._bit_unpack = _compile_bit_functions(
+                    cls.__name__, layout
+                )
+        _install_field_plan(cls, plan)
 
     def _resolve_field_reference(self, field_ref: str) -> Any:
         """
@@ -357,14 +464,18 @@ class Message(ABC):
         Returns:
             Byte representation
         """
+        # Plain schemas: generated function, one exactly-sized buffer
+        if self._field_plan is not None:
+            return self._pack_plan()
+
         byteorder = self.encoding.value
 
         # Check if this message uses bitwise encoding
-        if self.bitwise or self._has_bitwise_fields():
+        if self._is_bitwise:
             return self._serialize_bitwise(byteorder)
 
-        # Standard byte-aligned serialization
-        result = b""
+        # Standard byte-aligned serialization, appended in place to one buffer
+        result = bytearray()
 
         for field_name, field_spec in self.fields.items():
             # Check if this field should be conditionally included
@@ -410,8 +521,12 @@ class Message(ABC):
                     raise ValueError(f"{field_name} must be a list")
                 if len(value) != numlist_param:
                     raise ValueError(f"{field_name} must have {numlist_param} elements")
-                for item in value:
-                    result += self._serialize_value(item, field_spec, byteorder)
+                items = _items_struct(field_spec, byteorder, len(value))
+                if items is not None:
+                    result += items.pack(*value)
+                else:
+                    for item in value:
+                        result += self._serialize_value(item, field_spec, byteorder)
             # Handle dynamic arrays with length prefix
             elif field_spec.get("dynamic_array"):
                 if not isinstance(value, list):
@@ -420,8 +535,12 @@ class Message(ABC):
                 length = len(value)
                 result += length.to_bytes(4, byteorder)
                 # Write each element
-                for item in value:
-                    result += self._serialize_value(item, field_spec, byteorder)
+                items = _items_struct(field_spec, byteorder, len(value))
+                if items is not None:
+                    result += items.pack(*value)
+                else:
+                    for item in value:
+                        result += self._serialize_value(item, field_spec, byteorder)
             # Handle dynamic arrays with delimiter
             elif "delimiter" in field_spec:
                 if not isinstance(value, list):
@@ -439,7 +558,7 @@ class Message(ABC):
             else:
                 result += self._serialize_value(value, field_spec, byteorder)
 
-        return result
+        return bytes(result)
 
     def _serialize_value(
         self, value: Any, field_spec: Dict[str, Any], byteorder: str
@@ -480,6 +599,12 @@ class Message(ABC):
                 return encode_fn(value, byteorder)
             raise ValueError(f"encode must be callable")
 
+        # Built-in type strings: one cached packer per (type, byte order)
+        if isinstance(field_type, str):
+            packer = _value_packer(field_type, byteorder)
+            if packer is not None:
+                return packer(value)
+
         # Enum type
         if field_type == "enum":
             enum_class = field_spec.get("enum")
@@ -503,39 +628,7 @@ class Message(ABC):
                 f"Field type must be str or MessagePartial subclass, got {type(field_type)}"
             )
 
-        # Sized integers
-        if field_type.startswith("int("):
-            bits = int(field_type[4:-1])
-            byte_size = bits // 8
-            return value.to_bytes(byte_size, byteorder, signed=True)
-        elif field_type.startswith("uint("):
-            bits = int(field_type[5:-1])
-            byte_size = bits // 8
-            return value.to_bytes(byte_size, byteorder, signed=False)
-        # Native Python types
-        elif field_type == "int":
-            return value.to_bytes(8, byteorder, signed=True)
-        elif field_type == "str":
-            value_bytes = value.encode("utf-8")
-            length = len(value_bytes)
-            return length.to_bytes(4, byteorder) + value_bytes
-        elif field_type == "float":
-            import struct
-
-            fmt = "<f" if byteorder == "little" else ">f"
-            return struct.pack(fmt, value)
-        elif field_type == "double":
-            import struct
-
-            fmt = "<d" if byteorder == "little" else ">d"
-            return struct.pack(fmt, value)
-        elif field_type == "bool":
-            return bytes([1 if value else 0])
-        elif field_type == "bytes":
-            length = len(value)
-            return length.to_bytes(4, byteorder) + value
-        else:
-            raise ValueError(f"Unsupported type: {field_type}")
+        raise ValueError(f"Unsupported type: {field_type}")
 
     def _has_bitwise_fields(self) -> bool:
         """Check if any fields use bitwise encoding."""
@@ -565,6 +658,10 @@ class Message(ABC):
         Returns:
             Packed bytes
         """
+        # All-'bit' schemas use the pack function generated for the class
+        if self._bit_pack is not None:
+            return self._bit_pack()
+
         context = BitPackingContext(byteorder)
 
         for field_name, field_spec in self.fields.items():
@@ -586,25 +683,21 @@ class Message(ABC):
 
                 bit_count = field_spec.get("bits", 1)
                 signed = field_spec.get("signed", False)
+                if signed:
+                    min_val = -(2 ** (bit_count - 1))
+                    max_val = 2 ** (bit_count - 1) - 1
+                else:
+                    min_val = 0
+                    max_val = 2**bit_count - 1
 
                 for item in value:
-                    # Validate
-                    if signed:
-                        min_val = -(2 ** (bit_count - 1))
-                        max_val = 2 ** (bit_count - 1) - 1
-                    else:
-                        min_val = 0
-                        max_val = 2**bit_count - 1
-
                     if item < min_val or item > max_val:
                         raise ValueError(
                             f"{field_name}: value {item} out of range for {bit_count}-bit field"
                         )
 
-                    # Pack
-                    if signed and item < 0:
-                        item = (1 << bit_count) + item
-                    context.pack_bits(item, bit_count)
+                # Negative items are masked to their two's complement bits
+                context.pack_array(value, bit_count)
 
             # Handle bitwise fields
             elif field_type == "bit":
@@ -655,6 +748,9 @@ class Message(ABC):
         Returns:
             Tuple of (field values dict, bytes consumed)
         """
+        if cls._bit_unpack is not None:
+            return cls._bit_unpack(data)
+
         context = BitUnpackingContext(data, byteorder)
         kwargs = {}
 
@@ -688,15 +784,15 @@ class Message(ABC):
                 signed = field_spec.get("signed", False)
                 array_size = field_spec["numlist"]
 
-                values = []
-                for _ in range(array_size):
-                    value = context.unpack_bits(bit_count)
-
-                    # Convert to signed if needed
-                    if signed and (value & (1 << (bit_count - 1))):
-                        value -= 1 << bit_count
+                values = context.unpack_array(array_size, bit_count)
 
-                    values.append(value)
+                # Convert to signed if needed
+                if signed:
+                    sign_bit = 1 << (bit_count - 1)
+                    values = [
+                        value - (sign_bit << 1) if value & sign_bit else value
+                        for value in values
+                    ]
 
                 kwargs[field_name] = values
 
@@ -722,6 +818,24 @@ class Message(ABC):
 
         return kwargs, context.get_bytes_consumed()
 
+    @classmethod
+    def deserialize_view(cls, data: bytes) -> Tuple["Message", int]:
+        """
+        Deserialize lazily: each field is decoded from data when first read.
+
+        Only field boundaries are located up front, so fields that are
+        never read are never decoded. The instance keeps a view of bytes
+        data alive; other buffers are copied, so the caller may reuse them.
+        Classes that cannot be read lazily fall back to deserialize_bytes.
+
+        Args:
+            data: Bytes to deserialize
+
+        Returns:
+            Tuple of (Message instance, bytes consumed)
+        """
+        return _deserialize_view(cls, data, Message.__init__)
+
     @classmethod
     def deserialize_bytes(cls, data: bytes) -> Tuple["Message", int]:
         """
@@ -736,10 +850,16 @@ class Message(ABC):
         Returns:
             Tuple of (Message instance, bytes consumed)
         """
+        if cls._field_plan is not None:
+            return cls._decode_from(memoryview(data), 0)
+
+        # Fields are parsed from slices of a memoryview, so walking the input
+        # copies nothing; str and bytes values are materialized at the end.
+        data = memoryview(data)
         byteorder = cls.encoding.value
 
         # Check if this message uses bitwise encoding
-        if cls.bitwise or cls._has_bitwise_fields_static():
+        if cls._is_bitwise:
             kwargs, bytes_consumed = cls._deserialize_bitwise(data, byteorder)
             return cls(**kwargs), bytes_consumed
 
@@ -813,27 +933,37 @@ class Message(ABC):
 
             # Handle fixed-size arrays
             if "numlist" in field_spec_resolved:
-                values = []
-                for _ in range(field_spec_resolved["numlist"]):
-                    value, consumed = cls._deserialize_value(
-                        data[offset:], field_spec, byteorder, kwargs
-                    )
-                    values.append(value)
-                    offset += consumed
+                items = _items_struct(
+                    field_spec, byteorder, field_spec_resolved["numlist"]
+                )
+                if items is not None:
+                    values, offset = _unpack_items(items, data, offset)
+                else:
+                    values = []
+                    for _ in range(field_spec_resolved["numlist"]):
+                        value, consumed = cls._deserialize_value(
+                            data[offset:], field_spec, byteorder, kwargs
+                        )
+                        values.append(value)
+                        offset += consumed
                 kwargs[field_name] = values
             # Handle dynamic arrays with length prefix
             elif field_spec.get("dynamic_array"):
                 if len(data) < offset + 4:
                     raise ValueError("Insufficient data for array length")
-                array_length = int.from_bytes(data[offset : offset + 4], byteorder)
+                array_length = _LENGTH_PREFIX[byteorder].unpack_from(data, offset)[0]
                 offset += 4
-                values = []
-                for _ in range(array_length):
-                    value, consumed = cls._deserialize_value(
-                        data[offset:], field_spec, byteorder, kwargs
-                    )
-                    values.append(value)
-                    offset += consumed
+                items = _items_struct(field_spec, byteorder, array_length)
+                if items is not None:
+                    values, offset = _unpack_items(items, data, offset)
+                else:
+                    values = []
+                    for _ in range(array_length):
+                        value, consumed = cls._deserialize_value(
+                            data[offset:], field_spec, byteorder, kwargs
+                        )
+                        values.append(value)
+                        offset += consumed
                 kwargs[field_name] = values
             # Handle dynamic arrays with delimiter
             elif "delimiter" in field_spec:
@@ -956,13 +1086,13 @@ class Message(ABC):
             # Read length prefix
             if len(data) < 4:
                 raise ValueError("Insufficient data for serializer length prefix")
-            length = int.from_bytes(data[0:4], byteorder)
+            length = _LENGTH_PREFIX[byteorder].unpack_from(data)[0]
             if len(data) < 4 + length:
                 raise ValueError(
                     f"Insufficient data: need {4 + length}, got {len(data)}"
                 )
             # Deserialize using the specified serializer
-            serialized_data = data[4 : 4 + length]
+            serialized_data = bytes(data[4 : 4 + length])
 
             # Determine the message class for deserialization
             if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
@@ -981,6 +1111,8 @@ class Message(ABC):
         if "encoder" in field_spec:
             encoder = field_spec["encoder"]
             if isinstance(encoder, FieldEncoder):
+                if not encoder.accepts_memoryview:
+                    data = bytes(data)
                 return encoder.decode(data, byteorder)
             raise ValueError(f"Encoder must be a FieldEncoder instance")
 
@@ -988,7 +1120,7 @@ class Message(ABC):
         if "decode" in field_spec:
             decode_fn = field_spec["decode"]
             if callable(decode_fn):
-                return decode_fn(data, byteorder)
+                return decode_fn(bytes(data), byteorder)
             raise ValueError(f"decode must be callable")
 
         # Enum type
@@ -1002,6 +1134,9 @@ class Message(ABC):
 
         # Handle MessagePartial
         if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
+            # Overridden deserialize_bytes implementations get plain bytes
+            if field_type._custom_serialization:
+                data = bytes(data)
             instance, consumed = field_type.deserialize_bytes(data)
             return instance, consumed
 
@@ -1011,7 +1146,15 @@ class Message(ABC):
                 f"Field type must be str or MessagePartial subclass, got {type(field_type)}"
             )
 
-        # Sized integers
+        # Fixed-width numbers: one shared, precompiled Struct per type
+        scalar = _scalar_struct(field_type, byteorder)
+        if scalar is not None:
+            size = scalar.size
+            if len(data) < size:
+                raise ValueError(f"Insufficient data: need {size}, got {len(data)}")
+            return scalar.unpack_from(data)[0], size
+
+        # Sized integers of widths struct has no code for
         if field_type.startswith("int("):
             bits = int(field_type[4:-1])
             byte_size = bits // 8
@@ -1030,38 +1173,18 @@ class Message(ABC):
                 )
             value = int.from_bytes(data[0:byte_size], byteorder, signed=False)
             return value, byte_size
-        # Native Python types
-        elif field_type == "int":
-            if len(data) < 8:
-                raise ValueError(f"Insufficient data: need 8, got {len(data)}")
-            value = int.from_bytes(data[0:8], byteorder, signed=True)
-            return value, 8
         elif field_type == "str":
             if len(data) < 4:
                 raise ValueError("Insufficient data for length prefix")
-            length = int.from_bytes(data[0:4], byteorder)
+            length = _LENGTH_PREFIX[byteorder].unpack_from(data)[0]
             if len(data) < 4 + length:
                 raise ValueError(
                     f"Insufficient data: need {4 + length}, got {len(data)}"
                 )
-            value = data[4 : 4 + length].decode("utf-8")
+            value = str(data[4 : 4 + length], "utf-8")
+            if field_spec.get("intern"):
+                value = sys.intern(value)
             return value, 4 + length
-        elif field_type == "float":
-            if len(data) < 4:
-                raise ValueError(f"Insufficient data: need 4, got {len(data)}")
-            import struct
-
-            fmt = "<f" if byteorder == "little" else ">f"
-            value = struct.unpack(fmt, data[0:4])[0]
-            return value, 4
-        elif field_type == "double":
-            if len(data) < 8:
-                raise ValueError(f"Insufficient data: need 8, got {len(data)}")
-            import struct
-
-            fmt = "<d" if byteorder == "little" else ">d"
-            value = struct.unpack(fmt, data[0:8])[0]
-            return value, 8
         elif field_type == "bool":
             if len(data) < 1:
                 raise ValueError(f"Insufficient data: need 1, got {len(data)}")
@@ -1070,12 +1193,12 @@ class Message(ABC):
         elif field_type == "bytes":
             if len(data) < 4:
                 raise ValueError("Insufficient data for length prefix")
-            length = int.from_bytes(data[0:4], byteorder)
+            length = _LENGTH_PREFIX[byteorder].unpack_from(data)[0]
             if len(data) < 4 + length:
                 raise ValueError(
                     f"Insufficient data: need {4 + length}, got {len(data)}"
                 )
-            value = data[4 : 4 + length]
+            value = bytes(data[4 : 4 + length])
             return value, 4 + length
         else:
             raise ValueError(f"Unsupported type: {field_type}")
@@ -1091,107 +1214,123 @@ class Message(ABC):
             Fields with 'compute', 'length_of', 'size_of', 'value_from', or 'condition'
             are not required to be set initially as they are computed or conditional.
         """
-        for field_name, field_spec in self.fields.items():
-            # Skip validation for computed fields
-            if any(
-                k in field_spec
-                for k in ["compute", "length_of", "size_of", "value_from"]
-            ):
-                continue
-
-            # Skip validation for conditional fields
-            if "condition" in field_spec:
-                continue
-
-            # Regular fields must be set
+        # Regular fields must be set
+        for field_name in self._required_fields:
             if not hasattr(self, field_name):
                 return False
         return True
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, for_json: bool = False) -> Dict[str, Any]:
         """
         Convert message to dictionary for JSON/XML serialization.
 
+        Args:
+            for_json: Emit bytes fields as base64 strings instead of lists of
+                ints (used by JSONSerializer; from_dict accepts both forms)
+
         Returns:
             Dictionary representation
         """
+        # Nested partials are queued and filled in after the top-level fields.
+        pending = []
         result = {"type": self.__class__.__name__}
-        for field_name, field_spec in self.fields.items():
+        for field_name, is_partial_field in self._dict_plan:
             value = getattr(self, field_name)
-            field_type = field_spec["type"]
-
+            if type(value) in _PLAIN_DICT_TYPES:
+                result[field_name] = value
             # Handle MessagePartial
-            if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
+            elif is_partial_field:
                 if isinstance(value, MessagePartial):
-                    result[field_name] = value.to_dict()
+                    result[field_name] = _partial_dict(value, pending)
                 elif isinstance(value, list):
                     result[field_name] = [
-                        item.to_dict() if isinstance(item, MessagePartial) else item
+                        (
+                            _partial_dict(item, pending)
+                            if isinstance(item, MessagePartial)
+                            else item
+                        )
                         for item in value
                     ]
                 else:
                     result[field_name] = value
-            # Handle bytes - convert to list for JSON compatibility
+            # Handle bytes - list of ints, or base64 for JSON output
             elif isinstance(value, bytes):
-                result[field_name] = list(value)
+                result[field_name] = (
+                    b64encode(value).decode("ascii") if for_json else list(value)
+                )
             elif isinstance(value, list):
                 result[field_name] = [
-                    item.to_dict() if isinstance(item, MessagePartial) else item
+                    (
+                        _partial_dict(item, pending)
+                        if isinstance(item, MessagePartial)
+                        else item
+                    )
                     for item in value
                 ]
             else:
                 result[field_name] = value
+        _fill_partial_dicts(pending, for_json)
         return result
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Message":
+    def from_dict(cls, data: Dict[str, Any], for_json: bool = False) -> "Message":
         """
         Create message from dictionary.
 
+        When called on Message itself, the concrete class is looked up from
+        the dictionary's "type" entry (as written by to_dict).
+
         Args:
             data: Dictionary to deserialize
+            for_json: Read bytes fields given as strings as base64, the form
+                     to_dict(for_json=True) writes them in
 
         Returns:
             Message instance
+
+        Raises:
+            ValueError: If called on Message and "type" names no known subclass
         """
+        if cls is Message and "type" in data:
+            cls = _resolve_message_cls(data["type"])
+
         kwargs = {}
-        for field_name, field_spec in cls.fields.items():
+        for field_name, converter in cls._from_dict_converters:
             if field_name not in data:
                 continue
-
             value = data[field_name]
-            field_type = field_spec["type"]
-
-            # Handle MessagePartial
-            if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
-                if isinstance(value, dict):
-                    kwargs[field_name] = field_type.from_dict(value)
-                elif isinstance(value, list):
-                    kwargs[field_name] = [
-                        field_type.from_dict(item) if isinstance(item, dict) else item
-                        for item in value
-                    ]
-                else:
-                    kwargs[field_name] = value
-            # Handle bytes - convert from list if needed
-            elif field_type == "bytes" and isinstance(value, list):
-                kwargs[field_name] = bytes(value)
-            elif isinstance(value, list) and "numlist" in field_spec:
-                # Handle list of MessagePartials
-                if isinstance(field_type, type) and issubclass(
-                    field_type, MessagePartial
-                ):
-                    kwargs[field_name] = [
-                        field_type.from_dict(item) if isinstance(item, dict) else item
-                        for item in value
-                    ]
-                else:
-                    kwargs[field_name] = value
-            else:
-                kwargs[field_name] = value
+            if converter is not None:
+                value = converter(value, for_json)
+                if value is _UNSET:
+                    continue
+            kwargs[field_name] = value
 
         return cls(**kwargs)
 
+    def __getattr__(self, name: str) -> Any:
+        """Decode fields of instances created by deserialize_view on first use."""
+        return _load_view_field(self, name)
+
+    def __reduce_ex__(self, protocol: int) -> Any:
+        """Decode any fields still held in a lazy view before pickling or copying."""
+        _load_view_fields(self)
+        return super().__reduce_ex__(protocol)
+
+    def fields_equal(self, other: Any) -> bool:
+        """
+        Return True if other is a message of the same class with equal fields.
+
+        ``==`` keeps identity semantics, so messages stay hashable; use this
+        for value comparisons such as dedup or idempotency checks. Scalar
+        fields are compared first, and str/bytes fields are rejected on a
+        hash mismatch before their contents are scanned.
+        """
+        if other is self:
+            return True
+        if type(other) is not type(self):
+            return False
+        return _fields_equal(self, other)
+
     def __repr__(self) -> str:
         """String representation of message."""
         field_strs = [f"{name}={getattr(self, name)!r}" for name in self.fields.keys()]
@@ -1,9 +1,17 @@
 """MessagePartial base class with support for arbitrary encoding schemes."""
 
-from abc import ABC
+from abc import ABC, ABCMeta
+from array import array
+from base64 import b64decode, b64encode
 from enum import Enum, IntEnum
+from functools import lru_cache, wraps
+from itertools import groupby
+from keyword import iskeyword
+from operator import attrgetter
+from types import MemberDescriptorType
 from typing import Any, Dict, List, Tuple, Union, Type, Callable, Optional
 import struct
+import sys
 
 
 class Encoding(Enum):
@@ -18,8 +26,15 @@ class FieldEncoder(ABC):
     Base class for custom field encoders.
 
     Allows users to define arbitrary encoding schemes for field types.
+
+    decode() is given the rest of the message copied to bytes. Encoders
+    whose decode() also works on a memoryview can set accepts_memoryview
+    to True and are then handed a view of the input instead, so decoding
+    a field does not copy everything after it.
     """
 
+    accepts_memoryview = False
+
     @staticmethod
     def encode(value: Any, byteorder: str) -> bytes:
         """Encode a value to bytes."""
@@ -42,43 +57,53 @@ class FixedPointEncoder(FieldEncoder):
         }
     """
 
+    accepts_memoryview = True
+
     def __init__(self, int_bits: int, frac_bits: int, signed: bool = True):
         self.int_bits = int_bits
         self.frac_bits = frac_bits
         self.signed = signed
         self.total_bits = int_bits + frac_bits
         self.scale = 2**frac_bits
+        # Size, range and packer depend only on the format: computed once.
+        self.byte_size = (self.total_bits + 7) // 8
+        if signed:
+            self.min_value = -(1 << (self.total_bits - 1))
+            self.max_value = (1 << (self.total_bits - 1)) - 1
+        else:
+            self.min_value = 0
+            self.max_value = (1 << self.total_bits) - 1
+        code = _INT_STRUCT_CODES.get((self.byte_size, signed))
+        self._structs = code and {
+            "big": struct.Struct(">" + code),
+            "little": struct.Struct("<" + code),
+        }
 
     def encode(self, value: float, byteorder: str) -> bytes:
         """Encode float as fixed-point."""
         fixed = int(value * self.scale)
-        byte_size = (self.total_bits + 7) // 8
 
         # Check for overflow
-        if self.signed:
-            max_val = (1 << (self.total_bits - 1)) - 1
-            min_val = -(1 << (self.total_bits - 1))
-            if fixed > max_val or fixed < min_val:
-                raise ValueError(
-                    f"Value {value} out of range for {self.int_bits}.{self.frac_bits} fixed point"
-                )
-        else:
-            max_val = (1 << self.total_bits) - 1
-            if fixed > max_val or fixed < 0:
-                raise ValueError(
-                    f"Value {value} out of range for {self.int_bits}.{self.frac_bits} unsigned fixed point"
-                )
+        if fixed > self.max_value or fixed < self.min_value:
+            kind = "" if self.signed else "unsigned "
+            raise ValueError(
+                f"Value {value} out of range for {self.int_bits}.{self.frac_bits} {kind}fixed point"
+            )
 
-        return fixed.to_bytes(byte_size, byteorder, signed=self.signed)
+        if self._structs:
+            return self._structs[byteorder].pack(fixed)
+        return fixed.to_bytes(self.byte_size, byteorder, signed=self.signed)
 
     def decode(self, data: bytes, byteorder: str) -> Tuple[float, int]:
         """Decode fixed-point to float."""
-        byte_size = (self.total_bits + 7) // 8
+        byte_size = self.byte_size
         if len(data) < byte_size:
             raise ValueError(f"Insufficient data: need {byte_size}, got {len(data)}")
-        fixed = int.from_bytes(data[0:byte_size], byteorder, signed=self.signed)
-        value = fixed / self.scale
-        return value, byte_size
+        if self._structs:
+            fixed = self._structs[byteorder].unpack_from(data)[0]
+        else:
+            fixed = int.from_bytes(data[0:byte_size], byteorder, signed=self.signed)
+        return fixed / self.scale, byte_size
 
 
 class EnumEncoder(FieldEncoder):
@@ -96,12 +121,22 @@ class EnumEncoder(FieldEncoder):
         }
     """
 
+    accepts_memoryview = True
+
     def __init__(self, enum_class: Type[IntEnum], size: int = 1):
         self.enum_class = enum_class
         self.size = size
+        # Precompiled packers for the sizes struct supports (1, 2, 4, 8)
+        code = _INT_STRUCT_CODES.get((size, False))
+        self.structs = code and {
+            "big": struct.Struct(">" + code),
+            "little": struct.Struct("<" + code),
+        }
 
     def encode(self, value: Union[IntEnum, int], byteorder: str) -> bytes:
         """Encode enum value."""
+        if self.structs:
+            return self.structs[byteorder].pack(value)
         if isinstance(value, IntEnum):
             value = value.value
         return value.to_bytes(self.size, byteorder, signed=False)
@@ -110,10 +145,17 @@ class EnumEncoder(FieldEncoder):
         """Decode enum value."""
         if len(data) < self.size:
             raise ValueError(f"Insufficient data: need {self.size}, got {len(data)}")
-        value = int.from_bytes(data[0 : self.size], byteorder, signed=False)
+        if self.structs:
+            value = self.structs[byteorder].unpack_from(data)[0]
+        else:
+            value = int.from_bytes(data[0 : self.size], byteorder, signed=False)
         return self.enum_class(value), self.size
 
 
+# bytes([i]) for every byte value, used to expand runs.
+_SINGLE_BYTES = [bytes((i,)) for i in range(256)]
+
+
 class RunLengthEncoder(FieldEncoder):
     """
     Encoder for run-length encoded data.
@@ -124,23 +166,24 @@ class RunLengthEncoder(FieldEncoder):
         }
     """
 
+    accepts_memoryview = True
+
     def encode(self, value: bytes, byteorder: str) -> bytes:
         """Encode bytes using run-length encoding."""
         if not value:
             return b"\x00\x00\x00\x00"  # Empty data
 
+        # groupby finds the runs in C; runs longer than 255 are split into
+        # full 255-byte pairs plus the remainder.
         result = []
-        i = 0
-        while i < len(value):
-            current = value[i]
-            count = 1
-            while (
-                i + count < len(value) and value[i + count] == current and count < 255
-            ):
-                count += 1
-            result.append(count)
-            result.append(current)
-            i += count
+        for byte, run in groupby(value):
+            count = len(bytes(run))
+            if count > 255:
+                full, count = divmod(count, 255)
+                result.extend((255, byte) * full)
+                if not count:
+                    continue
+            result.extend((count, byte))
 
         # Prefix with length
         encoded = bytes(result)
@@ -151,20 +194,25 @@ class RunLengthEncoder(FieldEncoder):
         """Decode run-length encoded bytes."""
         if len(data) < 4:
             raise ValueError("Insufficient data for length prefix")
-        length = int.from_bytes(data[0:4], byteorder)
+        length = _LENGTH_PREFIX[byteorder].unpack_from(data)[0]
         if len(data) < 4 + length:
             raise ValueError(f"Insufficient data: need {4 + length}, got {len(data)}")
 
-        encoded = data[4 : 4 + length]
-        result = []
-        for i in range(0, len(encoded), 2):
-            if i + 1 >= len(encoded):
-                break
-            count = encoded[i]
-            value = encoded[i + 1]
-            result.extend([value] * count)
+        encoded = bytes(data[4 : 4 + length])
+        # Counts and values are the even and odd bytes; a trailing unpaired
+        # count is dropped by zip.
+        result = b"".join(
+            _SINGLE_BYTES[value] * count
+            for count, value in zip(encoded[0::2], encoded[1::2])
+        )
+
+        return result, 4 + length
 
-        return bytes(result), 4 + length
+
+# Eight packed 7-bit characters are handled as one big-endian 64-bit word.
+_U64_BE = struct.Struct(">Q")
+# 2-byte character count written ahead of the packed text, per byte order.
+_CHAR_COUNT_PREFIX = {"big": struct.Struct(">H"), "little": struct.Struct("<H")}
 
 
 class SevenBitASCIIEncoder(FieldEncoder):
@@ -179,65 +227,56 @@ class SevenBitASCIIEncoder(FieldEncoder):
         }
     """
 
+    accepts_memoryview = True
+
     def encode(self, value: str, byteorder: str) -> bytes:
         """Encode string as packed 7-bit ASCII."""
-        # Convert to 7-bit values
-        ascii_values = [ord(c) & 0x7F for c in value]
-
-        # Pack into bytes
-        packed = []
-        bit_buffer = 0
-        bits_in_buffer = 0
-
-        for val in ascii_values:
-            bit_buffer = (bit_buffer << 7) | val
-            bits_in_buffer += 7
-
-            while bits_in_buffer >= 8:
-                bits_in_buffer -= 8
-                byte = (bit_buffer >> bits_in_buffer) & 0xFF
-                packed.append(byte)
-                bit_buffer &= (1 << bits_in_buffer) - 1
-
-        # Flush remaining bits
-        if bits_in_buffer > 0:
-            packed.append((bit_buffer << (8 - bits_in_buffer)) & 0xFF)
+        try:
+            codes = value.encode("ascii")
+        except UnicodeEncodeError:
+            codes = bytes(ord(c) & 0x7F for c in value)
+
+        # Each block of 8 characters is read as one 64-bit int and its eight
+        # 7-bit codes are squeezed together with three mask-and-shift steps.
+        codes += bytes(-len(codes) % 8)
+        packed = bytearray()
+        for (block,) in _U64_BE.iter_unpack(codes):
+            block = (block & 0x007F007F007F007F) | ((block & 0x7F007F007F007F00) >> 1)
+            block = (block & 0x00003FFF00003FFF) | ((block & 0x3FFF00003FFF0000) >> 2)
+            block = (block & 0x000000000FFFFFFF) | ((block & 0x0FFFFFFF00000000) >> 4)
+            packed += _U64_BE.pack(block)[1:]
 
         # Prefix with length (number of characters)
         length = len(value)
-        return length.to_bytes(2, byteorder) + bytes(packed)
+        return (
+            _CHAR_COUNT_PREFIX[byteorder].pack(length) + packed[: (length * 7 + 7) // 8]
+        )
 
     def decode(self, data: bytes, byteorder: str) -> Tuple[str, int]:
         """Decode packed 7-bit ASCII to string."""
         if len(data) < 2:
             raise ValueError("Insufficient data for length prefix")
 
-        char_count = int.from_bytes(data[0:2], byteorder)
-        packed_data = data[2:]
-
-        # Unpack 7-bit values
-        bit_buffer = 0
-        bits_in_buffer = 0
-        chars = []
-
-        for byte in packed_data:
-            bit_buffer = (bit_buffer << 8) | byte
-            bits_in_buffer += 8
-
-            while bits_in_buffer >= 7 and len(chars) < char_count:
-                bits_in_buffer -= 7
-                val = (bit_buffer >> bits_in_buffer) & 0x7F
-                chars.append(chr(val))
-                bit_buffer &= (1 << bits_in_buffer) - 1
-
-            if len(chars) >= char_count:
-                break
+        (char_count,) = _CHAR_COUNT_PREFIX[byteorder].unpack_from(data)
+        packed_bytes = (char_count * 7 + 7) // 8
+        packed_data = bytes(data[2 : 2 + packed_bytes])
+        # Truncated input yields only the characters it fully contains.
+        available = min(char_count, len(packed_data) * 8 // 7)
+
+        # Reverse of encode: spread each 7-byte block back into 8 bytes.
+        packed_data += bytes(-len(packed_data) % 7)
+        chars = bytearray()
+        for start in range(0, len(packed_data), 7):
+            block = int.from_bytes(packed_data[start : start + 7], "big")
+            block = (block & 0x000000000FFFFFFF) | ((block & 0x00FFFFFFF0000000) << 4)
+            block = (block & 0x00003FFF00003FFF) | ((block & 0x0FFFC0000FFFC000) << 2)
+            block = (block & 0x007F007F007F007F) | ((block & 0x3F803F803F803F80) << 1)
+            chars += _U64_BE.pack(block)
 
         # Calculate bytes consumed
-        packed_bytes = (char_count * 7 + 7) // 8
         total_consumed = 2 + packed_bytes
 
-        return "".join(chars), total_consumed
+        return chars[:available].decode("ascii"), total_consumed
 
 
 class BitwiseEncoder(FieldEncoder):
@@ -277,6 +316,8 @@ class BitwiseEncoder(FieldEncoder):
     are processed, any remaining bits are padded to the next byte boundary.
     """
 
+    accepts_memoryview = True
+
     def __init__(self, bits: int, signed: bool = False):
         """
         Initialize bitwise encoder.
@@ -370,13 +411,20 @@ class BitPackingContext:
         """
         Initialize bit packing context.
 
+        Bits accumulate in a single int and are converted to bytes once, by
+        flush, instead of being split off a byte at a time as they fill up.
+
         Args:
             byteorder: Byte order for multi-byte values
         """
         self.byteorder = byteorder
         self.bit_buffer = 0
-        self.bits_in_buffer = 0
-        self.output = bytearray()
+        self.bit_count = 0
+
+    @property
+    def bits_in_buffer(self) -> int:
+        """Number of packed bits past the last full byte."""
+        return self.bit_count & 7
 
     def pack_bits(self, value: int, bit_count: int) -> None:
         """
@@ -386,35 +434,42 @@ class BitPackingContext:
             value: Integer value to pack
             bit_count: Number of bits to use
         """
-        # Add bits to buffer
         self.bit_buffer = (self.bit_buffer << bit_count) | (
             value & ((1 << bit_count) - 1)
         )
-        self.bits_in_buffer += bit_count
+        self.bit_count += bit_count
 
-        # Flush complete bytes
-        while self.bits_in_buffer >= 8:
-            self.bits_in_buffer -= 8
-            byte = (self.bit_buffer >> self.bits_in_buffer) & 0xFF
-            self.output.append(byte)
-            self.bit_buffer &= (1 << self.bits_in_buffer) - 1
+    def pack_array(self, values: List[int], bit_count: int) -> None:
+        """
+        Pack a sequence of values that share one bit width.
+
+        The buffer is updated once for the whole sequence instead of once
+        per value.
+
+        Args:
+            values: Integer values to pack, in order
+            bit_count: Number of bits to use for each value
+        """
+        mask = (1 << bit_count) - 1
+        buffer = self.bit_buffer
+        for value in values:
+            buffer = (buffer << bit_count) | (value & mask)
+        self.bit_buffer = buffer
+        self.bit_count += bit_count * len(values)
 
     def flush(self) -> bytes:
         """
-        Flush remaining bits to output, padding to byte boundary.
+        Flush packed bits to bytes, padding with zeros to a byte boundary.
 
         Returns:
             Packed bytes
         """
-        if self.bits_in_buffer > 0:
-            # Pad with zeros and flush final byte
-            byte = (self.bit_buffer << (8 - self.bits_in_buffer)) & 0xFF
-            self.output.append(byte)
-            self.bits_in_buffer = 0
-            self.bit_buffer = 0
-
-        result = bytes(self.output)
-        self.output = bytearray()  # Reset output buffer
+        padding = -self.bit_count & 7
+        result = (self.bit_buffer << padding).to_bytes(
+            (self.bit_count + padding) >> 3, "big"
+        )
+        self.bit_buffer = 0
+        self.bit_count = 0
         return result
 
 
@@ -425,19 +480,33 @@ class BitUnpackingContext:
     Handles bit-level extraction from byte streams.
     """
 
+    # Bytes converted to an int at a time; bounds the cost of each shift
+    # when data holds more than the bitwise fields.
+    WINDOW_BYTES = 256
+
     def __init__(self, data: bytes, byteorder: str = "big"):
         """
         Initialize bit unpacking context.
 
+        Bits are served from an int holding a window of the data (all of it
+        for short inputs), so each unpack_bits is a shift and a mask rather
+        than a loop over bytes.
+
         Args:
             data: Bytes to unpack
             byteorder: Byte order for multi-byte values
         """
         self.data = data
         self.byteorder = byteorder
-        self.bit_buffer = 0
-        self.bits_in_buffer = 0
-        self.byte_offset = 0
+        self.bit_position = 0
+        self.total_bits = len(data) * 8
+        self._window = 0
+        self._window_end = 0
+
+    @property
+    def byte_offset(self) -> int:
+        """Number of bytes touched so far (including a partial last byte)."""
+        return (self.bit_position + 7) >> 3
 
     def unpack_bits(self, bit_count: int) -> int:
         """
@@ -449,22 +518,37 @@ class BitUnpackingContext:
         Returns:
             Integer value
         """
-        # Ensure we have enough bits
-        while self.bits_in_buffer < bit_count:
-            if self.byte_offset >= len(self.data):
+        end = self.bit_position + bit_count
+        if end > self._window_end:
+            if end > self.total_bits:
                 raise ValueError("Insufficient data for bit unpacking")
+            first = self.bit_position >> 3
+            last = min(max(first + self.WINDOW_BYTES, (end + 7) >> 3), len(self.data))
+            self._window = int.from_bytes(self.data[first:last], "big")
+            self._window_end = last << 3
+        self.bit_position = end
+        return (self._window >> (self._window_end - end)) & ((1 << bit_count) - 1)
+
+    def unpack_array(self, count: int, bit_count: int) -> List[int]:
+        """
+        Unpack count values of bit_count bits each.
 
-            # Load next byte
-            self.bit_buffer = (self.bit_buffer << 8) | self.data[self.byte_offset]
-            self.bits_in_buffer += 8
-            self.byte_offset += 1
+        The values are read from the stream in one unpack_bits call and then
+        split apart.
 
-        # Extract the bits
-        self.bits_in_buffer -= bit_count
-        value = (self.bit_buffer >> self.bits_in_buffer) & ((1 << bit_count) - 1)
-        self.bit_buffer &= (1 << self.bits_in_buffer) - 1
+        Args:
+            count: Number of values to extract
+            bit_count: Number of bits per value
 
-        return value
+        Returns:
+            List of unsigned integer values
+        """
+        packed = self.unpack_bits(count * bit_count)
+        mask = (1 << bit_count) - 1
+        return [
+            packed >> shift & mask
+            for shift in range((count - 1) * bit_count, -1, -bit_count)
+        ]
 
     def get_bytes_consumed(self) -> int:
         """
@@ -476,7 +560,1642 @@ class BitUnpackingContext:
         return self.byte_offset
 
 
-class MessagePartial(ABC):
+# Sentinel marking a plan entry whose value is read from the instance.
+_NO_STATIC = object()
+
+# Sentinel marking a decode step that yields several fields at once.
+_RUN = object()
+
+# struct codes for the integer widths struct can pack natively.
+_INT_STRUCT_CODES = {
+    (1, True): "b",
+    (2, True): "h",
+    (4, True): "i",
+    (8, True): "q",
+    (1, False): "B",
+    (2, False): "H",
+    (4, False): "I",
+    (8, False): "Q",
+}
+
+# struct codes whose array.array typecode has the same item size on this
+# platform, so a whole numeric array can be converted in one C call.
+_ARRAY_TYPECODES = {
+    code: code
+    for code in "bBhHiIqQfd"
+    if array(code).itemsize == struct.calcsize("<" + code)
+}
+
+
+def _check_available(data: Any, offset: int, size: int) -> None:
+    """Raise ValueError if fewer than size bytes remain after offset."""
+    if offset + size > len(data):
+        raise ValueError(f"Insufficient data: need {size}, got {len(data) - offset}")
+
+
+# Shared 4-byte length-prefix packers, written in place with pack_into so no
+# temporary bytes object is created per prefix.
+_LENGTH_PREFIX = {"big": struct.Struct(">I"), "little": struct.Struct("<I")}
+
+
+def _read_length_prefix(data: Any, offset: int, length_struct: struct.Struct) -> int:
+    """Read a 4-byte length prefix and check the payload it announces."""
+    if offset + 4 > len(data):
+        raise ValueError("Insufficient data for length prefix")
+    (length,) = length_struct.unpack_from(data, offset)
+    _check_available(data, offset, 4 + length)
+    return length
+
+
+# Spec keys the compiled field plan understands. Any other key (conditions,
+# computed values, custom encoders, deep assignments, ...) keeps the class on
+# the generic per-field path.
+_PLAN_KEYS = frozenset(
+    {"type", "numlist", "dynamic_array", "static", "enum", "size", "intern"}
+)
+
+
+class _IntCodec:
+    """
+    Fixed-width integer field written with int.to_bytes.
+
+    Only used for widths struct has no code for (e.g. int(24)); 1, 2, 4 and
+    8 byte integers use _StructCodec, whose precompiled pack_into and
+    unpack_from are several times faster than to_bytes/from_bytes plus a
+    slice.
+    """
+
+    __slots__ = ("fixed_size", "byteorder", "signed")
+    struct_code = None
+
+    def __init__(self, byte_size: int, byteorder: str, signed: bool):
+        self.fixed_size = byte_size
+        self.byteorder = byteorder
+        self.signed = signed
+
+    def pack_into(self, buf: bytearray, offset: int, value: int) -> int:
+        end = offset + self.fixed_size
+        buf[offset:end] = value.to_bytes(
+            self.fixed_size, self.byteorder, signed=self.signed
+        )
+        return end
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[int, int]:
+        end = offset + self.fixed_size
+        _check_available(data, offset, self.fixed_size)
+        return int.from_bytes(data[offset:end], self.byteorder, signed=self.signed), end
+
+
+class _StructCodec:
+    """Fixed-width field backed by a precompiled struct.Struct."""
+
+    __slots__ = ("fixed_size", "struct", "struct_code")
+
+    def __init__(self, fmt: str):
+        self.struct = struct.Struct(fmt)
+        self.fixed_size = self.struct.size
+        self.struct_code = fmt[1:]
+
+    def pack_into(self, buf: bytearray, offset: int, value: Any) -> int:
+        self.struct.pack_into(buf, offset, value)
+        return offset + self.fixed_size
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[Any, int]:
+        _check_available(data, offset, self.fixed_size)
+        return self.struct.unpack_from(data, offset)[0], offset + self.fixed_size
+
+
+class _BoolCodec:
+    """Single-byte boolean field."""
+
+    __slots__ = ()
+    fixed_size = 1
+    struct_code = "?"
+
+    def pack_into(self, buf: bytearray, offset: int, value: Any) -> int:
+        buf[offset] = 1 if value else 0
+        return offset + 1
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[bool, int]:
+        _check_available(data, offset, 1)
+        return bool(data[offset]), offset + 1
+
+
+class _StructRunCodec:
+    """Run of adjacent fixed-width scalar fields packed by one struct.Struct."""
+
+    __slots__ = ("fixed_size", "struct", "statics")
+
+    def __init__(self, fmt: str, statics: Tuple = ()):
+        self.struct = struct.Struct(fmt)
+        self.fixed_size = self.struct.size
+        # Per-field static value, or _NO_STATIC for fields read from instances
+        self.statics = statics or (_NO_STATIC,) * len(self.struct.format[1:])
+
+    def pack_into(self, buf: bytearray, offset: int, values: Tuple[Any, ...]) -> int:
+        self.struct.pack_into(buf, offset, *values)
+        return offset + self.fixed_size
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[Tuple[Any, ...], int]:
+        _check_available(data, offset, self.fixed_size)
+        return self.struct.unpack_from(data, offset), offset + self.fixed_size
+
+
+class _StrCodec:
+    """
+    UTF-8 string with a 4-byte length prefix.
+
+    str.encode() with no arguments is CPython's UTF-8 fast path; naming the
+    codec (or calling a codecs.lookup() encoder) is measurably slower.
+    """
+
+    __slots__ = ("byteorder", "length", "intern")
+    fixed_size = None
+
+    def __init__(self, byteorder: str, intern: bool = False):
+        self.byteorder = byteorder
+        self.length = _LENGTH_PREFIX[byteorder]
+        self.intern = intern
+
+    def size(self, value: str) -> int:
+        # ASCII strings encode one byte per character; skip the encode.
+        if value.isascii():
+            return 4 + len(value)
+        return 4 + len(value.encode())
+
+    def pack_into(self, buf: bytearray, offset: int, value: str) -> int:
+        value_bytes = value.encode()
+        end = offset + 4 + len(value_bytes)
+        self.length.pack_into(buf, offset, len(value_bytes))
+        buf[offset + 4 : end] = value_bytes
+        return end
+
+    def skip(self, data: Any, offset: int) -> int:
+        return offset + 4 + _read_length_prefix(data, offset, self.length)
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[str, int]:
+        end = offset + 4 + _read_length_prefix(data, offset, self.length)
+        value = str(data[offset + 4 : end], "utf-8")
+        if self.intern:
+            value = sys.intern(value)
+        return value, end
+
+
+class _BytesCodec:
+    """Raw bytes with a 4-byte length prefix."""
+
+    __slots__ = ("byteorder", "length")
+    fixed_size = None
+
+    def __init__(self, byteorder: str):
+        self.byteorder = byteorder
+        self.length = _LENGTH_PREFIX[byteorder]
+
+    def size(self, value: bytes) -> int:
+        return 4 + len(value)
+
+    def pack_into(self, buf: bytearray, offset: int, value: bytes) -> int:
+        end = offset + 4 + len(value)
+        self.length.pack_into(buf, offset, len(value))
+        buf[offset + 4 : end] = value
+        return end
+
+    def skip(self, data: Any, offset: int) -> int:
+        return offset + 4 + _read_length_prefix(data, offset, self.length)
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[bytes, int]:
+        end = offset + 4 + _read_length_prefix(data, offset, self.length)
+        return bytes(data[offset + 4 : end]), end
+
+
+class _EnumCodec:
+    """Fixed-width enum field delegating to a prebuilt EnumEncoder."""
+
+    __slots__ = ("fixed_size", "encoder", "byteorder", "struct")
+
+    def __init__(self, encoder: "EnumEncoder", byteorder: str):
+        self.fixed_size = encoder.size
+        self.encoder = encoder
+        self.byteorder = byteorder
+        self.struct = encoder.structs and encoder.structs[byteorder]
+
+    def pack_into(self, buf: bytearray, offset: int, value: Any) -> int:
+        end = offset + self.fixed_size
+        if self.struct:
+            self.struct.pack_into(buf, offset, value)
+        else:
+            buf[offset:end] = self.encoder.encode(value, self.byteorder)
+        return end
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[IntEnum, int]:
+        end = offset + self.fixed_size
+        if self.struct:
+            _check_available(data, offset, self.fixed_size)
+            return (
+                self.encoder.enum_class(self.struct.unpack_from(data, offset)[0]),
+                end,
+            )
+        value, _ = self.encoder.decode(data[offset:end], self.byteorder)
+        return value, end
+
+
+class _PartialCodec:
+    """Nested MessagePartial field encoded through the partial's own plan."""
+
+    __slots__ = ("partial_class",)
+    fixed_size = None
+
+    def __init__(self, partial_class: Type["MessagePartial"]):
+        self.partial_class = partial_class
+
+    def encode(self, value: "MessagePartial") -> bytes:
+        """Return the nested partial's bytes, encoding each of its strings once."""
+        if type(value) is not self.partial_class and not isinstance(
+            value, self.partial_class
+        ):
+            raise ValueError(
+                f"Expected {self.partial_class.__name__}, got {type(value).__name__}"
+            )
+        return value.serialize_bytes()
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple["MessagePartial", int]:
+        return self.partial_class._decode_from(data, offset)
+
+
+class _FixedArrayCodec:
+    """Array with a fixed element count ('numlist')."""
+
+    __slots__ = ("field_name", "count", "element", "fixed_size")
+
+    def __init__(self, field_name: str, count: int, element: Any):
+        self.field_name = field_name
+        self.count = count
+        self.element = element
+        self.fixed_size = (
+            count * element.fixed_size if element.fixed_size is not None else None
+        )
+
+    def _check(self, value: Any) -> None:
+        if not isinstance(value, list):
+            raise ValueError(f"{self.field_name} must be a list")
+        if len(value) != self.count:
+            raise ValueError(f"{self.field_name} must have {self.count} elements")
+
+    def size(self, value: List[Any]) -> int:
+        self._check(value)
+        element_size = self.element.size
+        return sum(element_size(item) for item in value)
+
+    def encode(self, value: List[Any]) -> bytes:
+        """Return the array's bytes; used for arrays of nested partials."""
+        self._check(value)
+        return b"".join(map(self.element.encode, value))
+
+    def pack_into(self, buf: bytearray, offset: int, value: List[Any]) -> int:
+        self._check(value)
+        pack_into = self.element.pack_into
+        for item in value:
+            offset = pack_into(buf, offset, item)
+        return offset
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[List[Any], int]:
+        unpack_from = self.element.unpack_from
+        values = []
+        for _ in range(self.count):
+            value, offset = unpack_from(data, offset)
+            values.append(value)
+        return values, offset
+
+
+class _NumericArrayCodec:
+    """
+    Numeric array converted with array.array instead of per-element packing.
+
+    Used for 'numlist' (fixed count) and 'dynamic_array' (4-byte count
+    prefix) fields of ints, floats and doubles.
+    """
+
+    __slots__ = (
+        "field_name",
+        "typecode",
+        "itemsize",
+        "count",
+        "byteorder",
+        "length",
+        "swap",
+    )
+
+    def __init__(
+        self, field_name: str, typecode: str, count: Optional[int], byteorder: str
+    ):
+        self.field_name = field_name
+        self.typecode = typecode
+        self.itemsize = array(typecode).itemsize
+        self.count = count
+        self.byteorder = byteorder
+        self.length = _LENGTH_PREFIX[byteorder]
+        self.swap = byteorder != sys.byteorder
+
+    @property
+    def fixed_size(self) -> Optional[int]:
+        return None if self.count is None else self.count * self.itemsize
+
+    def _check(self, value: Any) -> None:
+        if not isinstance(value, list):
+            raise ValueError(f"{self.field_name} must be a list")
+        if self.count is not None and len(value) != self.count:
+            raise ValueError(f"{self.field_name} must have {self.count} elements")
+
+    def size(self, value: List[Any]) -> int:
+        self._check(value)
+        prefix = 4 if self.count is None else 0
+        return prefix + len(value) * self.itemsize
+
+    def pack_into(self, buf: bytearray, offset: int, value: List[Any]) -> int:
+        self._check(value)
+        if self.count is None:
+            self.length.pack_into(buf, offset, len(value))
+            offset += 4
+        values = array(self.typecode, value)
+        if self.swap:
+            values.byteswap()
+        end = offset + len(value) * self.itemsize
+        buf[offset:end] = values
+        return end
+
+    def skip(self, data: Any, offset: int) -> int:
+        if offset + 4 > len(data):
+            raise ValueError("Insufficient data for array length")
+        size = self.length.unpack_from(data, offset)[0] * self.itemsize
+        _check_available(data, offset + 4, size)
+        return offset + 4 + size
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[List[Any], int]:
+        count = self.count
+        if count is None:
+            if offset + 4 > len(data):
+                raise ValueError("Insufficient data for array length")
+            count = self.length.unpack_from(data, offset)[0]
+            offset += 4
+        end = offset + count * self.itemsize
+        _check_available(data, offset, count * self.itemsize)
+        values = array(self.typecode)
+        values.frombytes(data[offset:end])
+        if self.swap:
+            values.byteswap()
+        return values.tolist(), end
+
+
+class _StructArrayCodec:
+    """
+    Array of fixed-width scalars with no matching array.array typecode (bool).
+
+    The whole array is packed with one struct call and decoded with
+    Struct.iter_unpack, so no per-element Python call is made.
+    """
+
+    __slots__ = ("field_name", "prefix", "code", "item", "count", "packer", "length")
+
+    def __init__(
+        self, field_name: str, struct_code: str, count: Optional[int], byteorder: str
+    ):
+        self.field_name = field_name
+        self.prefix = "<" if byteorder == "little" else ">"
+        self.code = struct_code
+        self.item = struct.Struct(self.prefix + struct_code)
+        self.count = count
+        self.packer = (
+            None if count is None else _counted_struct(self.prefix, count, struct_code)
+        )
+        self.length = _LENGTH_PREFIX[byteorder]
+
+    @property
+    def fixed_size(self) -> Optional[int]:
+        return None if self.packer is None else self.packer.size
+
+    def _check(self, value: Any) -> None:
+        if not isinstance(value, list):
+            raise ValueError(f"{self.field_name} must be a list")
+        if self.count is not None and len(value) != self.count:
+            raise ValueError(f"{self.field_name} must have {self.count} elements")
+
+    def size(self, value: List[Any]) -> int:
+        self._check(value)
+        prefix = 4 if self.count is None else 0
+        return prefix + len(value) * self.item.size
+
+    def pack_into(self, buf: bytearray, offset: int, value: List[Any]) -> int:
+        self._check(value)
+        if self.packer is not None:
+            self.packer.pack_into(buf, offset, *value)
+            return offset + self.packer.size
+        self.length.pack_into(buf, offset, len(value))
+        offset += 4
+        _counted_struct(self.prefix, len(value), self.code).pack_into(
+            buf, offset, *value
+        )
+        return offset + len(value) * self.item.size
+
+    def skip(self, data: Any, offset: int) -> int:
+        if offset + 4 > len(data):
+            raise ValueError("Insufficient data for array length")
+        size = self.length.unpack_from(data, offset)[0] * self.item.size
+        _check_available(data, offset + 4, size)
+        return offset + 4 + size
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[List[Any], int]:
+        count = self.count
+        if count is None:
+            if offset + 4 > len(data):
+                raise ValueError("Insufficient data for array length")
+            count = self.length.unpack_from(data, offset)[0]
+            offset += 4
+        size = count * self.item.size
+        _check_available(data, offset, size)
+        end = offset + size
+        return [value for (value,) in self.item.iter_unpack(data[offset:end])], end
+
+
+class _DynamicArrayCodec:
+    """Array with a 4-byte element count prefix ('dynamic_array')."""
+
+    __slots__ = ("field_name", "element", "byteorder", "length")
+    fixed_size = None
+
+    def __init__(self, field_name: str, element: Any, byteorder: str):
+        self.field_name = field_name
+        self.element = element
+        self.byteorder = byteorder
+        self.length = _LENGTH_PREFIX[byteorder]
+
+    def size(self, value: List[Any]) -> int:
+        if not isinstance(value, list):
+            raise ValueError(f"{self.field_name} must be a list")
+        if self.element.fixed_size is not None:
+            return 4 + len(value) * self.element.fixed_size
+        element_size = self.element.size
+        return 4 + sum(element_size(item) for item in value)
+
+    def encode(self, value: List[Any]) -> bytes:
+        """Return the prefixed array's bytes; used for arrays of nested partials."""
+        if not isinstance(value, list):
+            raise ValueError(f"{self.field_name} must be a list")
+        encode = self.element.encode
+        return self.length.pack(len(value)) + b"".join(map(encode, value))
+
+    def pack_into(self, buf: bytearray, offset: int, value: List[Any]) -> int:
+        self.length.pack_into(buf, offset, len(value))
+        offset += 4
+        pack_into = self.element.pack_into
+        for item in value:
+            offset = pack_into(buf, offset, item)
+        return offset
+
+    def unpack_from(self, data: Any, offset: int) -> Tuple[List[Any], int]:
+        if offset + 4 > len(data):
+            raise ValueError("Insufficient data for array length")
+        count = self.length.unpack_from(data, offset)[0]
+        offset += 4
+        unpack_from = self.element.unpack_from
+        values = []
+        for _ in range(count):
+            value, offset = unpack_from(data, offset)
+            values.append(value)
+        return values, offset
+
+
+def _int_codec(byte_size: int, byteorder: str, signed: bool) -> Any:
+    """Return the fastest codec for a fixed-width integer."""
+    code = _INT_STRUCT_CODES.get((byte_size, signed))
+    if code is None:
+        return _IntCodec(byte_size, byteorder, signed)
+    return _StructCodec(("<" if byteorder == "little" else ">") + code)
+
+
+def _compile_scalar_codec(field_type: Any, byteorder: str) -> Optional[Any]:
+    """Return the codec for a built-in type string, or None if unsupported."""
+    if not isinstance(field_type, str):
+        return None
+    prefix = "<" if byteorder == "little" else ">"
+    try:
+        if field_type.startswith("int("):
+            return _int_codec(int(field_type[4:-1]) // 8, byteorder, True)
+        if field_type.startswith("uint("):
+            return _int_codec(int(field_type[5:-1]) // 8, byteorder, False)
+    except ValueError:
+        return None
+    if field_type == "int":
+        return _int_codec(8, byteorder, True)
+    if field_type == "float":
+        return _StructCodec(prefix + "f")
+    if field_type == "double":
+        return _StructCodec(prefix + "d")
+    if field_type == "bool":
+        return _BoolCodec()
+    if field_type == "str":
+        return _StrCodec(byteorder)
+    if field_type == "bytes":
+        return _BytesCodec(byteorder)
+    return None
+
+
+# Spec keys that route each array element through user code.
+_ELEMENT_HOOK_KEYS = ("serializer", "encoder", "encode", "decode")
+
+
+@lru_cache(maxsize=512)
+def _counted_struct(prefix: str, count: int, code: str) -> struct.Struct:
+    """Return the shared Struct for count items of one struct code."""
+    return struct.Struct(f"{prefix}{count}{code}")
+
+
+@lru_cache(maxsize=512)
+def _array_struct(
+    field_type: str, byteorder: str, count: int
+) -> Optional[struct.Struct]:
+    """Return a Struct packing count numbers of field_type at once, or None."""
+    scalar = _scalar_struct(field_type, byteorder)
+    if scalar is None or count < 0:
+        return None
+    return _counted_struct(scalar.format[0], count, scalar.format[1:])
+
+
+def _items_struct(
+    field_spec: Dict[str, Any], byteorder: str, count: int
+) -> Optional[struct.Struct]:
+    """
+    Return a Struct for a whole array of plain numbers, or None.
+
+    Lets the generic path pack or unpack a numlist/dynamic_array of ints,
+    floats or doubles in one call instead of one _serialize_value per item.
+    """
+    field_type = field_spec.get("type")
+    if not isinstance(field_type, str) or any(
+        key in field_spec for key in _ELEMENT_HOOK_KEYS
+    ):
+        return None
+    return _array_struct(field_type, byteorder, count)
+
+
+def _unpack_items(items: struct.Struct, data: Any, offset: int) -> Tuple[List, int]:
+    """Unpack an array with its items Struct; returns (values, new offset)."""
+    _check_available(data, offset, items.size)
+    return list(items.unpack_from(data, offset)), offset + items.size
+
+
+@lru_cache(maxsize=None)
+def _scalar_struct(field_type: str, byteorder: str) -> Optional[struct.Struct]:
+    """
+    Return the shared Struct for a fixed-width number type string, or None.
+
+    The generic per-field path packs and unpacks ints, floats and doubles
+    with these instead of int.to_bytes or struct.pack with a format string.
+    Odd integer widths, bool, str and bytes return None.
+    """
+    codec = _compile_scalar_codec(field_type, byteorder)
+    return codec.struct if isinstance(codec, _StructCodec) else None
+
+
+@lru_cache(maxsize=None)
+def _value_packer(field_type: str, byteorder: str) -> Optional[Callable[[Any], bytes]]:
+    """
+    Return the function packing one value of a built-in type string, or None.
+
+    Resolved once per (type, byte order), so the generic per-field path does
+    a cached lookup instead of walking a chain of type-string comparisons.
+    Enums, custom types and malformed type strings return None.
+    """
+    scalar = _scalar_struct(field_type, byteorder)
+    if scalar is not None:
+        return scalar.pack
+    length = _LENGTH_PREFIX[byteorder].pack
+
+    if field_type == "str":
+
+        def pack(value: str) -> bytes:
+            value_bytes = value.encode()
+            return length(len(value_bytes)) + value_bytes
+
+        return pack
+    if field_type == "bytes":
+        return lambda value: length(len(value)) + value
+    if field_type == "bool":
+        return lambda value: b"\x01" if value else b"\x00"
+    # Sized integers of widths struct has no code for
+    for prefix, signed in (("int(", True), ("uint(", False)):
+        if field_type.startswith(prefix):
+            try:
+                byte_size = int(field_type[len(prefix) : -1]) // 8
+            except ValueError:
+                return None
+            return lambda value: value.to_bytes(byte_size, byteorder, signed=signed)
+    return None
+
+
+def _compile_field_codec(field_spec: Dict[str, Any], byteorder: str) -> Optional[Any]:
+    """Return the codec for a single (non-array) field, or None if unsupported."""
+    field_type = field_spec.get("type")
+    size = field_spec.get("size", 1)
+    if "size" in field_spec and field_type != "enum":
+        return None
+
+    if field_type == "enum":
+        enum_class = field_spec.get("enum")
+        if enum_class is None or not isinstance(size, int):
+            return None
+        return _EnumCodec(EnumEncoder(enum_class, size), byteorder)
+
+    if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
+        # Only partials that are themselves compiled (and keep the default
+        # byte layout) can be written in place
+        if field_type._field_plan is None or field_type._custom_serialization:
+            return None
+        return _PartialCodec(field_type)
+
+    if "intern" in field_spec:
+        if field_type != "str":
+            return None
+        return _StrCodec(byteorder, bool(field_spec["intern"]))
+
+    return _compile_scalar_codec(field_type, byteorder)
+
+
+def _compile_field_plan(
+    fields: Dict[str, Dict[str, Any]], byteorder: str, honor_static: bool
+) -> Optional[Tuple[Tuple[str, Any, Any], ...]]:
+    """
+    Compile a fields schema into a tuple of (name, codec, static) entries.
+
+    Returns None when any field needs features the plan does not cover, in
+    which case the class keeps using the generic per-field path.
+    """
+    plan = []
+    for field_name, field_spec in fields.items():
+        if not field_spec.keys() <= _PLAN_KEYS:
+            return None
+        codec = _compile_field_codec(field_spec, byteorder)
+        if codec is None:
+            return None
+
+        struct_code = getattr(codec, "struct_code", None)
+        typecode = _ARRAY_TYPECODES.get(struct_code)
+        if "numlist" in field_spec:
+            count = field_spec["numlist"]
+            if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+                return None
+            if typecode is not None:
+                codec = _NumericArrayCodec(field_name, typecode, count, byteorder)
+            elif struct_code is not None:
+                codec = _StructArrayCodec(field_name, struct_code, count, byteorder)
+            else:
+                codec = _FixedArrayCodec(field_name, count, codec)
+        elif field_spec.get("dynamic_array"):
+            if typecode is not None:
+                codec = _NumericArrayCodec(field_name, typecode, None, byteorder)
+            elif struct_code is not None:
+                codec = _StructArrayCodec(field_name, struct_code, None, byteorder)
+            else:
+                codec = _DynamicArrayCodec(field_name, codec, byteorder)
+
+        static = (
+            field_spec["static"]
+            if honor_static and "static" in field_spec
+            else _NO_STATIC
+        )
+        plan.append((field_name, codec, static))
+    return tuple(plan)
+
+
+def _field_getter(cls: type, field_name: str, static: Any) -> Callable[[Any], Any]:
+    """
+    Return a callable reading a field's encode value from an instance.
+
+    Static values become constant getters. Fields stored in ``__slots__`` use
+    the slot descriptor directly, skipping the attribute name lookup; other
+    fields fall back to a C-level attrgetter.
+    """
+    if static is not _NO_STATIC:
+        return lambda _instance: static
+    for klass in cls.__mro__:
+        if field_name in klass.__dict__:
+            attribute = klass.__dict__[field_name]
+            if isinstance(attribute, MemberDescriptorType):
+                return attribute.__get__
+            break
+    return attrgetter(field_name)
+
+
+def _build_steps(cls: type, plan: Tuple) -> Tuple[Tuple, Tuple]:
+    """
+    Turn a field plan into encode and decode steps.
+
+    Adjacent fixed-width scalar fields (ints of 1/2/4/8 bytes, float, double,
+    bool) are merged into a single struct.Struct run, so a run of N fields is
+    packed or unpacked with one C call instead of N. Static fields join runs
+    too; their constant is packed and checked on decode.
+
+    Returns:
+        Tuple of (encode steps as (getter, codec),
+                  decode steps as (field name(s), codec, static))
+    """
+    prefix = "<" if cls.encoding.value == "little" else ">"
+    encode_steps = []
+    decode_steps = []
+    run = []
+
+    def flush_run():
+        if len(run) == 1:
+            field_name, codec, static = run[0]
+            encode_steps.append((_field_getter(cls, field_name, static), codec))
+            decode_steps.append((field_name, codec, static))
+        elif run:
+            names = tuple(field_name for field_name, _, _ in run)
+            statics = tuple(static for _, _, static in run)
+            codec = _StructRunCodec(
+                prefix + "".join(c.struct_code for _, c, _ in run), statics
+            )
+            if all(static is _NO_STATIC for static in statics):
+                getter = attrgetter(*names)
+            else:
+                getters = tuple(
+                    _field_getter(cls, field_name, static)
+                    for field_name, _, static in run
+                )
+                getter = lambda instance: tuple(get(instance) for get in getters)
+            encode_steps.append((getter, codec))
+            decode_steps.append((names, codec, _RUN))
+        run.clear()
+
+    for field_name, codec, static in plan:
+        if getattr(codec, "struct_code", None):
+            run.append((field_name, codec, static))
+            continue
+        flush_run()
+        encode_steps.append((_field_getter(cls, field_name, static), codec))
+        decode_steps.append((field_name, codec, static))
+    flush_run()
+    return tuple(encode_steps), tuple(decode_steps)
+
+
+def _is_identifier(name: str) -> bool:
+    """True if name can be used as an attribute in generated source."""
+    return name.isidentifier() and not iskeyword(name)
+
+
+def _static_check_lines(value: str, constant: str, name: str) -> List[str]:
+    """Source lines checking a decoded static field against its constant."""
+    return [
+        f"    if {value} != {constant}:",
+        "        raise ValueError(",
+        f"            f\"Field '{{{name}}}': expected static value "
+        f'{{{constant}}}, got {{{value}}}"',
+        "        )",
+        f"    {value} = {constant}",
+    ]
+
+
+def _compile_plan_functions(cls: type) -> Tuple[Callable, Callable]:
+    """
+    Generate serialize and decode functions specialized to a class's plan.
+
+    The generated source reads each field once, encodes each string once,
+    sizes the output with a single expression and writes every step at a
+    constant offset (or a running one after the first variable-length
+    field), so no step tuples, getters or codec dispatch run per call.
+
+    Returns:
+        Tuple of (pack(self) -> bytes, decode(cls, data, offset))
+    """
+    namespace = {}
+    fetch_lines = []
+    size_terms = [str(cls._fixed_size)]
+    pack_lines = []
+    decode_lines = []
+    kwargs = []
+    base, const = None, 0
+
+    def position() -> str:
+        if base is None:
+            return str(const)
+        return base if const == 0 else f"{base} + {const}"
+
+    # The fixed-width fields before the first variable-length one are
+    # bounds-checked together, then read at constant offsets without
+    # per-field checks.
+    prefix_size = 0
+    for _, codec, _ in cls._decode_steps:
+        if codec.fixed_size is None:
+            break
+        prefix_size += codec.fixed_size
+    if prefix_size:
+        namespace["_check_available"] = _check_available
+        decode_lines.append(f"    _check_available(data, offset, {prefix_size})")
+    in_prefix, read_at = bool(prefix_size), 0
+
+    steps = zip(cls._encode_steps, cls._decode_steps)
+    for index, ((getter, codec), (names, _, static)) in enumerate(steps):
+        value = f"v{index}"
+        if static is _RUN:
+            if all(_is_identifier(name) for name in names):
+                values = [f"{value}_{j}" for j in range(len(names))]
+                for j, (v, name) in enumerate(zip(values, names)):
+                    if codec.statics[j] is _NO_STATIC:
+                        fetch_lines.append(f"    {v} = self.{name}")
+                    else:
+                        namespace[f"_c{index}_{j}"] = codec.statics[j]
+                        fetch_lines.append(f"    {v} = _c{index}_{j}")
+                args = ", ".join(values)
+            else:
+                namespace[f"_g{index}"] = getter
+                fetch_lines.append(f"    {value} = _g{index}(self)")
+                values = None
+                args = f"*{value}"
+        elif static is not _NO_STATIC:
+            namespace[f"_c{index}"] = static
+            fetch_lines.append(f"    {value} = _c{index}")
+        elif _is_identifier(names):
+            fetch_lines.append(f"    {value} = self.{names}")
+        else:
+            namespace[f"_g{index}"] = getter
+            fetch_lines.append(f"    {value} = _g{index}(self)")
+
+        # encode
+        if static is _RUN:
+            namespace[f"_p{index}"] = codec.struct.pack_into
+            pack_lines.append(f"    _p{index}(buf, {position()}, {args})")
+            const += codec.fixed_size
+        elif isinstance(codec, _StrCodec):
+            namespace[f"_l{index}"] = codec.length.pack_into
+            fetch_lines += [
+                f"    e{index} = {value}.encode()",
+                f"    n{index} = len(e{index})",
+            ]
+            size_terms.append(f"4 + n{index}")
+            pack_lines += [
+                f"    _l{index}(buf, {position()}, n{index})",
+                f"    off = {position()} + 4",
+                f"    buf[off : off + n{index}] = e{index}",
+                f"    off += n{index}",
+            ]
+            base, const = "off", 0
+        elif isinstance(codec, _PartialCodec) or isinstance(
+            getattr(codec, "element", None), _PartialCodec
+        ):
+            # Sizing a nested partial (or an array of them) would encode its
+            # fields a second time, so the bytes are produced once and copied in.
+            namespace[f"_b{index}"] = codec.encode
+            fetch_lines += [
+                f"    e{index} = _b{index}({value})",
+                f"    n{index} = len(e{index})",
+            ]
+            size_terms.append(f"n{index}")
+            pack_lines += [
+                f"    off = {position()} + n{index}",
+                f"    buf[off - n{index} : off] = e{index}",
+            ]
+            base, const = "off", 0
+        elif codec.fixed_size is not None:
+            if isinstance(codec, _StructCodec):
+                namespace[f"_p{index}"] = codec.struct.pack_into
+            else:
+                namespace[f"_p{index}"] = codec.pack_into
+            pack_lines.append(f"    _p{index}(buf, {position()}, {value})")
+            const += codec.fixed_size
+        else:
+            namespace[f"_s{index}"] = codec.size
+            namespace[f"_p{index}"] = codec.pack_into
+            size_terms.append(f"_s{index}({value})")
+            pack_lines.append(f"    off = _p{index}(buf, {position()}, {value})")
+            base, const = "off", 0
+
+        # decode
+        if in_prefix and codec.fixed_size is None:
+            decode_lines.append(f"    offset += {read_at}")
+            in_prefix = False
+        at = f"offset + {read_at}" if read_at else "offset"
+        if in_prefix and isinstance(codec, (_StructCodec, _StructRunCodec)):
+            namespace[f"_u{index}"] = codec.struct.unpack_from
+            read = f"_u{index}(data, {at})"
+        else:
+            namespace[f"_u{index}"] = codec.unpack_from
+            read = None
+        if static is _RUN:
+            if values is None:
+                values = [f"{value}_{j}" for j in range(len(names))]
+            if read is not None:
+                decode_lines.append(f"    {', '.join(values)}, = {read}")
+            else:
+                decode_lines.append(
+                    f"    ({', '.join(values)},), offset = _u{index}(data, offset)"
+                )
+            for j, run_static in enumerate(codec.statics):
+                if run_static is not _NO_STATIC:
+                    namespace[f"_c{index}_{j}"] = run_static
+                    namespace[f"_n{index}_{j}"] = names[j]
+                    decode_lines += _static_check_lines(
+                        values[j], f"_c{index}_{j}", f"_n{index}_{j}"
+                    )
+            kwargs += [f"{name!r}: {v}" for name, v in zip(names, values)]
+            if in_prefix:
+                read_at += codec.fixed_size
+            continue
+        if read is not None:
+            decode_lines.append(f"    {value}, = {read}")
+        elif in_prefix:
+            decode_lines.append(f"    {value}, _ = _u{index}(data, {at})")
+        else:
+            decode_lines.append(f"    {value}, offset = _u{index}(data, offset)")
+        if in_prefix:
+            read_at += codec.fixed_size
+        if static is not _NO_STATIC:
+            namespace[f"_n{index}"] = names
+            decode_lines += _static_check_lines(value, f"_c{index}", f"_n{index}")
+        kwargs.append(f"{names!r}: {value}")
+
+    if in_prefix:
+        decode_lines.append(f"    offset += {read_at}")
+    if kwargs:
+        pack_body = (
+            fetch_lines
+            + [f"    buf = bytearray({' + '.join(size_terms)})"]
+            + pack_lines
+            + ["    return bytes(buf)"]
+        )
+        result = f"cls(**{{{', '.join(kwargs)}}})"
+    else:
+        # Field-less classes: a constant result, no buffer or keywords.
+        pack_body = ['    return b""']
+        result = "cls()"
+    source = "\n".join(
+        ["def pack(self):"]
+        + pack_body
+        + ["", "def decode(cls, data, offset):"]
+        + decode_lines
+        + [f"    return {result}, offset", ""]
+    )
+    exec(compile(source, f"<plan {cls.__name__}>", "exec"), namespace)
+    return namespace["pack"], namespace["decode"]
+
+
+def _install_field_plan(cls: type, plan: Optional[Tuple]) -> None:
+    """
+    Store a compiled plan, its encode/decode steps and size breakdown.
+
+    Classes with a plan also get generated functions: ``_pack_plan`` (the
+    body of serialize_bytes) and the ``_decode_from`` classmethod.
+    """
+    cls._field_plan = plan
+    if plan is None:
+        cls._fixed_size = None
+        cls._encode_steps = None
+        cls._decode_steps = None
+        cls._pack_plan = None
+        cls._view_fields = {}
+        return
+    cls._fixed_size = sum(
+        codec.fixed_size for _, codec, _ in plan if codec.fixed_size is not None
+    )
+    cls._encode_steps, cls._decode_steps = _build_steps(cls, plan)
+    pack, decode = _compile_plan_functions(cls)
+    cls._pack_plan = pack
+    cls._decode_from = classmethod(decode)
+    # field name -> (decode step index, position within a run or None)
+    cls._view_fields = {}
+    for index, (names, _, static) in enumerate(cls._decode_steps):
+        if static is _RUN:
+            for member, name in enumerate(names):
+                cls._view_fields[name] = (index, member)
+        else:
+            cls._view_fields[names] = (index, None)
+
+
+def _deserialize_view(cls: type, data: bytes, base_init: Callable) -> Tuple[Any, int]:
+    """
+    Locate each field of a compiled class in data without decoding it.
+
+    The instance keeps (memoryview, step offsets) and decodes a field the
+    first time it is read (see _load_view_field). Str, bytes and numeric
+    arrays are skipped by their length prefix; other variable-length fields
+    are decoded to find where they end. Input other than bytes (bytearray,
+    memoryview, ...) is copied once its end is known, so later changes to
+    the caller's buffer never show up in fields read afterwards and the
+    caller can still resize it. Classes without a compiled plan, with custom
+    byte serialization or with their own __init__ are decoded eagerly by
+    deserialize_bytes.
+    """
+    if (
+        cls._field_plan is None
+        or cls._custom_serialization
+        or cls.__init__ is not base_init
+    ):
+        return cls.deserialize_bytes(data)
+    data = memoryview(data)
+    offsets = []
+    offset = 0
+    for _, codec, _ in cls._decode_steps:
+        offsets.append(offset)
+        if codec.fixed_size is not None:
+            _check_available(data, offset, codec.fixed_size)
+            offset += codec.fixed_size
+        elif hasattr(codec, "skip"):
+            offset = codec.skip(data, offset)
+        else:
+            offset = codec.unpack_from(data, offset)[1]
+    if type(data.obj) is not bytes:
+        source = data
+        data = memoryview(bytes(source[:offset]))
+        source.release()
+    instance = cls.__new__(cls)
+    instance.__dict__["_view"] = (data, tuple(offsets))
+    # Static fields read through to class attributes, so check them now;
+    # the instance stores nothing for them
+    for (names, codec, static), step_offset in zip(cls._decode_steps, offsets):
+        if static is _RUN:
+            if any(run_static is not _NO_STATIC for run_static in codec.statics):
+                values, _ = codec.unpack_from(data, step_offset)
+                for run_name, run_value, run_static in zip(
+                    names, values, codec.statics
+                ):
+                    if run_static is not _NO_STATIC:
+                        _check_static(run_name, run_value, run_static)
+        elif static is not _NO_STATIC:
+            _check_static(names, codec.unpack_from(data, step_offset)[0], static)
+    return instance, offset
+
+
+def _load_view_fields(instance: Any) -> None:
+    """Decode every field of a deserialize_view instance and drop its view."""
+    if "_view" not in instance.__dict__:
+        return
+    for name in type(instance)._view_fields:
+        getattr(instance, name)
+    del instance.__dict__["_view"]
+
+
+def _check_static(name: str, value: Any, static: Any) -> Any:
+    """Return a decoded static field's declared value, or raise if it differs."""
+    if value != static:
+        raise ValueError(f"Field '{name}': expected static value {static}, got {value}")
+    return static
+
+
+def _load_view_field(instance: Any, name: str) -> Any:
+    """
+    Decode a field of a deserialize_view instance on first access.
+
+    The decoded value is stored on the instance, so later reads are plain
+    attribute lookups. Raises AttributeError for anything else.
+    """
+    view = instance.__dict__.get("_view")
+    entry = type(instance)._view_fields.get(name) if view is not None else None
+    if entry is None:
+        raise AttributeError(
+            f"'{type(instance).__name__}' object has no attribute '{name}'"
+        )
+    data, offsets = view
+    index, member = entry
+    names, codec, static = type(instance)._decode_steps[index]
+    value, _ = codec.unpack_from(data, offsets[index])
+    if static is _RUN:
+        cls = type(instance)
+        for run_name, run_value, run_static in zip(names, value, codec.statics):
+            # Statics were checked by deserialize_view; ones the class
+            # provides as attributes need nothing stored
+            if run_static is _NO_STATIC:
+                object.__setattr__(instance, run_name, run_value)
+            elif getattr(cls, run_name, _NO_STATIC) is not run_static:
+                object.__setattr__(instance, run_name, run_static)
+        return getattr(instance, name)
+    if static is not _NO_STATIC:
+        value = _check_static(name, value, static)
+    object.__setattr__(instance, name, value)
+    return value
+
+
+# Spec keys the generated bitwise pack/unpack functions understand.
+_BIT_PLAN_KEYS = frozenset({"type", "bits", "signed", "numlist", "static"})
+
+
+def _compile_bit_layout(
+    fields: Dict[str, Dict[str, Any]], honor_static: bool = True
+) -> Optional[Tuple]:
+    """
+    Describe an all-'bit' schema as (name, bits, signed, count, static) entries.
+
+    Returns None for schemas the generated functions do not cover (byte-aligned
+    fields, non-identifier names, static arrays, unknown spec keys, ...).
+    With honor_static False (MessagePartial), 'static' keys are ignored.
+    """
+    layout = []
+    for field_name, field_spec in fields.items():
+        if field_spec.get("type") != "bit" or not field_spec.keys() <= _BIT_PLAN_KEYS:
+            return None
+        if not field_name.isidentifier() or iskeyword(field_name):
+            return None
+        bits = field_spec.get("bits", 1)
+        if not isinstance(bits, int) or isinstance(bits, bool) or bits < 1:
+            return None
+        count = field_spec.get("numlist")
+        if count is not None and (
+            not isinstance(count, int)
+            or isinstance(count, bool)
+            or count < 0
+            or (honor_static and "static" in field_spec)
+        ):
+            return None
+        static = field_spec.get("static", _NO_STATIC) if honor_static else _NO_STATIC
+        signed = bool(field_spec.get("signed", False))
+        layout.append((field_name, bits, signed, count, static))
+    return tuple(layout) if layout else None
+
+
+# Big-endian unsigned Structs for bit layouts that fill a machine word.
+_REGISTER_STRUCTS = {
+    size: struct.Struct(">" + code)
+    for size, code in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+}
+
+
+def _compile_bit_functions(
+    class_name: str, layout: Tuple
+) -> Tuple[Callable[[Any], bytes], Callable[[Any], Tuple[Dict[str, Any], int]]]:
+    """
+    Generate pack(instance) and unpack(data) functions for a bit layout.
+
+    Bit widths and offsets are fixed at class creation, so the whole message
+    is packed into one int and written with a single to_bytes call (and read
+    back with one from_bytes); no bit-packing context or per-field dispatch
+    runs at call time. The output matches BitPackingContext: fields are
+    written MSB-first and the last byte is zero-padded.
+
+    Returns:
+        Tuple of (pack, unpack); unpack returns (field values dict, bytes used)
+    """
+    total_bits = sum(
+        bits * (1 if count is None else count) for _, bits, _, count, _ in layout
+    )
+    total_bytes = (total_bits + 7) // 8
+    namespace = {}
+    pack_lines = ["def pack(self):", "    acc = 0"]
+    unpack_lines = [
+        "def unpack(data):",
+        f"    if len(data) < {total_bytes}:",
+        '        raise ValueError("Insufficient data for bit unpacking")',
+    ]
+    # Register-sized messages are read with one Struct call instead of
+    # slicing the input for int.from_bytes.
+    register = _REGISTER_STRUCTS.get(total_bytes)
+    if register is not None:
+        namespace["_register"] = register
+        unpack_lines.append("    (acc,) = _register.unpack_from(data)")
+    else:
+        unpack_lines.append(f'    acc = int.from_bytes(data[:{total_bytes}], "big")')
+    values = []
+    shift = total_bytes * 8
+    for index, (field_name, bits, signed, count, static) in enumerate(layout):
+        name = f"_n{index}"
+        namespace[name] = field_name
+        mask = (1 << bits) - 1
+        if signed:
+            low, high = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+        else:
+            low, high = 0, mask
+        sign_fix = f" - {1 << bits} if v & {1 << (bits - 1)} else v" if signed else ""
+
+        # pack
+        if count is not None:
+            pack_lines += [
+                f"    items = self.{field_name}",
+                "    if not isinstance(items, list):",
+                f'        raise ValueError(f"{{{name}}} must be a list")',
+                f"    if len(items) != {count}:",
+                f'        raise ValueError(f"{{{name}}} must have {count} elements")',
+                "    for v in items:",
+                f"        if v < {low} or v > {high}:",
+                "            raise ValueError(",
+                f'                f"{{{name}}}: value {{v}} out of range for {bits}-bit field"',
+                "            )",
+                f"        acc = (acc << {bits}) | (v & {mask})",
+            ]
+        elif isinstance(static, int) and low <= static <= high:
+            # In-range statics are folded into the shift chain as constants
+            namespace[f"_s{index}"] = static
+            pack_lines.append(f"    acc = (acc << {bits}) | {static & mask}")
+        else:
+            if static is _NO_STATIC:
+                pack_lines.append(f"    v = self.{field_name}")
+            else:
+                namespace[f"_s{index}"] = static
+                pack_lines.append(f"    v = _s{index}")
+            kind = "signed" if signed else "unsigned"
+            pack_lines += [
+                f"    if v < {low} or v > {high}:",
+                "        raise ValueError(",
+                f'            f"{{{name}}}: value {{v}} out of range for '
+                f'{bits}-bit {kind} field [{low}, {high}]"',
+                "        )",
+                f"    acc = (acc << {bits}) | (v & {mask})",
+            ]
+
+        # unpack
+        value = f"v{index}"
+        if count is not None:
+            first = shift - bits
+            shift -= bits * count
+            extract = f"acc >> s & {mask} for s in range({first}, {shift - 1}, -{bits})"
+            if signed:
+                unpack_lines.append(f"    {value} = [v{sign_fix} for v in ({extract})]")
+            else:
+                unpack_lines.append(f"    {value} = [{extract}]")
+        else:
+            shift -= bits
+            unpack_lines.append(f"    v = acc >> {shift} & {mask}")
+            if signed:
+                unpack_lines.append(f"    v = v{sign_fix}")
+            if static is not _NO_STATIC:
+                unpack_lines += [
+                    f"    if v != _s{index}:",
+                    "        raise ValueError(",
+                    f"            f\"Field '{{{name}}}': expected static value "
+                    f'{{_s{index}}}, got {{v}}"',
+                    "        )",
+                    f"    {value} = _s{index}",
+                ]
+            else:
+                unpack_lines.append(f"    {value} = v")
+        values.append(f"{name}: {value}")
+
+    pad = total_bytes * 8 - total_bits
+    pack_lines.append(f'    return (acc << {pad}).to_bytes({total_bytes}, "big")')
+    unpack_lines.append(f"    return {{{', '.join(values)}}}, {total_bytes}")
+    source = "\n".join(pack_lines + unpack_lines) + "\n"
+    exec(compile(source, f"<bitwise {class_name}>", "exec"), namespace)
+    return namespace["pack"], namespace["unpack"]
+
+
+def _enum_dict(value: IntEnum) -> Dict[str, Any]:
+    """Dictionary form of an enum value used by to_dict."""
+    return {"enum": value.__class__.__name__, "value": value.value}
+
+
+def _bytes_from_dict_value(value: Any, for_json: bool) -> Any:
+    """
+    Convert a bytes field from its dict form.
+
+    A list of ints is always converted; a str is only base64-decoded for
+    JSON input (for_json), where to_dict(for_json=True) wrote it as base64.
+    """
+    if isinstance(value, list):
+        return bytes(value)
+    if for_json and isinstance(value, str):
+        return b64decode(value, validate=True)
+    return value
+
+
+def _is_partial_type(field_type: Any) -> bool:
+    """Return True if a field's declared type is a MessagePartial subclass."""
+    return isinstance(field_type, type) and issubclass(field_type, MessagePartial)
+
+
+def _partial_from_dict(
+    partial_class: Type["MessagePartial"],
+) -> Callable[[Any, bool], Any]:
+    """
+    Build a converter that rebuilds nested partials from their dicts.
+
+    Partials overriding from_dict are called without for_json, as
+    _partial_dict calls an overridden to_dict.
+    """
+    from_dict = partial_class.from_dict
+    if from_dict.__func__ is not MessagePartial.from_dict.__func__:
+        default_from_dict = from_dict
+
+        def from_dict(data: Dict[str, Any], for_json: bool) -> Any:
+            return default_from_dict(data)
+
+    def convert(value: Any, for_json: bool) -> Any:
+        if isinstance(value, dict):
+            return from_dict(value, for_json)
+        if isinstance(value, list):
+            return [
+                from_dict(item, for_json) if isinstance(item, dict) else item
+                for item in value
+            ]
+        return value
+
+    return convert
+
+
+def _enum_from_dict(
+    enum_class: Optional[Type[IntEnum]],
+) -> Callable[[Any, bool], Any]:
+    """
+    Build a converter that rebuilds an enum member from its to_dict form.
+
+    Without an enum class such values cannot be rebuilt and convert to
+    _UNSET, which from_dict skips.
+    """
+
+    def convert(value: Any, for_json: bool) -> Any:
+        if isinstance(value, dict) and "value" in value:
+            return _UNSET if enum_class is None else enum_class(value["value"])
+        return value
+
+    return convert
+
+
+def _dict_converters(
+    fields: Dict[str, Dict[str, Any]],
+) -> Tuple[Tuple[str, Optional[Callable[[Any, bool], Any]]], ...]:
+    """
+    Build the (field_name, converter) table used by from_dict.
+
+    Converters take the value and from_dict's for_json flag. A converter of
+    None means the dict value is used unchanged.
+    """
+    converters = []
+    for field_name, field_spec in fields.items():
+        field_type = field_spec.get("type")
+        if _is_partial_type(field_type):
+            converter = _partial_from_dict(field_type)
+        elif field_type == "enum":
+            converter = _enum_from_dict(field_spec.get("enum"))
+        elif field_type == "bytes":
+            converter = _bytes_from_dict_value
+        else:
+            converter = None
+        converters.append((field_name, converter))
+    return tuple(converters)
+
+
+# Value types that to_dict copies unchanged; checking type() against this
+# set spares the common scalar fields the isinstance chain.
+_PLAIN_DICT_TYPES = frozenset({int, float, bool, str, type(None)})
+
+
+def _partial_dict(partial: "MessagePartial", pending: List[Tuple]) -> Dict[str, Any]:
+    """
+    Return the dictionary for a nested partial.
+
+    Partials using the default to_dict get an empty dict that is queued on
+    pending and filled in by _fill_partial_dicts, so nesting depth costs no
+    Python recursion. Partials overriding to_dict are converted directly.
+    """
+    if type(partial).to_dict is not MessagePartial.to_dict:
+        return partial.to_dict()
+    result = {}
+    pending.append((partial, result))
+    return result
+
+
+def _fill_partial_dicts(pending: List[Tuple], for_json: bool = False) -> None:
+    """
+    Fill the queued (partial, dict) pairs, queueing nested partials too.
+
+    bytes values become a list of ints, or a base64 string when for_json.
+    """
+    while pending:
+        partial, result = pending.pop()
+        result["type"] = partial.__class__.__name__
+        for field_name in partial._field_names:
+            value = getattr(partial, field_name)
+            if type(value) in _PLAIN_DICT_TYPES:
+                result[field_name] = value
+            elif isinstance(value, IntEnum):
+                result[field_name] = _enum_dict(value)
+            elif isinstance(value, MessagePartial):
+                result[field_name] = _partial_dict(value, pending)
+            elif isinstance(value, bytes):
+                result[field_name] = (
+                    b64encode(value).decode("ascii") if for_json else list(value)
+                )
+            elif isinstance(value, list):
+                result[field_name] = [
+                    (
+                        _partial_dict(item, pending)
+                        if isinstance(item, MessagePartial)
+                        else _enum_dict(item) if isinstance(item, IntEnum) else item
+                    )
+                    for item in value
+                ]
+            else:
+                result[field_name] = value
+
+
+def _cache_serialized_bytes(
+    serialize: Callable[[Any], bytes],
+) -> Callable[[Any], bytes]:
+    """Wrap serialize_bytes so its result is kept until an attribute is set."""
+
+    @wraps(serialize)
+    def serialize_bytes(self) -> bytes:
+        cached = self.__dict__.get("_serialized")
+        if cached is None:
+            cached = self.__dict__["_serialized"] = serialize(self)
+        return cached
+
+    serialize_bytes._caches_serialized = True
+    return serialize_bytes
+
+
+def _setattr_clearing_cache(self, name: str, value: Any) -> None:
+    """__setattr__ for cache_serialized classes: drop the cached bytes."""
+    object.__setattr__(self, name, value)
+    self.__dict__.pop("_serialized", None)
+
+
+_UNSET = object()
+
+
+def _is_scalar_spec(spec: Dict[str, Any]) -> bool:
+    """Return True for int, float, bool and enum fields (not arrays)."""
+    field_type = spec.get("type")
+    return (
+        isinstance(field_type, str)
+        and field_type not in ("str", "bytes", "custom")
+        and not spec.get("numlist")
+        and not spec.get("dynamic_array")
+        and not {"encoder", "encode", "serializer"} & spec.keys()
+    )
+
+
+def _equality_order(fields: Dict[str, Dict[str, Any]]) -> Tuple[str, ...]:
+    """
+    Order field names so scalars are compared before sequences.
+
+    Two instances that differ in an int, float, bool or enum field are told
+    apart before any long string, bytes value, array or nested partial is
+    compared element by element.
+    """
+    scalars = [name for name, spec in fields.items() if _is_scalar_spec(spec)]
+    return tuple(scalars) + tuple(name for name in fields if name not in scalars)
+
+
+def _values_getter(names: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+    """
+    Return a function reading the named attributes into a tuple.
+
+    attrgetter fetches every value in one C call; it returns a bare value
+    rather than a 1-tuple for a single name, so that case is wrapped.
+    """
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        get_one = attrgetter(names[0])
+        return lambda obj: (get_one(obj),)
+    return attrgetter(*names)
+
+
+def _hashed_fields(
+    fields: Dict[str, Dict[str, Any]], order: Tuple[str, ...]
+) -> Tuple[int, ...]:
+    """Return the positions in order of plain str and bytes fields."""
+    return tuple(
+        index
+        for index, name in enumerate(order)
+        if fields[name].get("type") in ("str", "bytes")
+        and not fields[name].get("numlist")
+        and not fields[name].get("dynamic_array")
+    )
+
+
+def _fields_equal(a: Any, b: Any) -> bool:
+    """Compare two instances of the same class field by field."""
+    try:
+        values_a = a._eq_values(a)
+        values_b = a._eq_values(b)
+    except AttributeError:
+        # Some fields were never assigned (Message only sets given kwargs).
+        values_a = tuple(getattr(a, name, _UNSET) for name in a._eq_fields)
+        values_b = tuple(getattr(b, name, _UNSET) for name in a._eq_fields)
+    scalars = a._eq_scalar_count
+    if values_a[:scalars] != values_b[:scalars]:
+        return False
+    # str and bytes cache their hash, so a value checked before is told apart
+    # from a different one without comparing it character by character.
+    for index in a._eq_hashed:
+        value_a, value_b = values_a[index], values_b[index]
+        if (
+            type(value_a) is type(value_b)
+            and type(value_a) in (str, bytes)
+            and hash(value_a) != hash(value_b)
+        ):
+            return False
+    return all(map(_value_equal, values_a[scalars:], values_b[scalars:]))
+
+
+def _value_equal(a: Any, b: Any) -> bool:
+    """Compare field values, recursing into nested partials and their lists."""
+    if a is b:
+        return True
+    fields_equal = getattr(type(a), "fields_equal", None)
+    if fields_equal is not None:
+        return fields_equal(a, b)
+    if type(a) is list and type(b) is list:
+        return a == b or (len(a) == len(b) and all(map(_value_equal, a, b)))
+    return a == b
+
+
+def _field_slots(bases: Tuple[type, ...], namespace: Dict[str, Any]) -> Tuple:
+    """
+    Return the ``__slots__`` to add for a class's declared fields.
+
+    Names that are not identifiers, or that are already attributes of the
+    class or its bases (methods, properties, defaults, inherited slots),
+    are left to the instance ``__dict__``.
+    """
+    return tuple(
+        name
+        for name in namespace["fields"]
+        if _is_identifier(name)
+        and name not in namespace
+        and not any(hasattr(base, name) for base in bases)
+    )
+
+
+def _class_statics(bases: Tuple[type, ...], namespace: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the static field values to store as class attributes.
+
+    Only classes that honor ``static`` (``_honor_static``) get them. Instances
+    then inherit the value instead of storing it, so static fields need no
+    slot and no per-instance assignment. Names already bound in the class
+    body or listed in a declared ``__slots__`` are skipped.
+    """
+    honor = namespace.get(
+        "_honor_static", any(getattr(base, "_honor_static", False) for base in bases)
+    )
+    if not honor:
+        return {}
+    declared = namespace.get("__slots__", ())
+    if isinstance(declared, str):
+        declared = (declared,)
+    return {
+        name: spec["static"]
+        for name, spec in namespace["fields"].items()
+        if "static" in spec and name not in namespace and name not in declared
+    }
+
+
+class FieldSchemaMeta(ABCMeta):
+    """
+    Metaclass that compiles a class's ``fields`` schema when the class is created.
+
+    Type strings, enum encoders and nested partial classes are resolved once
+    here. Classes whose fields only use built-in types, enums and compiled
+    nested partials get a per-class codec plan, so encoding can size its
+    output buffer exactly and write every field in place instead of
+    re-parsing the schema on each call. ``fields`` is read once, at class
+    creation.
+
+    A subclass declared with ``slots=True`` (``class Point(Message,
+    slots=True)``) and no ``__slots__`` of its own gets a slot per field, so
+    its field values are read and written through slot descriptors. Other
+    classes keep their fields in the instance ``__dict__``. The base classes
+    are never slotted, so instances of either kind keep ``__dict__`` for
+    extra attributes. Two classes with generated slots cannot be combined as
+    bases. On classes that honor static values, static fields become class
+    attributes rather than instance values.
+    """
+
+    def __new__(mcs, name, bases, namespace, slots=False, **kwargs):
+        is_root = not any(isinstance(base, FieldSchemaMeta) for base in bases)
+        if not is_root and "fields" in namespace:
+            statics = _class_statics(bases, namespace)
+            if slots and "__slots__" not in namespace:
+                field_slots = _field_slots(bases, namespace)
+                statics["__slots__"] = tuple(
+                    n for n in field_slots if n not in statics
+                )
+            namespace = dict(namespace, **statics)
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, slots=False, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # Classes that override the byte codec are never inlined into a
+        # containing message's plan; their own methods must run.
+        is_root = not any(isinstance(base, FieldSchemaMeta) for base in bases)
+        cls._custom_serialization = not is_root and (
+            "serialize_bytes" in namespace
+            or "deserialize_bytes" in namespace
+            or any(getattr(base, "_custom_serialization", False) for base in bases)
+        )
+        # Type tag written by Protocol.encode: 2-byte big-endian length + UTF-8.
+        cls._name_utf8 = name.encode("utf-8")
+        cls._type_header = len(cls._name_utf8).to_bytes(2, "big") + cls._name_utf8
+        if getattr(cls, "cache_serialized", False):
+            if not getattr(cls.serialize_bytes, "_caches_serialized", False):
+                cls.serialize_bytes = _cache_serialized_bytes(cls.serialize_bytes)
+            if "__setattr__" not in namespace:
+                cls.__setattr__ = _setattr_clearing_cache
+        cls._eq_fields = _equality_order(cls.fields)
+        cls._eq_scalar_count = sum(map(_is_scalar_spec, cls.fields.values()))
+        cls._eq_hashed = _hashed_fields(cls.fields, cls._eq_fields)
+        cls._eq_values = staticmethod(_values_getter(cls._eq_fields))
+        cls._compile_fields()
+
+
+class MessagePartial(ABC, metaclass=FieldSchemaMeta):
     """
     Base class for message partial components with declarative field definitions.
 
@@ -490,6 +2209,7 @@ class MessagePartial(ABC):
     - size: Size parameter for certain encoders
     - numlist: Fixed array size
     - serializer: Serializer instance (BytesSerializer/JSONSerializer) for this field
+    - intern: sys.intern decoded 'str' values (for strings that repeat a lot)
 
     Examples:
         # Built-in types
@@ -525,12 +2245,59 @@ class MessagePartial(ABC):
     encoding: Encoding = Encoding.BIG_ENDIAN
     fields: Dict[str, Dict[str, Any]] = {}
     bitwise: bool = False  # Set to True to enable bitwise packing
+    # Set to True to reuse serialize_bytes() output until an attribute is
+    # assigned (in-place changes to nested values are not detected)
+    cache_serialized: bool = False
 
     def __init__(self, **kwargs):
         """Initialize with field values."""
-        for field_name in self.fields:
+        for field_name in self._field_names:
             setattr(self, field_name, kwargs.get(field_name))
 
+    def __getattr__(self, name: str) -> Any:
+        """Decode fields of instances created by deserialize_view on first use."""
+        return _load_view_field(self, name)
+
+    def __reduce_ex__(self, protocol: int) -> Any:
+        """Decode any fields still held in a lazy view before pickling or copying."""
+        _load_view_fields(self)
+        return super().__reduce_ex__(protocol)
+
+    def fields_equal(self, other: Any) -> bool:
+        """
+        Return True if other is a partial of the same class with equal fields.
+
+        ``==`` keeps identity semantics, so partials stay hashable; use this
+        for value comparisons such as dedup or idempotency checks. Scalar
+        fields are compared first, and str/bytes fields are rejected on a
+        hash mismatch before their contents are scanned.
+        """
+        if other is self:
+            return True
+        if type(other) is not type(self):
+            return False
+        return _fields_equal(self, other)
+
+    @classmethod
+    def _compile_fields(cls) -> None:
+        """Compile the field plan for this class (called by the metaclass)."""
+        cls._field_names = tuple(cls.fields)
+        cls._from_dict_converters = _dict_converters(cls.fields)
+        cls._is_bitwise = cls.bitwise or cls._has_bitwise_fields_static()
+        cls._bit_pack = cls._bit_unpack = None
+        plan = None
+        if not cls._is_bitwise:
+            plan = _compile_field_plan(
+                cls.fields, cls.encoding.value, honor_static=False
+            )
+        else:
+            layout = _compile_bit_layout(cls.fields, honor_static=False)
+            if layout is not None:
+                cls._bit_pack, cls._bit_unpack = _compile_bit_functions(
+                    cls.__name__, layout
+                )
+        _install_field_plan(cls, plan)
+
     def serialize_bytes(self) -> bytes:
         """
         Serialize this message partial to bytes based on field definitions.
@@ -540,14 +2307,18 @@ class MessagePartial(ABC):
         Returns:
             Byte representation
         """
+        # Plain schemas: generated function, one exactly-sized buffer
+        if self._field_plan is not None:
+            return self._pack_plan()
+
         byteorder = self.encoding.value
 
         # Check if this partial uses bitwise encoding
-        if self.bitwise or self._has_bitwise_fields():
+        if self._is_bitwise:
             return self._serialize_bitwise(byteorder)
 
-        # Standard byte-aligned serialization
-        result = b""
+        # Standard byte-aligned serialization, appended in place to one buffer
+        result = bytearray()
 
         for field_name, field_spec in self.fields.items():
             value = getattr(self, field_name)
@@ -561,8 +2332,12 @@ class MessagePartial(ABC):
                     raise ValueError(
                         f"{field_name} must have {field_spec['numlist']} elements"
                     )
-                for item in value:
-                    result += self._serialize_value(item, field_spec, byteorder)
+                items = _items_struct(field_spec, byteorder, len(value))
+                if items is not None:
+                    result += items.pack(*value)
+                else:
+                    for item in value:
+                        result += self._serialize_value(item, field_spec, byteorder)
             # Handle dynamic arrays with length prefix
             elif field_spec.get("dynamic_array"):
                 if not isinstance(value, list):
@@ -571,8 +2346,12 @@ class MessagePartial(ABC):
                 length = len(value)
                 result += length.to_bytes(4, byteorder)
                 # Write each element
-                for item in value:
-                    result += self._serialize_value(item, field_spec, byteorder)
+                items = _items_struct(field_spec, byteorder, len(value))
+                if items is not None:
+                    result += items.pack(*value)
+                else:
+                    for item in value:
+                        result += self._serialize_value(item, field_spec, byteorder)
             # Handle dynamic arrays with delimiter
             elif "delimiter" in field_spec:
                 if not isinstance(value, list):
@@ -590,7 +2369,7 @@ class MessagePartial(ABC):
             else:
                 result += self._serialize_value(value, field_spec, byteorder)
 
-        return result
+        return bytes(result)
 
     def _serialize_value(
         self, value: Any, field_spec: Dict[str, Any], byteorder: str
@@ -621,6 +2400,12 @@ class MessagePartial(ABC):
                 return encode_fn(value, byteorder)
             raise ValueError(f"encode must be callable")
 
+        # Built-in type strings: one cached packer per (type, byte order)
+        if isinstance(field_type, str):
+            packer = _value_packer(field_type, byteorder)
+            if packer is not None:
+                return packer(value)
+
         # Enum type
         if field_type == "enum":
             enum_class = field_spec.get("enum")
@@ -644,35 +2429,7 @@ class MessagePartial(ABC):
                 f"Field type must be str or MessagePartial subclass, got {type(field_type)}"
             )
 
-        # Sized integers
-        if field_type.startswith("int("):
-            bits = int(field_type[4:-1])
-            byte_size = bits // 8
-            return value.to_bytes(byte_size, byteorder, signed=True)
-        elif field_type.startswith("uint("):
-            bits = int(field_type[5:-1])
-            byte_size = bits // 8
-            return value.to_bytes(byte_size, byteorder, signed=False)
-        # Native Python types
-        elif field_type == "int":
-            return value.to_bytes(8, byteorder, signed=True)
-        elif field_type == "str":
-            value_bytes = value.encode("utf-8")
-            length = len(value_bytes)
-            return length.to_bytes(4, byteorder) + value_bytes
-        elif field_type == "float":
-            fmt = "<f" if byteorder == "little" else ">f"
-            return struct.pack(fmt, value)
-        elif field_type == "double":
-            fmt = "<d" if byteorder == "little" else ">d"
-            return struct.pack(fmt, value)
-        elif field_type == "bool":
-            return bytes([1 if value else 0])
-        elif field_type == "bytes":
-            length = len(value)
-            return length.to_bytes(4, byteorder) + value
-        else:
-            raise ValueError(f"Unsupported type: {field_type}")
+        raise ValueError(f"Unsupported type: {field_type}")
 
     def _has_bitwise_fields(self) -> bool:
         """Check if any fields use bitwise encoding."""
@@ -702,6 +2459,10 @@ class MessagePartial(ABC):
         Returns:
             Packed bytes
         """
+        # All-'bit' schemas use the pack function generated for the class
+        if self._bit_pack is not None:
+            return self._bit_pack()
+
         context = BitPackingContext(byteorder)
 
         for field_name, field_spec in self.fields.items():
@@ -719,25 +2480,21 @@ class MessagePartial(ABC):
 
                 bit_count = field_spec.get("bits", 1)
                 signed = field_spec.get("signed", False)
+                if signed:
+                    min_val = -(2 ** (bit_count - 1))
+                    max_val = 2 ** (bit_count - 1) - 1
+                else:
+                    min_val = 0
+                    max_val = 2**bit_count - 1
 
                 for item in value:
-                    # Validate
-                    if signed:
-                        min_val = -(2 ** (bit_count - 1))
-                        max_val = 2 ** (bit_count - 1) - 1
-                    else:
-                        min_val = 0
-                        max_val = 2**bit_count - 1
-
                     if item < min_val or item > max_val:
                         raise ValueError(
                             f"{field_name}: value {item} out of range for {bit_count}-bit field"
                         )
 
-                    # Pack
-                    if signed and item < 0:
-                        item = (1 << bit_count) + item
-                    context.pack_bits(item, bit_count)
+                # Negative items are masked to their two's complement bits
+                context.pack_array(value, bit_count)
 
             # Handle bitwise fields
             elif field_type == "bit":
@@ -793,6 +2550,9 @@ class MessagePartial(ABC):
         Returns:
             Tuple of (field values dict, bytes consumed)
         """
+        if cls._bit_unpack is not None:
+            return cls._bit_unpack(data)
+
         context = BitUnpackingContext(data, byteorder)
         kwargs = {}
 
@@ -805,15 +2565,15 @@ class MessagePartial(ABC):
                 signed = field_spec.get("signed", False)
                 array_size = field_spec["numlist"]
 
-                values = []
-                for _ in range(array_size):
-                    value = context.unpack_bits(bit_count)
-
-                    # Convert to signed if needed
-                    if signed and (value & (1 << (bit_count - 1))):
-                        value -= 1 << bit_count
+                values = context.unpack_array(array_size, bit_count)
 
-                    values.append(value)
+                # Convert to signed if needed
+                if signed:
+                    sign_bit = 1 << (bit_count - 1)
+                    values = [
+                        value - (sign_bit << 1) if value & sign_bit else value
+                        for value in values
+                    ]
 
                 kwargs[field_name] = values
 
@@ -839,6 +2599,24 @@ class MessagePartial(ABC):
 
         return kwargs, context.get_bytes_consumed()
 
+    @classmethod
+    def deserialize_view(cls, data: bytes) -> Tuple["MessagePartial", int]:
+        """
+        Deserialize lazily: each field is decoded from data when first read.
+
+        Only field boundaries are located up front, so fields that are
+        never read are never decoded. The instance keeps a view of bytes
+        data alive; other buffers are copied, so the caller may reuse them.
+        Classes that cannot be read lazily fall back to deserialize_bytes.
+
+        Args:
+            data: Bytes to deserialize
+
+        Returns:
+            Tuple of (MessagePartial instance, bytes consumed)
+        """
+        return _deserialize_view(cls, data, MessagePartial.__init__)
+
     @classmethod
     def deserialize_bytes(cls, data: bytes) -> Tuple["MessagePartial", int]:
         """
@@ -852,10 +2630,16 @@ class MessagePartial(ABC):
         Returns:
             Tuple of (MessagePartial instance, bytes consumed)
         """
+        if cls._field_plan is not None:
+            return cls._decode_from(memoryview(data), 0)
+
+        # Fields are parsed from slices of a memoryview, so walking the input
+        # copies nothing; str and bytes values are materialized at the end.
+        data = memoryview(data)
         byteorder = cls.encoding.value
 
         # Check if this partial uses bitwise encoding
-        if cls.bitwise or cls._has_bitwise_fields_static():
+        if cls._is_bitwise:
             kwargs, bytes_consumed = cls._deserialize_bitwise(data, byteorder)
             return cls(**kwargs), bytes_consumed
 
@@ -866,27 +2650,35 @@ class MessagePartial(ABC):
         for field_name, field_spec in cls.fields.items():
             # Handle fixed-size arrays
             if "numlist" in field_spec:
-                values = []
-                for _ in range(field_spec["numlist"]):
-                    value, consumed = cls._deserialize_value(
-                        data[offset:], field_spec, byteorder
-                    )
-                    values.append(value)
-                    offset += consumed
+                items = _items_struct(field_spec, byteorder, field_spec["numlist"])
+                if items is not None:
+                    values, offset = _unpack_items(items, data, offset)
+                else:
+                    values = []
+                    for _ in range(field_spec["numlist"]):
+                        value, consumed = cls._deserialize_value(
+                            data[offset:], field_spec, byteorder
+                        )
+                        values.append(value)
+                        offset += consumed
                 kwargs[field_name] = values
             # Handle dynamic arrays with length prefix
             elif field_spec.get("dynamic_array"):
                 if len(data) < offset + 4:
                     raise ValueError("Insufficient data for array length")
-                array_length = int.from_bytes(data[offset : offset + 4], byteorder)
+                array_length = _LENGTH_PREFIX[byteorder].unpack_from(data, offset)[0]
                 offset += 4
-                values = []
-                for _ in range(array_length):
-                    value, consumed = cls._deserialize_value(
-                        data[offset:], field_spec, byteorder
-                    )
-                    values.append(value)
-                    offset += consumed
+                items = _items_struct(field_spec, byteorder, array_length)
+                if items is not None:
+                    values, offset = _unpack_items(items, data, offset)
+                else:
+                    values = []
+                    for _ in range(array_length):
+                        value, consumed = cls._deserialize_value(
+                            data[offset:], field_spec, byteorder
+                        )
+                        values.append(value)
+                        offset += consumed
                 kwargs[field_name] = values
             # Handle dynamic arrays with delimiter
             elif "delimiter" in field_spec:
@@ -959,13 +2751,13 @@ class MessagePartial(ABC):
             # Read length prefix
             if len(data) < 4:
                 raise ValueError("Insufficient data for serializer length prefix")
-            length = int.from_bytes(data[0:4], byteorder)
+            length = _LENGTH_PREFIX[byteorder].unpack_from(data)[0]
             if len(data) < 4 + length:
                 raise ValueError(
                     f"Insufficient data: need {4 + length}, got {len(data)}"
                 )
             # Deserialize using the specified serializer
-            serialized_data = data[4 : 4 + length]
+            serialized_data = bytes(data[4 : 4 + length])
 
             # Determine the message class for deserialization
             if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
@@ -986,6 +2778,8 @@ class MessagePartial(ABC):
         if "encoder" in field_spec:
             encoder = field_spec["encoder"]
             if isinstance(encoder, FieldEncoder):
+                if not encoder.accepts_memoryview:
+                    data = bytes(data)
                 return encoder.decode(data, byteorder)
             raise ValueError(f"Encoder must be a FieldEncoder instance")
 
@@ -993,7 +2787,7 @@ class MessagePartial(ABC):
         if "decode" in field_spec:
             decode_fn = field_spec["decode"]
             if callable(decode_fn):
-                return decode_fn(data, byteorder)
+                return decode_fn(bytes(data), byteorder)
             raise ValueError(f"decode must be callable")
 
         # Enum type
@@ -1007,6 +2801,9 @@ class MessagePartial(ABC):
 
         # Handle nested MessagePartial
         if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
+            # Overridden deserialize_bytes implementations get plain bytes
+            if field_type._custom_serialization:
+                data = bytes(data)
             instance, consumed = field_type.deserialize_bytes(data)
             return instance, consumed
 
@@ -1016,7 +2813,15 @@ class MessagePartial(ABC):
                 f"Field type must be str or MessagePartial subclass, got {type(field_type)}"
             )
 
-        # Sized integers
+        # Fixed-width numbers: one shared, precompiled Struct per type
+        scalar = _scalar_struct(field_type, byteorder)
+        if scalar is not None:
+            size = scalar.size
+            if len(data) < size:
+                raise ValueError(f"Insufficient data: need {size}, got {len(data)}")
+            return scalar.unpack_from(data)[0], size
+
+        # Sized integers of widths struct has no code for
         if field_type.startswith("int("):
             bits = int(field_type[4:-1])
             byte_size = bits // 8
@@ -1035,34 +2840,18 @@ class MessagePartial(ABC):
                 )
             value = int.from_bytes(data[0:byte_size], byteorder, signed=False)
             return value, byte_size
-        # Native Python types
-        elif field_type == "int":
-            if len(data) < 8:
-                raise ValueError(f"Insufficient data: need 8, got {len(data)}")
-            value = int.from_bytes(data[0:8], byteorder, signed=True)
-            return value, 8
         elif field_type == "str":
             if len(data) < 4:
                 raise ValueError("Insufficient data for length prefix")
-            length = int.from_bytes(data[0:4], byteorder)
+            length = _LENGTH_PREFIX[byteorder].unpack_from(data)[0]
             if len(data) < 4 + length:
                 raise ValueError(
                     f"Insufficient data: need {4 + length}, got {len(data)}"
                 )
-            value = data[4 : 4 + length].decode("utf-8")
+            value = str(data[4 : 4 + length], "utf-8")
+            if field_spec.get("intern"):
+                value = sys.intern(value)
             return value, 4 + length
-        elif field_type == "float":
-            if len(data) < 4:
-                raise ValueError(f"Insufficient data: need 4, got {len(data)}")
-            fmt = "<f" if byteorder == "little" else ">f"
-            value = struct.unpack(fmt, data[0:4])[0]
-            return value, 4
-        elif field_type == "double":
-            if len(data) < 8:
-                raise ValueError(f"Insufficient data: need 8, got {len(data)}")
-            fmt = "<d" if byteorder == "little" else ">d"
-            value = struct.unpack(fmt, data[0:8])[0]
-            return value, 8
         elif field_type == "bool":
             if len(data) < 1:
                 raise ValueError(f"Insufficient data: need 1, got {len(data)}")
@@ -1071,12 +2860,12 @@ class MessagePartial(ABC):
         elif field_type == "bytes":
             if len(data) < 4:
                 raise ValueError("Insufficient data for length prefix")
-            length = int.from_bytes(data[0:4], byteorder)
+            length = _LENGTH_PREFIX[byteorder].unpack_from(data)[0]
             if len(data) < 4 + length:
                 raise ValueError(
                     f"Insufficient data: need {4 + length}, got {len(data)}"
                 )
-            value = data[4 : 4 + length]
+            value = bytes(data[4 : 4 + length])
             return value, 4 + length
         else:
             raise ValueError(f"Unsupported type: {field_type}")
@@ -1088,103 +2877,53 @@ class MessagePartial(ABC):
         Returns:
             True if valid
         """
-        for field_name in self.fields:
+        for field_name in self._field_names:
             if not hasattr(self, field_name):
                 return False
         return True
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, for_json: bool = False) -> Dict[str, Any]:
         """
         Convert message partial to dictionary for JSON/XML serialization.
 
+        Nested partials are converted with an explicit worklist rather than
+        recursive to_dict calls.
+
+        Args:
+            for_json: Emit bytes fields as base64 strings instead of lists of
+                ints (used by JSONSerializer; from_dict accepts both forms)
+
         Returns:
             Dictionary representation
         """
-        result = {"type": self.__class__.__name__}
-        for field_name, field_spec in self.fields.items():
-            value = getattr(self, field_name)
-
-            # Handle enums
-            if isinstance(value, IntEnum):
-                result[field_name] = {
-                    "enum": value.__class__.__name__,
-                    "value": value.value,
-                }
-            # Handle MessagePartial
-            elif isinstance(value, MessagePartial):
-                result[field_name] = value.to_dict()
-            # Handle bytes - convert to list for JSON compatibility
-            elif isinstance(value, bytes):
-                result[field_name] = list(value)
-            elif isinstance(value, list):
-                result[field_name] = [
-                    (
-                        item.to_dict()
-                        if isinstance(item, (MessagePartial, IntEnum))
-                        else (
-                            {"enum": item.__class__.__name__, "value": item.value}
-                            if isinstance(item, IntEnum)
-                            else item
-                        )
-                    )
-                    for item in value
-                ]
-            else:
-                result[field_name] = value
+        result = {}
+        _fill_partial_dicts([(self, result)], for_json)
         return result
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "MessagePartial":
+    def from_dict(
+        cls, data: Dict[str, Any], for_json: bool = False
+    ) -> "MessagePartial":
         """
         Create message partial from dictionary.
 
         Args:
             data: Dictionary to deserialize
+            for_json: Read bytes fields given as strings as base64, the form
+                     to_dict(for_json=True) writes them in
 
         Returns:
             MessagePartial instance
         """
         kwargs = {}
-        for field_name, field_spec in cls.fields.items():
+        for field_name, converter in cls._from_dict_converters:
             if field_name not in data:
                 continue
-
             value = data[field_name]
-            field_type = field_spec.get("type")
-
-            # Handle enum type
-            if field_type == "enum" and isinstance(value, dict) and "value" in value:
-                enum_class = field_spec.get("enum")
-                if enum_class:
-                    kwargs[field_name] = enum_class(value["value"])
-                continue
-
-            # Handle MessagePartial
-            if isinstance(field_type, type) and issubclass(field_type, MessagePartial):
-                if isinstance(value, dict):
-                    kwargs[field_name] = field_type.from_dict(value)
-                elif isinstance(value, list):
-                    kwargs[field_name] = [
-                        field_type.from_dict(item) if isinstance(item, dict) else item
-                        for item in value
-                    ]
-                else:
-                    kwargs[field_name] = value
-            # Handle bytes - convert from list if needed
-            elif field_type == "bytes" and isinstance(value, list):
-                kwargs[field_name] = bytes(value)
-            elif isinstance(value, list) and "numlist" in field_spec:
-                # Handle list of MessagePartials
-                if isinstance(field_type, type) and issubclass(
-                    field_type, MessagePartial
-                ):
-                    kwargs[field_name] = [
-                        field_type.from_dict(item) if isinstance(item, dict) else item
-                        for item in value
-                    ]
-                else:
-                    kwargs[field_name] = value
-            else:
-                kwargs[field_name] = value
+            if converter is not None:
+                value = converter(value, for_json)
+                if value is _UNSET:
+                    continue
+            kwargs[field_name] = value
 
         return cls(**kwargs)
@@ -1,10 +1,46 @@
 """Protocol encoding/decoding implementation."""
 
+import functools
+import heapq
+import itertools
+import queue
+import struct
 import threading
-from typing import Any, Callable, Dict, Optional, Type, Tuple, Union
+import time
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Type, Tuple, Union
 
 from packerpy.protocols.message import Message
 
+_AUTO_INT_CODES = {8: "b", 16: "h", 32: "i", 64: "q"}
+_AUTO_SCALAR_CODES = {"float": "f", "double": "d", "bool": "?"}
+
+
+@functools.lru_cache(maxsize=None)
+def _auto_field_struct(field_type: str, byteorder: str) -> Optional[struct.Struct]:
+    """
+    Return a precompiled Struct for a fixed-size auto field type, or None.
+
+    Covers int/uint of 8, 16, 32 or 64 bits, float, double and bool; other
+    widths keep the int.from_bytes path.
+    """
+    prefix = "<" if byteorder == "little" else ">"
+    code = _AUTO_SCALAR_CODES.get(field_type)
+    if code is None:
+        unsigned = field_type.startswith("uint(")
+        if not (unsigned or field_type.startswith("int(")):
+            return None
+        try:
+            code = _AUTO_INT_CODES.get(int(field_type.split("(")[1].split(")")[0]))
+        except ValueError:
+            return None
+        if code is None:
+            return None
+        if unsigned:
+            code = code.upper()
+    return struct.Struct(prefix + code)
+
 
 class InvalidMessage:
     """
@@ -44,6 +80,250 @@ class InvalidMessage:
         )
 
 
+class _ScheduledMessage:
+    """State for one message registered with Protocol.schedule_message()."""
+
+    __slots__ = (
+        "schedule_id",
+        "message",
+        "interval",
+        "interval_ns",
+        "send_callback",
+        "update_callback",
+        "cached_bytes",
+        "validated",
+        "cancelled",
+        "in_flight",
+    )
+
+    def __init__(
+        self,
+        schedule_id: int,
+        message: Message,
+        interval: float,
+        send_callback: Callable[[bytes], None],
+        update_callback: Optional[Callable[[Message], None]],
+    ):
+        self.schedule_id = schedule_id
+        self.message = message
+        self.interval = interval
+        self.interval_ns = max(1, round(interval * 1_000_000_000))
+        self.send_callback = send_callback
+        self.update_callback = update_callback
+        self.cached_bytes: Optional[bytes] = None
+        # Set once encode() has accepted the message; later sends skip its checks
+        self.validated = False
+        self.cancelled = False
+        # True once a send is submitted, then the worker thread running it
+        self.in_flight: Union[bool, threading.Thread, None] = None
+
+
+class _ScheduledMessagesView(Mapping):
+    """
+    Live read-only view of a Protocol's scheduled messages.
+
+    Maps schedule IDs to ``{"message": ..., "interval": ...}`` dicts, built
+    on lookup instead of copying every entry up front.
+    """
+
+    def __init__(self, entries: Dict[int, _ScheduledMessage]):
+        self._entries = entries
+
+    def __getitem__(self, schedule_id: int) -> Dict[str, Any]:
+        entry = self._entries[schedule_id]
+        return {"message": entry.message, "interval": entry.interval}
+
+    def __contains__(self, schedule_id: object) -> bool:
+        return schedule_id in self._entries
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+
+class _Scheduler:
+    """
+    Single dispatcher thread that drives every scheduled message of a Protocol.
+
+    Pending sends are kept in a min-heap of ``(deadline, schedule_id, entry)``
+    with integer deadlines on the nanosecond monotonic clock, so repeated
+    ``deadline + interval`` steps never accumulate rounding error. The
+    dispatcher sleeps on a condition until the earliest deadline, so it only
+    wakes when something is due or the heap head changes; a finished send
+    only wakes it if its next deadline is earlier than the one it sleeps
+    until. Each wakeup also
+    takes entries due within ``slack_ns``, so schedules created together
+    with the same interval keep firing in one pass instead of one wakeup
+    each. Due entries are handed to a small worker pool, so a slow callback
+    does not hold up other schedules; an entry goes back on the heap only
+    once its send has finished, which keeps sends of one message in order.
+    New and finished entries come back through a deque that only the
+    dispatcher drains, so the heap is never touched by other threads.
+    Cancelling only flags the entry; it is dropped when it reaches the head.
+    The dispatcher and its workers are started by the first add() and shut
+    down once no live entries remain. Like the dispatcher, the workers are
+    daemon threads, so a live schedule (or a blocked send callback) never
+    holds up interpreter exit.
+    """
+
+    max_workers = 4
+    slack_ns = 1_000_000
+
+    def __init__(self, fire: Callable[[_ScheduledMessage], None]):
+        """
+        Initialize the scheduler.
+
+        Args:
+            fire: Called on a worker thread with each entry that falls due
+        """
+        self._fire = fire
+        self._heap: list = []
+        self._incoming: deque = deque()
+        self._live = 0
+        lock = threading.Lock()
+        self._cv = threading.Condition(lock)
+        # Cancel waits on its own condition so finished sends don't wake the dispatcher
+        self._send_done = threading.Condition(lock)
+        # Deadline the dispatcher sleeps until: None for no timeout, 0 while awake
+        self._wake_at: Optional[int] = 0
+        self._thread: Optional[threading.Thread] = None
+        self._workers: list = []
+
+    def add(self, entry: _ScheduledMessage) -> None:
+        """Add an entry that fires right away and then every interval."""
+        # A deadline in the past is read as "now" by the dispatcher
+        self._incoming.append((0, entry))
+        with self._cv:
+            self._live += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            else:
+                self._cv.notify()
+
+    def cancel(self, entry: _ScheduledMessage) -> None:
+        """
+        Cancel an entry.
+
+        Waits for a send of this entry that is already in progress, so no
+        callback runs once this returns (unless called from the callback).
+        """
+        current = threading.current_thread()
+        with self._cv:
+            if entry.cancelled:
+                return
+            entry.cancelled = True
+            self._live -= 1
+            if not self._live:
+                # Let the dispatcher exit; otherwise the entry is dropped lazily
+                self._cv.notify()
+            while entry.in_flight is not None and entry.in_flight is not current:
+                self._send_done.wait()
+
+    def _invoke(self, entry: _ScheduledMessage, deadline: int) -> None:
+        """Worker body: send one due entry, then hand it back to the dispatcher."""
+        entry.in_flight = threading.current_thread()
+        try:
+            if not entry.cancelled:
+                self._fire(entry)
+        finally:
+            next_deadline = deadline + entry.interval_ns
+            self._incoming.append((next_deadline, entry))
+            with self._cv:
+                entry.in_flight = None
+                self._send_done.notify_all()
+                # Only wake the dispatcher if it would sleep past this deadline
+                wake_at = self._wake_at
+                if wake_at is None or next_deadline < wake_at:
+                    self._cv.notify()
+
+    def _work(self, jobs: queue.SimpleQueue, idle: threading.Semaphore) -> None:
+        """Worker thread body: run submitted sends until a None job arrives."""
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            self._invoke(*job)
+            idle.release()
+
+    def _submit(
+        self, jobs: queue.SimpleQueue, idle: threading.Semaphore, job: Tuple
+    ) -> None:
+        """Queue a send, starting another worker if none is idle."""
+        jobs.put(job)
+        if idle.acquire(blocking=False) or len(self._workers) >= self.max_workers:
+            return
+        worker = threading.Thread(
+            target=self._work,
+            args=(jobs, idle),
+            name=f"packerpy-sched_{len(self._workers)}",
+            daemon=True,
+        )
+        worker.start()
+        self._workers.append(worker)
+
+    def _run(self) -> None:
+        """Dispatcher thread body."""
+        heap = self._heap
+        incoming = self._incoming
+        jobs: queue.SimpleQueue = queue.SimpleQueue()
+        # Counts workers waiting for a job, as ThreadPoolExecutor does
+        idle = threading.Semaphore(0)
+        with self._cv:
+            while self._live:
+                # One clock read per pass serves every comparison below
+                now = time.monotonic_ns()
+                while incoming:
+                    deadline, entry = incoming.popleft()
+                    if entry.cancelled:
+                        continue
+                    # Keep the cadence of the deadlines unless a send overran it
+                    if deadline < now:
+                        deadline = now
+                    heapq.heappush(heap, (deadline, entry.schedule_id, entry))
+
+                # Take every due entry in one pass, then submit them unlocked
+                due = []
+                horizon = now + self.slack_ns
+                while heap:
+                    deadline, _, entry = heap[0]
+                    if entry.cancelled:
+                        heapq.heappop(heap)
+                    elif deadline <= horizon:
+                        heapq.heappop(heap)
+                        entry.in_flight = True
+                        due.append((entry, deadline))
+                    else:
+                        break
+
+                if due:
+                    self._cv.release()
+                    try:
+                        for job in due:
+                            self._submit(jobs, idle, job)
+                    finally:
+                        self._cv.acquire()
+                elif heap:
+                    self._wake_at = heap[0][0]
+                    self._cv.wait((self._wake_at - now) / 1_000_000_000)
+                    self._wake_at = 0
+                else:
+                    self._wake_at = None
+                    self._cv.wait()
+                    self._wake_at = 0
+
+            heap.clear()
+            for _ in self._workers:
+                jobs.put(None)
+            self._workers = []
+            self._thread = None
+
+
 class Protocol:
     """
     Protocol encoder/decoder with message type registry.
@@ -70,9 +350,13 @@ class Protocol:
     def __init__(self):
         """Initialize protocol with empty message registry."""
         self._message_registry: Dict[str, Type[Message]] = {}
-        self._scheduled_messages: Dict[int, Dict[str, Any]] = {}
-        self._next_schedule_id: int = 0
-        self._schedule_lock = threading.Lock()
+        # Same registry keyed by the UTF-8 type name as it appears on the wire
+        self._wire_registry: Dict[bytes, Type[Message]] = {}
+        self._scheduled_messages: Dict[int, _ScheduledMessage] = {}
+        self._schedule_ids = itertools.count()
+        self._sink_lock = threading.Lock()
+        self._scheduler = _Scheduler(self._send_scheduled)
+        self._scheduled_view = _ScheduledMessagesView(self._scheduled_messages)
         self._auto_replies: Dict[int, Dict[str, Any]] = {}
         self._next_reply_id: int = 0
         self._reply_lock = threading.Lock()
@@ -82,8 +366,13 @@ class Protocol:
         # Automatic headers and footers
         self._headers: Dict[str, Dict[str, Any]] = {}
         self._footers: Dict[str, Dict[str, Any]] = {}
+        self._header_size: Optional[int] = None
+        self._footer_size: Optional[int] = None
         self._header_lock = threading.Lock()
         self._footer_lock = threading.Lock()
+        # True while a header/footer has a compute spec, whose value may
+        # change between encodes of the same message
+        self._computed_auto_fields = False
 
     def register(self, message_class: Type[Message]) -> Type[Message]:
         """
@@ -106,6 +395,7 @@ class Protocol:
             )
 
         self._message_registry[message_type] = message_class
+        self._wire_registry[message_class._name_utf8] = message_class
         return message_class
 
     def set_headers(self, headers: Dict[str, Dict[str, Any]]) -> None:
@@ -142,6 +432,8 @@ class Protocol:
         """
         with self._header_lock:
             self._headers = dict(headers)
+            self._header_size = None
+        self._invalidate_scheduled_bytes()
 
     def set_footers(self, footers: Dict[str, Dict[str, Any]]) -> None:
         """
@@ -172,16 +464,22 @@ class Protocol:
         """
         with self._footer_lock:
             self._footers = dict(footers)
+            self._footer_size = None
+        self._invalidate_scheduled_bytes()
 
     def clear_headers(self) -> None:
         """Remove all automatic headers."""
         with self._header_lock:
             self._headers = {}
+            self._header_size = None
+        self._invalidate_scheduled_bytes()
 
     def clear_footers(self) -> None:
         """Remove all automatic footers."""
         with self._footer_lock:
             self._footers = {}
+            self._footer_size = None
+        self._invalidate_scheduled_bytes()
 
     @staticmethod
     def crc32(data: bytes, initial: int = 0) -> int:
@@ -258,21 +556,72 @@ class Protocol:
         Raises:
             ValueError: If message type not registered or invalid
         """
-        message_type = message.__class__.__name__
-
-        if message_type not in self._message_registry:
+        self._check_encodable(message)
+        return self._encode_unchecked(message)
+
+    def _check_encodable(self, message: Message) -> None:
+        """Raise ValueError unless message is registered here and valid."""
+        # Match the class itself: another class with a registered name would
+        # otherwise be encoded under that name and decoded as the wrong type
+        message_class = type(message)
+        if self._message_registry.get(message_class.__name__) is not message_class:
             raise ValueError(
-                f"Message type '{message_type}' not registered with this protocol. "
-                f"Use @protocol(your_protocol) decorator on the Message class."
+                f"Message type '{message_class.__name__}' not registered with this "
+                f"protocol. Use @protocol(your_protocol) decorator on the Message class."
             )
 
         if not self.validate_message(message):
             raise ValueError("Cannot encode invalid message")
 
-        # Encode message type as length-prefixed UTF-8 string
-        type_bytes = message_type.encode("utf-8")
-        type_length = len(type_bytes)
-        type_header = type_length.to_bytes(2, "big") + type_bytes
+    def encode_into(
+        self, buf: Union[bytearray, memoryview], message: Message, offset: int = 0
+    ) -> int:
+        """
+        Encode a message into a caller-supplied buffer.
+
+        Same checks and wire format as encode(), but the type header, headers,
+        body and footers are written straight into buf at offset, so a sender
+        can reuse one scratch buffer instead of allocating the joined bytes.
+
+        Args:
+            buf: Writable buffer (bytearray or writable memoryview)
+            message: Message instance to encode
+            offset: Position in buf to start writing at
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            ValueError: If message type not registered or invalid, or buf is
+                too small for the encoded message
+        """
+        self._check_encodable(message)
+        parts = self._encode_parts(message)
+        end = offset + sum(len(part) for part in parts)
+        if end > len(buf):
+            raise ValueError(
+                f"Buffer too small: need {end - offset} bytes at offset {offset}, "
+                f"have {len(buf) - offset}"
+            )
+        position = offset
+        for part in parts:
+            buf[position : position + len(part)] = part
+            position += len(part)
+        return end - offset
+
+    def _encode_unchecked(self, message: Message) -> bytes:
+        """
+        Encode a message whose registration and validity were already checked.
+
+        Serialization still fails on a field that has gone missing; this only
+        skips the up-front checks done by encode().
+        """
+        return b"".join(self._encode_parts(message))
+
+    def _encode_parts(self, message: Message) -> Tuple[bytes, bytes, bytes, bytes]:
+        """Return (type header, headers, body, footers) for a checked message."""
+        # Message type as length-prefixed UTF-8 string, built once per class
+        type_header = type(message)._type_header
 
         # Serialize message body
         message_bytes = message.serialize_bytes()
@@ -293,7 +642,7 @@ class Protocol:
                     self._footers, message, message_bytes
                 )
 
-        return type_header + header_bytes + message_bytes + footer_bytes
+        return type_header, header_bytes, message_bytes, footer_bytes
 
     def _serialize_auto_fields(
         self, fields: Dict[str, Dict[str, Any]], message: Message, message_bytes: bytes
@@ -508,6 +857,46 @@ class Protocol:
             Returns None if message is incomplete and buffered.
             remaining_data is any unused bytes after the message.
         """
+        result = self._decode_impl(data, source_id)
+        if result is None:
+            return None
+        message, data, consumed = result
+        return (message, data[consumed:])
+
+    def decode_one(
+        self, data: bytes, source_id: str = "default"
+    ) -> Optional[Union[Message, "InvalidMessage"]]:
+        """
+        Decode one message and discard any bytes that follow it.
+
+        Same as decode() but returns only the message, so the trailing data
+        is never copied out. Use it when each buffer holds one message
+        (e.g. a datagram).
+
+        Args:
+            data: Bytes to decode
+            source_id: Identifier for the message source (e.g., client address)
+
+        Returns:
+            Message instance or InvalidMessage, or None if the message is
+            incomplete and buffered.
+        """
+        result = self._decode_impl(data, source_id)
+        if result is None:
+            return None
+        return result[0]
+
+    def _decode_impl(
+        self, data: bytes, source_id: str
+    ) -> Optional[Tuple[Union[Message, "InvalidMessage"], bytes, int]]:
+        """
+        Shared body of decode() and decode_one().
+
+        Returns:
+            (message, data, consumed) where data includes any buffered prefix
+            and consumed is how many of its bytes the message used, or None if
+            the message is incomplete and buffered.
+        """
         # Prepend any buffered incomplete data for this source
         with self._buffer_lock:
             if source_id in self._incomplete_buffers:
@@ -527,7 +916,7 @@ class Protocol:
                     self._incomplete_buffers[source_id] = data
                 return None
 
-            type_length = int.from_bytes(data[0:2], "big")
+            type_length = data[0] << 8 | data[1]
 
             if len(data) < 2 + type_length:
                 # Incomplete - need more data for message type
@@ -535,28 +924,37 @@ class Protocol:
                     self._incomplete_buffers[source_id] = data
                 return None
 
-            message_type = data[2 : 2 + type_length].decode("utf-8")
-            partial_type = message_type
-
-            # Look up message class in registry
-            if message_type not in self._message_registry:
+            # Look up message class by the raw type name bytes; the name-keyed
+            # registry stays authoritative (the class name's hash is cached)
+            type_name = bytes(data[2 : 2 + type_length])
+            message_class = self._wire_registry.get(type_name)
+            if (
+                message_class is None
+                or self._message_registry.get(message_class.__name__)
+                is not message_class
+            ):
+                partial_type = type_name.decode("utf-8")
                 raise ValueError(
-                    f"Unknown message type '{message_type}'. "
+                    f"Unknown message type '{partial_type}'. "
                     f"Registered types: {list(self._message_registry.keys())}"
                 )
+            partial_type = message_class.__name__
 
-            message_class = self._message_registry[message_type]
-
-            # Get the data after the type header
-            message_data = data[2 + type_length :]
+            # Get the data after the type header; slices of the view copy nothing
+            message_data = memoryview(data)[2 + type_length :]
 
             # Calculate header size (if any headers configured)
             header_size = 0
             with self._header_lock:
                 if self._headers:
-                    header_size = self._calculate_auto_fields_size(
-                        self._headers, message_class
-                    )
+                    # Fixed by the header specs alone; computed once per set_headers
+                    header_size = self._header_size
+                    if header_size is None:
+                        header_size = self._header_size = (
+                            self._calculate_auto_fields_size(
+                                self._headers, message_class
+                            )
+                        )
 
             # Check if we have enough data for headers
             if len(message_data) < header_size:
@@ -567,6 +965,9 @@ class Protocol:
             # Skip headers for now - we'll validate them after deserializing the message
             message_body_start = header_size
             message_data_body = message_data[message_body_start:]
+            if message_class._custom_serialization:
+                # Overridden deserialize_bytes may expect real bytes
+                message_data_body = bytes(message_data_body)
 
             # Deserialize message body
             try:
@@ -587,9 +988,14 @@ class Protocol:
             footer_size = 0
             with self._footer_lock:
                 if self._footers:
-                    footer_size = self._calculate_auto_fields_size(
-                        self._footers, message_class
-                    )
+                    # Fixed by the footer specs alone; computed once per set_footers
+                    footer_size = self._footer_size
+                    if footer_size is None:
+                        footer_size = self._footer_size = (
+                            self._calculate_auto_fields_size(
+                                self._footers, message_class
+                            )
+                        )
 
             # Check if we have enough data for footers
             footer_start = message_body_start + body_bytes_consumed
@@ -600,7 +1006,7 @@ class Protocol:
 
             # Validate headers (if any)
             if header_size > 0:
-                header_data = message_data[0:header_size]
+                header_data = bytes(message_data[0:header_size])
                 with self._header_lock:
                     self._validate_auto_fields(
                         self._headers, header_data, message, message_class
@@ -608,7 +1014,9 @@ class Protocol:
 
             # Validate footers (if any)
             if footer_size > 0:
-                footer_data = message_data[footer_start : footer_start + footer_size]
+                footer_data = bytes(
+                    message_data[footer_start : footer_start + footer_size]
+                )
                 with self._footer_lock:
                     self._validate_auto_fields(
                         self._footers, footer_data, message, message_class
@@ -618,9 +1026,7 @@ class Protocol:
             total_consumed = (
                 2 + type_length + header_size + body_bytes_consumed + footer_size
             )
-            remaining = data[total_consumed:]
-
-            return (message, remaining)
+            return (message, data, total_consumed)
 
         except Exception as e:
             # Failed to decode - wrap in InvalidMessage
@@ -632,7 +1038,7 @@ class Protocol:
             )
             # Return the invalid message with all remaining data
             # Caller can decide what to do with it
-            return (invalid_msg, b"")
+            return (invalid_msg, data, len(data))
 
     def _calculate_auto_fields_size(
         self, fields: Dict[str, Dict[str, Any]], message_class: Type[Message]
@@ -796,8 +1202,13 @@ class Protocol:
         """
         field_type = field_spec.get("type")
 
-        # For sized integer types
         if isinstance(field_type, str):
+            # Common fixed-size types use a Struct compiled once per type string
+            codec = _auto_field_struct(field_type, byteorder)
+            if codec is not None:
+                return codec.unpack_from(data)[0], codec.size
+
+            # Other integer widths
             if field_type.startswith("uint("):
                 size_bits = int(field_type.split("(")[1].split(")")[0])
                 size_bytes = size_bits // 8
@@ -808,21 +1219,6 @@ class Protocol:
                 size_bytes = size_bits // 8
                 value = int.from_bytes(data[:size_bytes], byteorder, signed=True)
                 return value, size_bytes
-            elif field_type == "float":
-                import struct
-
-                fmt = "<f" if byteorder == "little" else ">f"
-                value = struct.unpack(fmt, data[:4])[0]
-                return value, 4
-            elif field_type == "double":
-                import struct
-
-                fmt = "<d" if byteorder == "little" else ">d"
-                value = struct.unpack(fmt, data[:8])[0]
-                return value, 8
-            elif field_type == "bool":
-                value = bool(data[0])
-                return value, 1
 
         # Custom encoder
         if "encoder" in field_spec:
@@ -846,11 +1242,7 @@ class Protocol:
         Note: This version returns only the message (not remaining data)
         and uses a default source_id. For better control, use decode() directly.
         """
-        result = self.decode(data, source_id="default")
-        if result is None:
-            return None
-        message, _ = result
-        return message
+        return self.decode_one(data, source_id="default")
 
     def clear_incomplete_buffer(self, source_id: str = "default") -> bool:
         """
@@ -906,14 +1298,22 @@ class Protocol:
         Returns:
             True if valid, False otherwise
         """
+        message_class = type(message)
+        # Nothing to check: every field is optional and validate() is the stock one
+        if (
+            not message_class._required_fields
+            and message_class.validate is Message.validate
+        ):
+            return True
         return message.validate()
 
     def schedule_message(
         self,
         msg: Message,
         interval: float,
-        send_callback: Callable[[bytes], None],
+        send_callback: Optional[Callable[[bytes], None]] = None,
         update_callback: Optional[Callable[[Message], None]] = None,
+        sink: Optional[bytearray] = None,
     ) -> int:
         """
         Schedule a message to be sent automatically at regular intervals.
@@ -925,13 +1325,21 @@ class Protocol:
                           (e.g., socket.sendall, transport.send, etc.)
             update_callback: Optional function that updates the message before
                            each send. Called with the message instance and should
-                           modify it in place (e.g., update timestamp, increment counter)
+                           modify it in place (e.g., update timestamp, increment counter).
+                           Without it the message is encoded once and the same bytes
+                           are sent every interval, so later changes to msg are not
+                           picked up.
+            sink: Optional bytearray to append each encoded message to instead
+                 of calling send_callback (pass one or the other). Appends run
+                 under the protocol's sink lock; read and clear the buffer with
+                 drain_sink() so no message is lost to a concurrent append.
 
         Returns:
             Schedule ID that can be used to cancel the scheduled message
 
         Raises:
-            ValueError: If interval is not positive or message is invalid
+            ValueError: If interval is not positive, message is invalid, or not
+                       exactly one of send_callback and sink is given
 
         Example:
             def send_func(data):
@@ -957,45 +1365,75 @@ class Protocol:
         if not self.validate_message(msg):
             raise ValueError("Cannot schedule invalid message")
 
-        with self._schedule_lock:
-            schedule_id = self._next_schedule_id
-            self._next_schedule_id += 1
+        if sink is not None:
+            if send_callback is not None:
+                raise ValueError("Pass either send_callback or sink, not both")
+            send_callback = functools.partial(self._append_to_sink, sink)
+        elif send_callback is None:
+            raise ValueError("A send_callback or sink is required")
+
+        # Counter increments and dict stores are atomic, so producers need no lock
+        schedule_id = next(self._schedule_ids)
+        entry = _ScheduledMessage(
+            schedule_id, msg, interval, send_callback, update_callback
+        )
+        self._scheduled_messages[schedule_id] = entry
 
-            # Create stop event for this scheduled message
-            stop_event = threading.Event()
+        self._scheduler.add(entry)
+        return schedule_id
 
-            # Define the worker function that runs in a thread
-            def worker():
-                while not stop_event.is_set():
-                    try:
-                        # Update message if callback provided
-                        if update_callback is not None:
-                            update_callback(msg)
-
-                        # Encode and send
-                        encoded_data = self.encode(msg)
-                        send_callback(encoded_data)
-                    except Exception as e:
-                        print(f"Error sending scheduled message: {e}")
-
-                    # Wait for interval or until stop is signaled
-                    stop_event.wait(interval)
-
-            # Start the worker thread
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
-
-            # Store schedule info
-            self._scheduled_messages[schedule_id] = {
-                "thread": thread,
-                "stop_event": stop_event,
-                "message": msg,
-                "interval": interval,
-                "callback": send_callback,
-                "update_callback": update_callback,
-            }
+    def _append_to_sink(self, sink: bytearray, data: bytes) -> None:
+        """Send callback used for schedules that write into a sink buffer."""
+        with self._sink_lock:
+            sink.extend(data)
 
-            return schedule_id
+    def drain_sink(self, sink: bytearray) -> bytes:
+        """
+        Take everything scheduled sends have appended to a sink buffer.
+
+        Args:
+            sink: bytearray passed as ``sink`` to schedule_message()
+
+        Returns:
+            The buffered bytes; the sink is left empty
+        """
+        with self._sink_lock:
+            data = bytes(sink)
+            del sink[:]
+        return data
+
+    def _send_scheduled(self, entry: _ScheduledMessage) -> None:
+        """Update, encode and send one scheduled message."""
+        try:
+            # Update message if callback provided, then encode and send
+            if entry.update_callback is not None:
+                entry.update_callback(entry.message)
+                if entry.validated:
+                    encoded_data = self._encode_unchecked(entry.message)
+                else:
+                    encoded_data = self.encode(entry.message)
+                    entry.validated = True
+            elif self._computed_auto_fields:
+                # compute headers/footers may differ per send (e.g. a clock)
+                encoded_data = self.encode(entry.message)
+            else:
+                # Nothing changes the message between sends; encode it once
+                encoded_data = entry.cached_bytes
+                if encoded_data is None:
+                    encoded_data = entry.cached_bytes = self.encode(entry.message)
+
+            entry.send_callback(encoded_data)
+        except Exception as e:
+            print(f"Error sending scheduled message: {e}")
+
+    def _invalidate_scheduled_bytes(self) -> None:
+        """Drop the cached encodings of scheduled messages after header/footer changes."""
+        self._computed_auto_fields = any(
+            "compute" in spec
+            for spec in (*self._headers.values(), *self._footers.values())
+        )
+        for entry in list(self._scheduled_messages.values()):
+            entry.cached_bytes = None
 
     def cancel_scheduled_message(self, schedule_id: int) -> bool:
         """
@@ -1007,41 +1445,31 @@ class Protocol:
         Returns:
             True if message was cancelled, False if schedule_id not found
         """
-        with self._schedule_lock:
-            if schedule_id not in self._scheduled_messages:
-                return False
+        entry = self._scheduled_messages.pop(schedule_id, None)
 
-            schedule_info = self._scheduled_messages[schedule_id]
-            schedule_info["stop_event"].set()
-
-            # Wait for thread to finish (with timeout)
-            schedule_info["thread"].join(timeout=1.0)
+        if entry is None:
+            return False
 
-            del self._scheduled_messages[schedule_id]
-            return True
+        self._scheduler.cancel(entry)
+        return True
 
     def cancel_all_scheduled_messages(self):
         """Cancel all scheduled messages."""
-        with self._schedule_lock:
-            schedule_ids = list(self._scheduled_messages.keys())
-
-        for schedule_id in schedule_ids:
+        for schedule_id in list(self._scheduled_messages):
             self.cancel_scheduled_message(schedule_id)
 
-    def get_scheduled_messages(self) -> Dict[int, Dict[str, Any]]:
+    def get_scheduled_messages(self) -> Mapping[int, Dict[str, Any]]:
         """
         Get information about currently scheduled messages.
 
         Returns:
-            Dictionary mapping schedule IDs to info dicts containing:
+            Read-only mapping of schedule IDs to info dicts containing:
             - message: The Message instance
             - interval: The send interval in seconds
+            The mapping is live: it reflects later schedules and cancellations.
+            Copy it with dict() for a snapshot.
         """
-        with self._schedule_lock:
-            return {
-                sid: {"message": info["message"], "interval": info["interval"]}
-                for sid, info in self._scheduled_messages.items()
-            }
+        return self._scheduled_view
 
     def register_auto_reply(
         self,
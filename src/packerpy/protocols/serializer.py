@@ -1,10 +1,124 @@
 """Serialization implementation for BYTES and JSON formats."""
 
 import json
-from typing import Optional, Dict, Any
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator: pip install packerpy[orjson]
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional backend: pip install packerpy[msgspec]
+    msgspec = None
 
 from packerpy.protocols.message import Message
 
+# Decode failures are expected on untrusted input; they are logged, not printed,
+# so a flood of malformed packets costs nothing unless warnings are enabled.
+_log = logging.getLogger(__name__)
+
+# A serialized message is always a JSON object; anything else is rejected
+# before the parser runs (JSON whitespace is space, tab, LF and CR).
+_JSON_OBJECT_START = re.compile(rb"[ \t\n\r]*\{")
+_JSON_OBJECT_START_STR = re.compile(r"[ \t\n\r]*\{")
+
+# orjson parses integers that do not fit 64 bits as floats. Any such integer
+# has at least 20 digits, so input with a 20-digit run is parsed by the stdlib
+# instead (a long string or fraction may trigger this too, which is harmless).
+_LONG_DIGIT_RUN = re.compile(rb"\d{20}")
+_LONG_DIGIT_RUN_STR = re.compile(r"\d{20}")
+
+
+@lru_cache(maxsize=None)
+def _stdlib_encoder(ensure_ascii: bool, indent: Optional[int]) -> json.JSONEncoder:
+    """
+    Return a shared JSONEncoder for the given options.
+
+    json.dumps builds a new encoder on every call unless all options are
+    left at their defaults; encoders are stateless, so one per option set
+    is reused by every JSONSerializer.
+    """
+    return json.JSONEncoder(ensure_ascii=ensure_ascii, indent=indent)
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON text with orjson when it is installed and safe, else the stdlib.
+
+    Input that may hold integers wider than 64 bits, or that orjson rejects
+    (such as the NaN and Infinity tokens the stdlib writes), is parsed by the
+    stdlib, which keeps wide integers exact and accepts those tokens.
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGIT_RUN_STR if isinstance(data, str) else _LONG_DIGIT_RUN
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    if isinstance(data, str):
+        return json.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Return True if value holds a NaN or infinite float at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+# Field spec keys and types a msgspec Struct can mirror exactly.
+_MSGSPEC_SPEC_KEYS = frozenset({"type", "static", "intern"})
+_MSGSPEC_TYPES = {"float": float, "double": float, "bool": bool, "str": str}
+
+
+def _msgspec_field_type(field_type: Any) -> Optional[type]:
+    """Map a scalar field type string to a Python type, or None."""
+    if not isinstance(field_type, str):
+        return None
+    if field_type.startswith(("int", "uint")):
+        return int
+    return _MSGSPEC_TYPES.get(field_type)
+
+
+@lru_cache(maxsize=None)
+def _msgspec_struct(message_class: type) -> Optional[Tuple[type, Any]]:
+    """
+    Return a msgspec Struct mirroring a class's fields and its decoder, or None.
+
+    Only classes made entirely of scalar fields (ints, floats, bools and
+    strings) get a Struct; anything else keeps the dict-based path. Fields
+    accept null (unset partial fields serialize as None) and default to
+    UNSET so absent keys stay absent, as with from_dict.
+    """
+    fields = getattr(message_class, "fields", None)
+    if not fields or "type" in fields:
+        return None
+    struct_fields = [("type", str, message_class.__name__)]
+    for name, spec in fields.items():
+        field_type = _msgspec_field_type(spec.get("type"))
+        if field_type is None or not spec.keys() <= _MSGSPEC_SPEC_KEYS:
+            return None
+        struct_fields.append(
+            (name, Union[field_type, None, msgspec.UnsetType], msgspec.UNSET)
+        )
+    try:
+        struct_cls = msgspec.defstruct(message_class.__name__, struct_fields)
+    except (TypeError, ValueError):  # e.g. field names msgspec rejects
+        return None
+    return struct_cls, msgspec.json.Decoder(struct_cls)
+
 
 class BytesSerializer:
     """
@@ -35,7 +149,7 @@ class BytesSerializer:
                 message, bytes_consumed = Message.deserialize_bytes(data)
             return message
         except Exception as e:
-            print(f"Bytes deserialization failed: {e}")
+            _log.warning("Bytes deserialization failed: %s", e)
             return None
 
 
@@ -44,6 +158,14 @@ class JSONSerializer:
     JSON serializer for human-readable message serialization.
 
     Provides text-based encoding/decoding with UTF-8.
+    Uses orjson when it is installed and falls back to the stdlib json
+    module otherwise (and for ensure_ascii or indents other than 2, which
+    orjson does not support).
+
+    With backend="msgspec", classes made only of scalar fields are encoded
+    from and decoded into a msgspec Struct generated from their ``fields``,
+    so no intermediate dict is built. Values are then type-checked against
+    the schema, and a mismatch fails deserialization.
     Less efficient than binary but useful for:
     - Debugging and logging
     - Web APIs and REST interfaces
@@ -63,16 +185,85 @@ class JSONSerializer:
         json_str = serializer.serialize_to_string(message, indent=2)
     """
 
-    def __init__(self, ensure_ascii: bool = False, indent: Optional[int] = None):
+    def __init__(
+        self,
+        ensure_ascii: bool = False,
+        indent: Optional[int] = None,
+        backend: Optional[str] = None,
+    ):
         """
         Initialize JSON serializer.
 
         Args:
             ensure_ascii: If True, escape non-ASCII characters. Default False for better readability.
             indent: Pretty-print indentation. None for compact output.
+            backend: None for orjson/stdlib json, or "msgspec" for schema-typed
+                     encoding and decoding (requires the msgspec package).
         """
+        if backend not in (None, "msgspec"):
+            raise ValueError(f"Unknown JSON backend: {backend!r}")
+        if backend == "msgspec" and msgspec is None:
+            raise ImportError("backend='msgspec' requires the msgspec package")
         self.ensure_ascii = ensure_ascii
         self.indent = indent
+        self.backend = backend
+
+    def _struct_for(self, message_class: type) -> Optional[Tuple[type, Any]]:
+        """Return the msgspec Struct and decoder to use for message_class."""
+        if self.backend != "msgspec":
+            return None
+        return _msgspec_struct(message_class)
+
+    def _encode_struct(
+        self, message: Message, indent: Optional[int]
+    ) -> Optional[bytes]:
+        """Encode message through its msgspec Struct, or return None."""
+        if self.ensure_ascii or indent is not None:
+            return None
+        schema = self._struct_for(type(message))
+        if schema is None:
+            return None
+        struct_cls, _ = schema
+        values = {
+            name: getattr(message, name, msgspec.UNSET) for name in message.fields
+        }
+        try:
+            return msgspec.json.encode(struct_cls(**values))
+        except (TypeError, OverflowError, msgspec.EncodeError):
+            return None
+
+    def _load(self, data: Union[bytes, str], message_class: type) -> Message:
+        """Parse JSON data and build a message_class instance."""
+        schema = self._struct_for(message_class)
+        if schema is not None:
+            decoded = schema[1].decode(data)
+            unset = msgspec.UNSET
+            return message_class(
+                **{
+                    name: value
+                    for name in message_class.fields
+                    if (value := getattr(decoded, name)) is not unset
+                }
+            )
+        return message_class.from_dict(_loads(data), for_json=True)
+
+    def _dumps(self, data_dict: Dict[str, Any], indent: Optional[int]) -> bytes:
+        """Encode a dictionary to UTF-8 JSON bytes."""
+        if orjson is not None and not self.ensure_ascii and indent in (None, 2):
+            try:
+                encoded = orjson.dumps(
+                    data_dict, option=orjson.OPT_INDENT_2 if indent else 0
+                )
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits; the stdlib handles them
+                pass
+            else:
+                # orjson writes NaN and infinities as null; the stdlib keeps
+                # them as NaN/Infinity so they round-trip
+                if b"null" not in encoded or not _has_non_finite(data_dict):
+                    return encoded
+        json_str = _stdlib_encoder(self.ensure_ascii, indent).encode(data_dict)
+        return json_str.encode("utf-8")
 
     def serialize(self, message: Message) -> bytes:
         """
@@ -84,11 +275,10 @@ class JSONSerializer:
         Returns:
             UTF-8 encoded JSON bytes
         """
-        data_dict = message.to_dict()
-        json_str = json.dumps(
-            data_dict, ensure_ascii=self.ensure_ascii, indent=self.indent
-        )
-        return json_str.encode("utf-8")
+        encoded = self._encode_struct(message, self.indent)
+        if encoded is not None:
+            return encoded
+        return self._dumps(message.to_dict(for_json=True), self.indent)
 
     def serialize_to_string(
         self, message: Message, indent: Optional[int] = None
@@ -105,9 +295,11 @@ class JSONSerializer:
         Returns:
             JSON string
         """
-        data_dict = message.to_dict()
         use_indent = indent if indent is not None else self.indent
-        return json.dumps(data_dict, ensure_ascii=self.ensure_ascii, indent=use_indent)
+        encoded = self._encode_struct(message, use_indent)
+        if encoded is None:
+            encoded = self._dumps(message.to_dict(for_json=True), use_indent)
+        return encoded.decode("utf-8")
 
     def deserialize(self, data: bytes, message_class: type) -> Optional[Message]:
         """
@@ -121,11 +313,15 @@ class JSONSerializer:
             Message instance or None if deserialization fails
         """
         try:
-            json_str = data.decode("utf-8")
-            data_dict = json.loads(json_str)
-            return message_class.from_dict(data_dict)
+            object_start = (
+                _JSON_OBJECT_START_STR if isinstance(data, str) else _JSON_OBJECT_START
+            )
+            if object_start.match(data) is None:
+                _log.warning("JSON deserialization failed: expected a JSON object")
+                return None
+            return self._load(data, message_class)
         except Exception as e:
-            print(f"JSON deserialization failed: {e}")
+            _log.warning("JSON deserialization failed: %s", e)
             return None
 
     def deserialize_from_string(
@@ -141,9 +337,11 @@ class JSONSerializer:
         Returns:
             Message instance or None if deserialization fails
         """
+        if _JSON_OBJECT_START_STR.match(json_str) is None:
+            _log.warning("JSON deserialization failed: expected a JSON object")
+            return None
         try:
-            data_dict = json.loads(json_str)
-            return message_class.from_dict(data_dict)
+            return self._load(json_str, message_class)
         except Exception as e:
-            print(f"JSON deserialization failed: {e}")
+            _log.warning("JSON deserialization failed: %s", e)
             return None
@@ -1,15 +1,25 @@
 """Server implementation with protocol support."""
 
 import asyncio
+import logging
 import threading
+from collections import deque
+from concurrent.futures import Executor, Future
 from enum import Enum
-from queue import Queue, Empty
 from typing import Callable, Optional, Tuple, Union
 
 from packerpy.protocols.protocol import Protocol, InvalidMessage
 from packerpy.protocols.message import Message
 from packerpy.transports.tcp.async_server import AsyncTCPServer
 
+_log = logging.getLogger(__name__)
+
+
+def _wake_waiter(waiter: "asyncio.Future[None]") -> None:
+    """Resolve a receive_async() waiter unless it was already cancelled."""
+    if not waiter.done():
+        waiter.set_result(None)
+
 
 class ConnectionStatus(Enum):
     """Server connection status."""
@@ -26,7 +36,8 @@ class Server:
     High-level server that uses the Protocol for message handling.
 
     This server abstracts away transport details and provides a clean
-    interface for working with Message objects. Async servers run in a separate thread.
+    interface for working with Message objects. Started from a running event
+    loop it serves on that loop; otherwise it runs in a background thread.
     """
 
     def __init__(
@@ -53,13 +64,48 @@ class Server:
         self.port = port
         self.protocol = protocol if protocol is not None else Protocol()
         self.message_handler = message_handler
-        self._received_messages: Queue = Queue()
+        # Filled by the transport callback on the serving loop, which may be a
+        # background thread's. The condition wakes a blocking receive();
+        # futures in _receive_waiters wake receive_async() on their own loops
+        self._received_messages: deque = deque()
+        self._message_ready = threading.Condition()
+        self._receive_waiters: deque = deque()
         self._status = ConnectionStatus.STOPPED
         self._server_thread: Optional[threading.Thread] = None
+        self._server_future: Optional[Future] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
         self._transport: Optional[AsyncTCPServer] = None
         self._error: Optional[Exception] = None
 
+    def _queue_message(
+        self, item: Tuple[Union[Message, InvalidMessage], Tuple[str, int]]
+    ) -> None:
+        """Append a (message, address) pair and wake any waiting receive."""
+        with self._message_ready:
+            self._received_messages.append(item)
+            self._message_ready.notify()
+        waiters = self._receive_waiters
+        if waiters:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            while waiters:
+                try:
+                    waiter = waiters.popleft()
+                except IndexError:
+                    break
+                loop = waiter.get_loop()
+                if loop is running:
+                    _wake_waiter(waiter)
+                else:
+                    try:
+                        loop.call_soon_threadsafe(_wake_waiter, waiter)
+                    except RuntimeError:
+                        # The waiting loop has closed; nobody is left to wake
+                        pass
+
     def _handle_raw_data(
         self, data: bytes, address: Tuple[str, int]
     ) -> Optional[bytes]:
@@ -87,8 +133,12 @@ class Server:
         # Handle InvalidMessage
         if isinstance(message, InvalidMessage):
             # Store invalid message in queue for user to inspect
-            self._received_messages.put((message, address))
-            print(f"Invalid message from {address}: {message.error.__class__.__name__}")
+            self._queue_message((message, address))
+            _log.warning(
+                "Invalid message from %s: %s",
+                address,
+                message.error.__class__.__name__,
+            )
             # Clear buffer on invalid message to avoid corruption
             self.protocol.clear_incomplete_buffer(source_id)
             return None
@@ -101,20 +151,20 @@ class Server:
                 error=ValueError("Message validation failed"),
                 partial_type=message.__class__.__name__,
             )
-            self._received_messages.put((invalid_msg, address))
+            self._queue_message((invalid_msg, address))
             return None
 
         # Clear incomplete buffer on successful decode
         self.protocol.clear_incomplete_buffer(source_id)
 
         # Store received message in queue for user to consume
-        self._received_messages.put((message, address))
+        self._queue_message((message, address))
 
         # Check auto-replies for this message (only for valid messages)
         try:
             self.protocol.check_auto_replies(message)
         except Exception as reply_error:
-            print(f"Auto-reply error: {reply_error}")
+            _log.warning("Auto-reply error: %s", reply_error)
 
         # Call handler if provided and return response if any
         if self.message_handler:
@@ -124,19 +174,24 @@ class Server:
 
         return None
 
-    def _run_async_server(self) -> None:
-        """Run the async server in a separate thread."""
+    async def serve(self) -> None:
+        """
+        Run the server on the current event loop until cancelled.
+
+        This is the coroutine behind both start modes: start() schedules it
+        as a task on a running loop, start_in_thread() runs it on a private
+        loop in a background thread.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
         try:
             self._status = ConnectionStatus.STARTING
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-
             self._transport = AsyncTCPServer(
                 host=self.host, port=self.port, handler=self._handle_raw_data
             )
 
             self._status = ConnectionStatus.RUNNING
-            self._loop.run_until_complete(self._transport.start())
+            await self._transport.start()
         except asyncio.CancelledError:
             # Normal shutdown - don't print error
             pass
@@ -145,43 +200,86 @@ class Server:
             self._error = e
             print(f"Server error: {e}")
         finally:
-            if self._loop and not self._loop.is_closed():
-                # Cancel all pending tasks before closing the loop
-                try:
-                    pending = asyncio.all_tasks(self._loop)
-                    for task in pending:
-                        task.cancel()
-                    # Give tasks a chance to handle cancellation
-                    self._loop.run_until_complete(
-                        asyncio.gather(*pending, return_exceptions=True)
-                    )
-                except Exception:
-                    pass
-                self._loop.close()
             self._status = ConnectionStatus.STOPPED
 
-    def start(self) -> None:
-        """Start the server. Runs in a background thread for async mode."""
-        self._server_thread = threading.Thread(
-            target=self._run_async_server, daemon=True
-        )
-        self._server_thread.start()
+    def _run_in_thread(self) -> None:
+        """Run serve() on a private event loop (background thread target)."""
+        asyncio.run(self.serve())
+
+    def start(self) -> Optional["asyncio.Task[None]"]:
+        """
+        Start the server.
+
+        When called from a running event loop the server is scheduled on that
+        loop and the serving task is returned. Otherwise it falls back to
+        start_in_thread().
+
+        Returns:
+            The serving task when started on a running loop, else None
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.start_in_thread()
+            return None
+
+        self._loop = loop
+        self._task = loop.create_task(self.serve())
         print(f"Server starting on {self.host}:{self.port}")
+        return self._task
 
-    def stop(self) -> None:
-        """Stop the server."""
-        self._status = ConnectionStatus.STOPPING
-        if self._loop and self._transport:
-            # Stop the server in its event loop
-            future = asyncio.run_coroutine_threadsafe(
-                self._transport.stop(), self._loop
+    def start_in_thread(self, executor: Optional[Executor] = None) -> None:
+        """
+        Start the server on its own event loop in a background thread.
+
+        Args:
+            executor: Optional executor to run the server on. Applications
+                     that start and stop servers often can pass a shared
+                     thread pool to reuse its workers; by default a new daemon
+                     thread is started. Pool threads are not daemons, so
+                     servers run on one must be stopped before exit.
+        """
+        if executor is not None:
+            self._server_future = executor.submit(self._run_in_thread)
+        else:
+            self._server_thread = threading.Thread(
+                target=self._run_in_thread, daemon=True
             )
-            try:
-                future.result(timeout=5.0)
-            except Exception:
-                pass
-        if self._server_thread:
-            self._server_thread.join(timeout=5.0)
+            self._server_thread.start()
+        print(f"Server starting on {self.host}:{self.port}")
+
+    def stop(self) -> Optional["asyncio.Task[None]"]:
+        """
+        Stop the server.
+
+        In threaded mode this blocks until the server thread (or executor
+        job) exits. When the
+        server runs on the caller's loop the serving task is cancelled and
+        returned, so ``await server.stop()`` waits for shutdown to finish.
+
+        Returns:
+            The cancelled serving task when running on the caller's loop, else None
+        """
+        self._status = ConnectionStatus.STOPPING
+        task = self._task
+        if self._server_thread is not None or self._server_future is not None:
+            if task is not None and self._loop is not None:
+                try:
+                    self._loop.call_soon_threadsafe(task.cancel)
+                except RuntimeError:
+                    # Loop already closed - server thread is exiting
+                    pass
+            if self._server_thread is not None:
+                self._server_thread.join(timeout=5.0)
+            else:
+                try:
+                    self._server_future.result(timeout=5.0)
+                except Exception:
+                    pass
+            return None
+        if task is not None:
+            task.cancel()
+        return task
 
     def get_status(self) -> ConnectionStatus:
         """
@@ -207,19 +305,64 @@ class Server:
         """
         Receive a message from the queue.
 
+        Blocks the calling thread, so use it with a server running in a
+        background thread; on the server's own loop use receive_async().
+
+        Args:
+            timeout: Maximum time to wait for a message (None = wait forever, 0 = non-blocking)
+
+        Returns:
+            Tuple of (Message or InvalidMessage, sender_address) or None if no message available
+        """
+        messages = self._received_messages
+        with self._message_ready:
+            if not messages and timeout != 0:
+                self._message_ready.wait_for(lambda: messages, timeout)
+            return messages.popleft() if messages else None
+
+    async def receive_async(
+        self, timeout: Optional[float] = None
+    ) -> Optional[Tuple[Union[Message, InvalidMessage], Tuple[str, int]]]:
+        """
+        Receive a message from the queue without blocking the event loop.
+
+        Works from any loop, whether the server serves on it or on a
+        background thread's loop.
+
         Args:
             timeout: Maximum time to wait for a message (None = wait forever, 0 = non-blocking)
 
         Returns:
             Tuple of (Message or InvalidMessage, sender_address) or None if no message available
         """
+        messages = self._received_messages
+        if not messages and timeout != 0:
+            try:
+                await asyncio.wait_for(self._wait_for_message(), timeout)
+            except asyncio.TimeoutError:
+                return None
         try:
-            return self._received_messages.get(
-                timeout=timeout if timeout is not None else None
-            )
-        except Empty:
+            return messages.popleft()
+        except IndexError:
             return None
 
+    async def _wait_for_message(self) -> None:
+        """Wait until the receive deque is non-empty."""
+        loop = asyncio.get_running_loop()
+        while not self._received_messages:
+            waiter = loop.create_future()
+            self._receive_waiters.append(waiter)
+            try:
+                # Re-check after registering: a message queued between the
+                # loop test and the append would not have seen this waiter
+                if not self._received_messages:
+                    await waiter
+            finally:
+                try:
+                    self._receive_waiters.remove(waiter)
+                except ValueError:
+                    pass
+
     def send(self, message: Union[Message, bytes], address: Tuple[str, int]) -> bool:
         """
         Send a message to a specific address.
@@ -241,12 +384,12 @@ class Server:
         else:
             # Handle Message object
             if not self.protocol.validate_message(message):
-                print("Invalid message, cannot send")
+                _log.warning("Invalid message, cannot send")
                 return False
 
         # This is a simplified implementation
         # In a real TCP server, you'd need to maintain client connections
-        print("Warning: Direct send() on server requires connection management")
+        _log.warning("Direct send() on server requires connection management")
         return False
 
     def register_auto_reply(
@@ -1,7 +1,7 @@
 """Asynchronous TCP client implementation."""
 
 import asyncio
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 
 class AsyncTCPClient:
@@ -41,6 +41,24 @@ class AsyncTCPClient:
         self.writer.write(data)
         await self.writer.drain()
 
+    async def send_many(self, chunks: Iterable[bytes]) -> None:
+        """
+        Send several chunks to server with a single drain.
+        
+        The chunks are handed to the transport together, so small messages
+        are coalesced into as few writes as the kernel allows.
+        
+        Args:
+            chunks: Byte strings to send, in order
+            
+        Raises:
+            ConnectionError: If not connected
+        """
+        if not self.writer:
+            raise ConnectionError("Not connected")
+        self.writer.writelines(chunks)
+        await self.writer.drain()
+
     async def receive(self, buffer_size: int = 4096) -> bytes:
         """
         Receive data from server.
@@ -58,6 +76,35 @@ class AsyncTCPClient:
             raise ConnectionError("Not connected")
         return await self.reader.read(buffer_size)
 
+    async def receive_framed(
+        self, header_size: int, body_len_fn: Callable[[bytes], int]
+    ) -> bytes:
+        """
+        Receive exactly one frame from server.
+        
+        Reads a fixed-size header, asks body_len_fn how long the body is and
+        reads exactly that many bytes, so the caller never sees a partial
+        frame and does not reassemble reads itself.
+        
+        Args:
+            header_size: Size of the frame header in bytes
+            body_len_fn: Returns the body length given the header bytes
+            
+        Returns:
+            Header and body bytes of the frame
+            
+        Raises:
+            ConnectionError: If not connected
+            asyncio.IncompleteReadError: If the connection closes mid-frame
+        """
+        if not self.reader:
+            raise ConnectionError("Not connected")
+        header = await self.reader.readexactly(header_size)
+        body_size = body_len_fn(header)
+        if not body_size:
+            return header
+        return header + await self.reader.readexactly(body_size)
+
     async def close(self) -> None:
         """Close connection."""
         if self.writer:
@@ -1,14 +1,41 @@
 """Asynchronous TCP server implementation."""
 
 import asyncio
-from typing import Callable, Optional
+from concurrent.futures import Executor
+from typing import BinaryIO, Callable, Optional, Union
 
 
 class AsyncTCPServer:
     """Asynchronous TCP server using asyncio."""
 
+    __slots__ = (
+        "host",
+        "port",
+        "handler",
+        "executor",
+        "buffer_size",
+        "header_size",
+        "body_len_fn",
+        "reuse_port",
+        "backlog",
+        "write_buffer_high",
+        "pipeline",
+        "server",
+    )
+
     def __init__(
-        self, host: str, port: int, handler: Callable[[bytes, tuple], Optional[bytes]]
+        self,
+        host: str,
+        port: int,
+        handler: Callable[[bytes, tuple], Optional[Union[bytes, BinaryIO]]],
+        executor: Optional[Executor] = None,
+        buffer_size: int = 65536,
+        header_size: int = 0,
+        body_len_fn: Optional[Callable[[bytes], int]] = None,
+        reuse_port: bool = False,
+        backlog: int = 1024,
+        write_buffer_high: int = 256 * 1024,
+        pipeline: bool = False,
     ):
         """
         Initialize async TCP server.
@@ -16,18 +43,60 @@ class AsyncTCPServer:
         Args:
             host: Bind hostname or IP
             port: Bind port
-            handler: Async callback function to handle client requests.
-                    Returns bytes to send back, or None if no response needed.
+            handler: Callback function to handle client requests, plain or
+                    coroutine. Returns bytes to send back, a binary file
+                    object to stream back with loop.sendfile() (closed once
+                    sent), or None if no response needed.
+            executor: Optional executor that runs a plain handler off the
+                    event loop, for blocking or CPU-bound handlers. A process
+                    pool needs a picklable handler. By default the handler
+                    runs inline on the loop.
+            buffer_size: Maximum bytes read from a client per request when
+                    no framing is configured
+            header_size: Size of a frame header in bytes, used with
+                    body_len_fn
+            body_len_fn: Returns the body length given the header bytes.
+                    When set, each request is read as exactly one frame,
+                    like AsyncTCPClient.receive_framed, so requests are
+                    never truncated or merged
+            reuse_port: Set SO_REUSEPORT so several processes can bind the
+                    same address and the kernel spreads accepts across them
+            backlog: Pending connections the kernel queues before refusing
+                    new ones (capped by the system's somaxconn)
+            write_buffer_high: High-water mark for each connection's write
+                    buffer. A reply is only drained when it leaves more than
+                    this many bytes queued, bounding memory per slow client
+            pipeline: Keep serving requests on a connection until the client
+                    closes its side, instead of closing after the first
+                    reply. Off by default, since peers that read a reply
+                    until EOF would otherwise have to half-close first
         """
         self.host = host
         self.port = port
         self.handler = handler
+        self.executor = executor
+        self.buffer_size = buffer_size
+        self.header_size = header_size
+        self.body_len_fn = body_len_fn
+        self.reuse_port = reuse_port
+        self.backlog = backlog
+        self.write_buffer_high = write_buffer_high
+        self.pipeline = pipeline
         self.server: Optional[asyncio.Server] = None
 
     async def start(self) -> None:
-        """Start the server."""
+        """
+        Start the server.
+
+        Only uses the running loop's public API, so the server also runs on
+        drop-in loops such as uvloop.
+        """
         self.server = await asyncio.start_server(
-            self._handle_client, self.host, self.port
+            self._handle_client,
+            self.host,
+            self.port,
+            reuse_port=self.reuse_port,
+            backlog=self.backlog,
         )
         print(f"Server listening on {self.host}:{self.port}")
 
@@ -40,21 +109,126 @@ class AsyncTCPServer:
         """
         Handle a client connection.
 
+        The connection is closed after the first reply unless pipelining is
+        enabled, in which case requests are served until the client closes
+        its side. Replies are only drained once the write buffer passes its
+        high-water mark; small ones are flushed by the close.
+
+        The per-request callables are bound to locals before the loop, so a
+        pipelined connection does not look them up again for every request.
+
         Args:
             reader: Stream reader for receiving data
             writer: Stream writer for sending data
         """
         try:
             address = writer.get_extra_info("peername")
-            data = await reader.read(4096)
-            if data:
-                response = self.handler(data, address)
-                if response is not None:
-                    writer.write(response)
-                    await writer.drain()
+            high = self.write_buffer_high
+            transport = writer.transport
+            transport.set_write_buffer_limits(high=high)
+            buffered = transport.get_write_buffer_size
+            write = writer.write
+            drain = writer.drain
+            read_request = self._read_request
+            call_handler = self._call_handler
+            pipeline = self.pipeline
+
+            data = await read_request(reader)
+            while data:
+                response = await call_handler(data, address)
+                if hasattr(response, "read"):
+                    await self._send_file(writer, response)
+                elif response is not None:
+                    write(response)
+                    if buffered() > high:
+                        await drain()
+                if not pipeline:
+                    break
+                data = await read_request(reader)
         finally:
             writer.close()
-            await writer.wait_closed()
+            # Shielded so a server shutdown cancelling this task mid-close
+            # still lets the close handshake finish instead of leaking the fd.
+            await asyncio.shield(writer.wait_closed())
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> bytes:
+        """
+        Read one request from the client.
+
+        Args:
+            reader: Stream reader for receiving data
+
+        Returns:
+            Request bytes, or empty bytes if the client closed first
+
+        Raises:
+            asyncio.IncompleteReadError: If the client closes mid-frame
+        """
+        if self.body_len_fn is None:
+            return await reader.read(self.buffer_size)
+        try:
+            header = await reader.readexactly(self.header_size)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise
+            return b""
+        body_size = self.body_len_fn(header)
+        if not body_size:
+            return header
+        return header + await reader.readexactly(body_size)
+
+    async def _send_file(self, writer: asyncio.StreamWriter, file: BinaryIO) -> None:
+        """
+        Stream a file response to the client and close the file.
+
+        Regular files go out with os.sendfile() where the platform has it,
+        skipping the copy through Python; other file objects fall back to
+        chunked reads and writes. Loops without loop.sendfile() (uvloop)
+        always take the chunked path, one write_buffer_high-sized chunk at
+        a time.
+
+        Args:
+            writer: Stream writer for sending data
+            file: Binary file object positioned at the data to send
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.sendfile(writer.transport, file)
+                return
+            except NotImplementedError:
+                pass
+            read = file.read
+            chunk_size = self.write_buffer_high
+            chunk = read(chunk_size)
+            while chunk:
+                writer.write(chunk)
+                await writer.drain()
+                chunk = read(chunk_size)
+        finally:
+            file.close()
+
+    async def _call_handler(
+        self, data: bytes, address: tuple
+    ) -> Optional[Union[bytes, BinaryIO]]:
+        """
+        Run the handler for one request.
+
+        Args:
+            data: Bytes received from the client
+            address: Client address
+
+        Returns:
+            The handler's response
+        """
+        if asyncio.iscoroutinefunction(self.handler):
+            return await self.handler(data, address)
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, self.handler, data, address
+            )
+        return self.handler(data, address)
 
     async def stop(self) -> None:
         """Stop the server."""
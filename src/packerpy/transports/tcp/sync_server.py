@@ -1,14 +1,34 @@
 """Synchronous TCP server implementation."""
 
+import os
+import signal
 import socket
-from typing import Callable, Optional, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
 
 
 class SyncTCPServer:
-    """Synchronous TCP server."""
+    """
+    Synchronous TCP server.
+
+    Accepted connections are handled on a thread pool, so one slow handler
+    does not hold up other clients. Each worker thread reads requests with
+    recv_into() into its own preallocated buffer, reused across connections,
+    so a burst of back-to-back messages is pulled in a single syscall
+    without allocating a fresh read buffer.
+    """
 
     def __init__(
-        self, host: str, port: int, handler: Callable[[bytes, Tuple[str, int]], bytes]
+        self,
+        host: str,
+        port: int,
+        handler: Callable[[bytes, Tuple[str, int]], bytes],
+        buffer_size: int = 65536,
+        reuse_port: bool = False,
+        backlog: int = 1024,
+        max_workers: Optional[int] = None,
+        socket_buffer_size: Optional[int] = None,
     ):
         """
         Initialize TCP server.
@@ -17,29 +37,115 @@ class SyncTCPServer:
             host: Bind hostname or IP
             port: Bind port
             handler: Callback function to handle client requests
+            buffer_size: Maximum bytes read from a client per request
+            reuse_port: Set SO_REUSEPORT so several processes can bind the
+                        same address and the kernel spreads accepts across them
+            backlog: Pending connections the kernel queues before refusing
+                     new ones (capped by the system's somaxconn)
+            max_workers: Threads handling clients concurrently; defaults to
+                         ThreadPoolExecutor's own default
+            socket_buffer_size: Kernel send/receive buffer size in bytes for
+                                client connections. Only worth setting for
+                                links whose bandwidth-delay product exceeds
+                                the OS default; setting it turns off Linux's
+                                buffer autotuning
         """
         self.host = host
         self.port = port
         self.handler = handler
+        self.buffer_size = buffer_size
+        self._local = threading.local()
+        self.reuse_port = reuse_port
+        self.backlog = backlog
+        self.max_workers = max_workers
+        self.socket_buffer_size = socket_buffer_size
         self.socket: Optional[socket.socket] = None
         self.running = False
+        self.worker_pids: List[int] = []
 
     def start(self) -> None:
-        """Start the server."""
+        """
+        Start the server.
+
+        Raises:
+            ValueError: If reuse_port is set on a platform without SO_REUSEPORT
+        """
+        self._check_reuse_port()
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        if self.socket_buffer_size:
+            # Set on the listener so accepted sockets inherit the sizes in
+            # time for the window scale in the handshake.
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer_size
+            )
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer_size
+            )
         self.socket.bind((self.host, self.port))
-        self.socket.listen(5)
+        self.socket.listen(self.backlog)
         self.running = True
         print(f"Server listening on {self.host}:{self.port}")
 
-        while self.running:
-            try:
-                client_socket, client_address = self.socket.accept()
-                self._handle_client(client_socket, client_address)
-            except Exception as e:
-                if self.running:
-                    print(f"Error handling client: {e}")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while self.running:
+                try:
+                    client_socket, client_address = self.socket.accept()
+                    future = pool.submit(
+                        self._handle_client, client_socket, client_address
+                    )
+                    future.add_done_callback(self._report_error)
+                except Exception as e:
+                    if self.running:
+                        print(f"Error handling client: {e}")
+
+    def _check_reuse_port(self) -> None:
+        """Raise ValueError if reuse_port is set but the platform lacks it."""
+        if self.reuse_port and not hasattr(socket, "SO_REUSEPORT"):
+            raise ValueError("reuse_port not supported by socket module")
+
+    def _report_error(self, future: Future) -> None:
+        """Print the error a client handler raised, if any."""
+        error = future.exception()
+        if error is not None:
+            print(f"Error handling client: {error}")
+
+    def _recv_buffer(self) -> memoryview:
+        """Return this thread's reusable receive buffer."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = memoryview(bytearray(self.buffer_size))
+        return buffer
+
+    def run_workers(self, workers: int) -> None:
+        """
+        Serve from several processes sharing the port (POSIX only).
+
+        Forks workers - 1 child processes that each run start() on their own
+        SO_REUSEPORT socket, then serves from this process as well. Child
+        pids are kept in worker_pids so stop() can terminate and reap them.
+
+        Args:
+            workers: Total number of serving processes
+
+        Raises:
+            ValueError: If the platform has no SO_REUSEPORT
+        """
+        self.reuse_port = True
+        # Checked before forking, so no child is left behind on failure
+        self._check_reuse_port()
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                self.worker_pids = []
+                try:
+                    self.start()
+                finally:
+                    os._exit(0)
+            self.worker_pids.append(pid)
+        self.start()
 
     def _handle_client(
         self, client_socket: socket.socket, client_address: Tuple[str, int]
@@ -52,8 +158,11 @@ class SyncTCPServer:
             client_address: Client address tuple
         """
         try:
-            data = client_socket.recv(4096)
-            if data:
+            buffer = self._recv_buffer()
+            received = client_socket.recv_into(buffer)
+            if received:
+                # Copy out: the handler may keep the data past the next read.
+                data = bytes(buffer[:received])
                 response = self.handler(data, client_address)
                 if response is not None:
                     client_socket.sendall(response)
@@ -61,8 +170,20 @@ class SyncTCPServer:
             client_socket.close()
 
     def stop(self) -> None:
-        """Stop the server."""
+        """Stop the server, then terminate and reap any forked workers."""
         self.running = False
+        for pid in self.worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in self.worker_pids:
+            # Collect the exit status so no zombie process is left behind
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        self.worker_pids = []
         if self.socket:
             self.socket.close()
             self.socket = None
@@ -0,0 +1,85 @@
+"""Asynchronous UDP client implementation."""
+
+import asyncio
+from typing import Optional
+
+from packerpy.transports.udp.async_socket import AsyncUDPProtocol
+
+
+class AsyncUDPClient:
+    """
+    Asynchronous UDP client using asyncio.
+
+    Mirrors AsyncTCPClient's connect/send/receive/close API over a connected
+    datagram endpoint. There is no handshake and sends are fire-and-forget,
+    which suits small, loss-tolerant messages such as heartbeats.
+    """
+
+    def __init__(self, host: str, port: int):
+        """
+        Initialize async UDP client.
+
+        Args:
+            host: Server hostname or IP
+            port: Server port
+        """
+        self.host = host
+        self.port = port
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[AsyncUDPProtocol] = None
+
+    async def connect(self) -> None:
+        """Open a datagram endpoint connected to the server."""
+        loop = asyncio.get_event_loop()
+        self.transport, self.protocol = await loop.create_datagram_endpoint(
+            lambda: AsyncUDPProtocol(),
+            remote_addr=(self.host, self.port)
+        )
+
+    async def send(self, data: bytes) -> None:
+        """
+        Send a datagram to server.
+
+        Args:
+            data: Bytes to send
+
+        Raises:
+            ConnectionError: If not connected
+        """
+        if not self.transport:
+            raise ConnectionError("Not connected")
+        self.transport.sendto(data)
+
+    async def receive(self, buffer_size: int = 4096) -> bytes:
+        """
+        Receive the next datagram from server.
+
+        Args:
+            buffer_size: Maximum bytes to return; longer datagrams are truncated
+
+        Returns:
+            Received bytes
+
+        Raises:
+            ConnectionError: If not connected
+        """
+        if not self.protocol:
+            raise ConnectionError("Not connected")
+        data, _ = await self.protocol.receive()
+        return data[:buffer_size]
+
+    async def close(self) -> None:
+        """Close the endpoint."""
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+            self.protocol = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
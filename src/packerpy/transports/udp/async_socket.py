@@ -1,16 +1,30 @@
 """Asynchronous UDP socket implementation."""
 
 import asyncio
-from typing import Optional, Tuple
+import logging
+from collections import deque
+from typing import Deque, Iterable, Optional, Tuple
+
+_log = logging.getLogger(__name__)
 
 
 class AsyncUDPProtocol(asyncio.DatagramProtocol):
-    """Protocol handler for async UDP."""
+    """
+    Protocol handler for async UDP.
+
+    Datagrams are buffered in a plain deque with an Event to wake a waiting
+    receive(), rather than an asyncio.Queue: the protocol callback and the
+    reader share one loop, so the queue's getter bookkeeping buys nothing
+    per datagram.
+    """
+
+    __slots__ = ("transport", "received_data", "_data_ready")
 
     def __init__(self):
         """Initialize protocol."""
         self.transport: Optional[asyncio.DatagramTransport] = None
-        self.received_data: asyncio.Queue = asyncio.Queue()
+        self.received_data: Deque[Tuple[bytes, Tuple[str, int]]] = deque()
+        self._data_ready = asyncio.Event()
 
     def connection_made(self, transport):
         """Called when connection is established."""
@@ -18,16 +32,31 @@ class AsyncUDPProtocol(asyncio.DatagramProtocol):
 
     def datagram_received(self, data: bytes, addr: Tuple[str, int]):
         """Called when a datagram is received."""
-        self.received_data.put_nowait((data, addr))
+        self.received_data.append((data, addr))
+        self._data_ready.set()
+
+    async def receive(self) -> Tuple[bytes, Tuple[str, int]]:
+        """
+        Return the oldest buffered datagram, waiting for one if needed.
+
+        Returns:
+            Tuple of (data, sender_address)
+        """
+        while not self.received_data:
+            self._data_ready.clear()
+            await self._data_ready.wait()
+        return self.received_data.popleft()
 
     def error_received(self, exc: Exception):
         """Called when an error occurs."""
-        print(f"UDP error: {exc}")
+        _log.error("UDP error: %s", exc)
 
 
 class AsyncUDPSocket:
     """Asynchronous UDP socket using asyncio."""
 
+    __slots__ = ("host", "port", "transport", "protocol")
+
     def __init__(self, host: str = "0.0.0.0", port: int = 0):
         """
         Initialize async UDP socket.
@@ -64,6 +93,24 @@ class AsyncUDPSocket:
             raise ConnectionError("Socket not bound")
         self.transport.sendto(data, address)
 
+    async def send_many(
+        self, packets: Iterable[Tuple[bytes, Tuple[str, int]]]
+    ) -> None:
+        """
+        Send several datagrams, each to its own address, in one call.
+        
+        Args:
+            packets: (data, address) pairs to send, in order
+            
+        Raises:
+            ConnectionError: If not bound
+        """
+        if not self.transport:
+            raise ConnectionError("Socket not bound")
+        sendto = self.transport.sendto
+        for data, address in packets:
+            sendto(data, address)
+
     async def receive_from(self) -> Tuple[bytes, Tuple[str, int]]:
         """
         Receive data from any sender.
@@ -76,7 +123,7 @@ class AsyncUDPSocket:
         """
         if not self.protocol:
             raise ConnectionError("Socket not bound")
-        return await self.protocol.received_data.get()
+        return await self.protocol.receive()
 
     async def close(self) -> None:
         """Close socket."""
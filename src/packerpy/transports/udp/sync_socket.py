@@ -1,12 +1,14 @@
 """Synchronous UDP socket implementation."""
 
 import socket
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 
 class SyncUDPSocket:
     """Synchronous UDP socket."""
 
+    __slots__ = ("host", "port", "socket")
+
     def __init__(self, host: str = "0.0.0.0", port: int = 0):
         """
         Initialize UDP socket.
@@ -42,6 +44,22 @@ class SyncUDPSocket:
             raise ConnectionError("Socket not bound")
         self.socket.sendto(data, address)
 
+    def send_many(self, packets: Iterable[Tuple[bytes, Tuple[str, int]]]) -> None:
+        """
+        Send several datagrams, each to its own address.
+        
+        Args:
+            packets: (data, address) pairs to send, in order
+            
+        Raises:
+            ConnectionError: If socket not bound
+        """
+        if not self.socket:
+            raise ConnectionError("Socket not bound")
+        sendto = self.socket.sendto
+        for data, address in packets:
+            sendto(data, address)
+
     def receive_from(self, buffer_size: int = 4096) -> Tuple[bytes, Tuple[str, int]]:
         """
         Receive data from any sender.
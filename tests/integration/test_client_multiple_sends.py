@@ -1,5 +1,6 @@
 """Integration test for client multiple sends bug fix."""
 
+import asyncio
 import time
 import pytest
 from packerpy.client import Client
@@ -106,3 +107,44 @@ class TestClientMultipleSendsIntegration:
         finally:
             server.stop()
             time.sleep(0.2)
+
+    def test_server_receive_from_main_thread_integration(self):
+        """Test receiving on the main thread from a server started in a thread."""
+        protocol = Protocol()
+        protocol.register(SimpleMessage)
+
+        server = Server(host="127.0.0.1", port=18082, protocol=protocol)
+        server.start()
+        time.sleep(0.2)
+
+        try:
+            client = Client(host="127.0.0.1", port=18082, protocol=protocol)
+            client.connect()
+
+            msg = SimpleMessage()
+            msg.text = "To the server"
+            assert client.send(msg) is True
+
+            started = time.monotonic()
+            received = server.receive(timeout=2.0)
+            assert received is not None, "Server did not queue the message"
+            assert received[0].text == "To the server"
+            assert time.monotonic() - started < 1.0
+
+            # The server closes each connection after one request
+            client.close()
+            client = Client(host="127.0.0.1", port=18082, protocol=protocol)
+            client.connect()
+            msg.text = "To an async receiver"
+            assert client.send(msg) is True
+
+            started = time.monotonic()
+            received = asyncio.run(server.receive_async(timeout=2.0))
+            assert received is not None, "receive_async was not woken"
+            assert received[0].text == "To an async receiver"
+            assert time.monotonic() - started < 1.0
+
+            client.close()
+        finally:
+            server.stop()
+            time.sleep(0.2)
@@ -0,0 +1,49 @@
+"""Call-recording stand-ins for sockets and datagram transports.
+
+These cover the few methods the UDP code calls and append each call to
+``calls`` as a tuple, which is all the UDP socket tests assert on.
+"""
+
+from collections import deque
+
+
+class RecordingSocket:
+    """Socket stand-in that records calls and replays queued datagrams."""
+
+    __slots__ = ("calls", "datagrams", "sockname")
+
+    def __init__(self, sockname=("0.0.0.0", 0)):
+        self.calls = []
+        self.datagrams = deque()
+        self.sockname = sockname
+
+    def bind(self, address):
+        self.calls.append(("bind", address))
+
+    def sendto(self, data, address):
+        self.calls.append(("sendto", data, address))
+
+    def recvfrom(self, buffer_size):
+        self.calls.append(("recvfrom", buffer_size))
+        return self.datagrams.popleft()
+
+    def getsockname(self):
+        return self.sockname
+
+    def close(self):
+        self.calls.append(("close",))
+
+
+class RecordingTransport:
+    """Datagram transport stand-in that records sendto and close calls."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def sendto(self, data, address=None):
+        self.calls.append(("sendto", data, address))
+
+    def close(self):
+        self.calls.append(("close",))
@@ -417,6 +417,46 @@ def test_static_field_validation():
     proto.clear_headers()
 
 
+def test_static_fields_of_each_fixed_type_validate():
+    """Test static header/footer values of every fixed-size type round trip."""
+    proto = Protocol()
+
+    @protocol(proto)
+    class TestMsg(Message):
+        encoding = Encoding.LITTLE_ENDIAN
+        fields = {
+            "data": {"type": "str"},
+        }
+
+    proto.set_headers(
+        {
+            "tag": {"type": "int(8)", "static": -2},
+            "version": {"type": "uint(16)", "static": 0x0102},
+            "odd_width": {"type": "uint(24)", "static": 0x010203},
+            "scale": {"type": "float", "static": 0.5},
+        }
+    )
+    proto.set_footers(
+        {
+            "offset": {"type": "int(64)", "static": -(2**40)},
+            "ratio": {"type": "double", "static": 1.25},
+            "flag": {"type": "bool", "static": True},
+        }
+    )
+
+    encoded = proto.encode(TestMsg(data="x"))
+    decoded, remaining = proto.decode(encoded)
+    assert isinstance(decoded, TestMsg)
+    assert decoded.data == "x"
+    assert remaining == b""
+
+    # Header sizes are cached per set_headers; a new spec must be picked up
+    proto.set_headers({"magic": {"type": "uint(32)", "static": 7}})
+    decoded, _ = proto.decode(proto.encode(TestMsg(data="y")))
+    assert isinstance(decoded, TestMsg)
+    assert decoded.data == "y"
+
+
 def test_multiple_messages_with_headers():
     """Test that headers work correctly with multiple message types."""
     proto = Protocol()
@@ -9,6 +9,8 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import math
+
 import pytest
 from packerpy.protocols.message import Message
 from packerpy.protocols.message_partial import MessagePartial, Encoding
@@ -87,6 +89,29 @@ class TestJSONSerializer:
         assert restored.label == "sensor-1"
         assert restored.active == True
 
+    def test_bytes_fields_use_base64(self):
+        """Test bytes fields are emitted as base64 and read back from either form."""
+
+        class BlobPartial(MessagePartial):
+            fields = {"blob": {"type": "bytes"}}
+
+        class BlobMessage(Message):
+            fields = {"blob": {"type": "bytes"}, "inner": {"type": BlobPartial}}
+
+        serializer = JSONSerializer()
+        msg = BlobMessage(blob=b"\x00\xffdata", inner=BlobPartial(blob=b"\x01"))
+
+        json_str = serializer.serialize_to_string(msg)
+        assert '"AP9kYXRh"' in json_str
+        assert '"AQ=="' in json_str
+
+        restored = serializer.deserialize_from_string(json_str, BlobMessage)
+        assert restored.blob == b"\x00\xffdata"
+        assert restored.inner.blob == b"\x01"
+
+        assert msg.to_dict()["blob"] == [0, 255, 100, 97, 116, 97]
+        assert BlobPartial.from_dict({"blob": [1, 2]}).blob == b"\x01\x02"
+
     def test_pretty_print(self):
         """Test pretty-printed JSON output."""
         partial = SimplePartial(name="test", value=42)
@@ -167,6 +192,26 @@ class TestJSONSerializer:
         result = serializer.deserialize(invalid_json, SimplePartial)
         assert result is None
 
+    def test_non_object_json_is_rejected(self):
+        """Test that JSON values other than objects are rejected up front."""
+        serializer = JSONSerializer()
+
+        assert serializer.deserialize(b"[1, 2]", SimplePartial) is None
+        assert serializer.deserialize(b"", SimplePartial) is None
+        assert serializer.deserialize_from_string("42", SimplePartial) is None
+
+        result = serializer.deserialize(b' \n {"name": "x", "value": 1}', SimplePartial)
+        assert result.name == "x"
+
+    def test_deserialize_accepts_str_input(self):
+        """Test that str input is accepted and bad input returns None."""
+        serializer = JSONSerializer()
+
+        result = serializer.deserialize('{"name": "x", "value": 1}', SimplePartial)
+        assert result.name == "x"
+        assert serializer.deserialize("[1, 2]", SimplePartial) is None
+        assert serializer.deserialize(None, SimplePartial) is None
+
     def test_ensure_ascii_option(self):
         """Test ensure_ascii serializer option."""
         # Create partial with non-ASCII characters
@@ -186,6 +231,110 @@ class TestJSONSerializer:
             "\\u" in json_ascii or json_ascii == json_unicode
         )  # Either escaped or happened to be ASCII
 
+    def test_stdlib_fallback_without_orjson(self, monkeypatch):
+        """Test that serialization works when orjson is not installed."""
+        from packerpy.protocols import serializer as serializer_module
+
+        monkeypatch.setattr(serializer_module, "orjson", None)
+        serializer = JSONSerializer()
+        partial = SimplePartial(name="fallback", value=7)
+
+        restored = serializer.deserialize(serializer.serialize(partial), SimplePartial)
+
+        assert restored.name == "fallback"
+        assert restored.value == 7
+        assert serializer.deserialize(b"not valid json", SimplePartial) is None
+
+    def test_wide_integer_falls_back_to_stdlib(self):
+        """Test that integers orjson cannot encode still serialize."""
+
+        class WidePartial(MessagePartial):
+            fields = {"big": {"type": "int"}}
+
+        serializer = JSONSerializer()
+        json_str = serializer.serialize_to_string(WidePartial(big=2**70))
+
+        assert str(2**70) in json_str
+
+    def test_wide_integer_round_trips(self):
+        """Test that integers wider than 64 bits decode back exactly."""
+
+        class WidePartial(MessagePartial):
+            fields = {"big": {"type": "int"}}
+
+        serializer = JSONSerializer()
+        data = serializer.serialize(WidePartial(big=2**70))
+
+        restored = serializer.deserialize(data, WidePartial)
+        from_text = serializer.deserialize(
+            b'{"big": 1180591620717411303424}', WidePartial
+        )
+
+        assert restored.big == 2**70
+        assert isinstance(restored.big, int)
+        assert from_text.big == 2**70
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_non_finite_floats_round_trip(self, indent):
+        """Test that NaN and infinities survive a JSON round trip."""
+
+        class FloatPartial(MessagePartial):
+            fields = {
+                "nan": {"type": "double"},
+                "inf": {"type": "double"},
+                "values": {"type": "double", "numlist": 2},
+            }
+
+        serializer = JSONSerializer(indent=indent)
+        partial = FloatPartial(
+            nan=float("nan"), inf=float("-inf"), values=[1.5, float("inf")]
+        )
+
+        restored = serializer.deserialize(serializer.serialize(partial), FloatPartial)
+
+        assert math.isnan(restored.nan)
+        assert restored.inf == float("-inf")
+        assert restored.values == [1.5, float("inf")]
+
+
+class TestMsgspecBackend:
+    """Test suite for the optional msgspec JSON backend."""
+
+    def test_unknown_backend_rejected(self):
+        """Test that an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            JSONSerializer(backend="yaml")
+
+    def test_round_trip_through_struct(self):
+        """Test that scalar-only classes round-trip through a msgspec Struct."""
+        pytest.importorskip("msgspec")
+        serializer = JSONSerializer(backend="msgspec")
+        partial = SimplePartial(name="msgspec", value=5)
+
+        data = serializer.serialize(partial)
+        assert data == JSONSerializer().serialize(partial).replace(b" ", b"")
+
+        restored = serializer.deserialize(data, SimplePartial)
+        assert restored.fields_equal(partial)
+        assert serializer.deserialize(b'{"name": 1}', SimplePartial) is None
+
+    def test_non_scalar_fields_use_dict_path(self):
+        """Test that classes with bytes or unset fields still round-trip."""
+        pytest.importorskip("msgspec")
+
+        class BlobPartial(MessagePartial):
+            fields = {"name": {"type": "str"}, "blob": {"type": "bytes"}}
+
+        serializer = JSONSerializer(backend="msgspec")
+        blob = BlobPartial(name="b", blob=b"\x00\xff")
+        restored = serializer.deserialize(serializer.serialize(blob), BlobPartial)
+        assert restored.fields_equal(blob)
+
+        partial = ComplexPartial(id=3, label="unset floats")
+        restored = serializer.deserialize(serializer.serialize(partial), ComplexPartial)
+        assert restored.fields_equal(partial)
+        assert restored.temperature is None
+
 
 class TestMixedSerialization:
     """Test suite for mixed binary/JSON serialization."""
@@ -1,5 +1,7 @@
 """Unit tests for protocols.message module."""
 
+import copy
+import pickle
 import pytest
 from enum import IntEnum
 
@@ -77,6 +79,37 @@ class TestMessageBasic:
         assert msg.id == 1
         assert msg.text == "test"
 
+    def test_from_dict_on_base_resolves_type(self):
+        """Test that Message.from_dict dispatches on the "type" entry."""
+        msg = Message.from_dict({"type": "TemperatureMessage", "sensor_id": "s1"})
+        assert isinstance(msg, TemperatureMessage)
+        assert msg.sensor_id == "s1"
+
+        class LateDefinedMessage(Message):
+            fields = {"payload": {"type": "bytes"}}
+
+        msg = Message.from_dict({"type": "LateDefinedMessage", "payload": [1, 2]})
+        assert isinstance(msg, LateDefinedMessage)
+        assert msg.payload == b"\x01\x02"
+
+        with pytest.raises(ValueError, match="Unknown message type"):
+            Message.from_dict({"type": "NoSuchMessage"})
+
+    def test_from_dict_on_base_rejects_ambiguous_type(self):
+        """Test that a class name defined twice is not resolved to either."""
+
+        def define():
+            class TwinMessage(Message):
+                fields = {"id": {"type": "int(32)"}}
+
+            return TwinMessage
+
+        twins = (define(), define())
+
+        with pytest.raises(ValueError, match="Ambiguous message type: TwinMessage"):
+            Message.from_dict({"type": "TwinMessage", "id": 1})
+        assert twins[0] is not twins[1]
+
     def test_repr(self):
         """Test string representation."""
         msg = SimpleMessage(id=1, text="test")
@@ -128,6 +161,39 @@ class TestTemperatureMessage:
         assert TemperatureMessage.fields["timestamp"]["type"] == "int(64)"
 
 
+class TestMessageEquality:
+    """Test field-wise comparison of messages."""
+
+    def test_round_trip_is_equal(self):
+        """Test that a deserialized message equals the original."""
+        original = TemperatureMessage(
+            sensor_id="s" * 10000, temperature=1.5, timestamp=7
+        )
+        deserialized, _ = TemperatureMessage.deserialize_bytes(
+            original.serialize_bytes()
+        )
+
+        assert deserialized.fields_equal(original)
+        assert not TemperatureMessage(sensor_id="s", timestamp=8).fields_equal(original)
+        status = StatusMessage(device_id="a")
+        assert not SimpleMessage(id=1, text="a").fields_equal(status)
+
+    def test_unassigned_fields_compare(self):
+        """Test comparison when some fields were never assigned."""
+        assert SimpleMessage(id=1).fields_equal(SimpleMessage(id=1))
+        assert not SimpleMessage(id=1).fields_equal(SimpleMessage(id=1, text="a"))
+
+    def test_equality_and_hash_are_identity_based(self):
+        """Test that == and hash() agree, so messages work as dict keys."""
+        first = SimpleMessage(id=1, text="a")
+        second = SimpleMessage(id=1, text="a")
+
+        assert first == first and first != second
+        assert first.fields_equal(second)
+        assert {first: "pending"}[first] == "pending"
+        assert second not in {first}
+
+
 class TestMessageFieldTypes:
     """Test various field types in messages."""
 
@@ -231,6 +297,127 @@ class TestMessageArrays:
 
         assert deserialized.values == [1, 2, 3, 4, 5]
 
+    @pytest.mark.parametrize("encoding", [Encoding.BIG_ENDIAN, Encoding.LITTLE_ENDIAN])
+    def test_numeric_arrays_match_generic_path(self, encoding):
+        """Test that array.array-backed arrays produce the generic encoding."""
+
+        class NumericArrayMessage(Message):
+            fields = {
+                "fixed": {"type": "uint(16)", "numlist": 3},
+                "samples": {"type": "float", "dynamic_array": True},
+                "wide": {"type": "int(64)", "dynamic_array": True},
+            }
+
+        NumericArrayMessage.encoding = encoding
+        NumericArrayMessage._compile_fields()
+
+        msg = NumericArrayMessage(
+            fixed=[1, 2, 65535], samples=[0.5, -2.0], wide=[-(2**40), 7]
+        )
+        serialized = msg.serialize_bytes()
+        plan = NumericArrayMessage._field_plan
+        NumericArrayMessage._field_plan = None
+        try:
+            assert serialized == msg.serialize_bytes()
+        finally:
+            NumericArrayMessage._field_plan = plan
+
+        deserialized, consumed = NumericArrayMessage.deserialize_bytes(serialized)
+        assert consumed == len(serialized)
+        assert deserialized.fixed == [1, 2, 65535]
+        assert deserialized.samples == [0.5, -2.0]
+        assert deserialized.wide == [-(2**40), 7]
+
+        with pytest.raises(ValueError, match="must have 3 elements"):
+            NumericArrayMessage(fixed=[1], samples=[], wide=[]).serialize_bytes()
+        with pytest.raises(ValueError, match="Insufficient data"):
+            NumericArrayMessage.deserialize_bytes(serialized[:-1])
+
+    def test_referenced_count_array_on_generic_path(self):
+        """Test arrays sized by another field, which stay on the generic path."""
+
+        class CountedMessage(Message):
+            encoding = Encoding.LITTLE_ENDIAN
+            fields = {
+                "count": {"type": "uint(8)"},
+                "values": {"type": "int(16)", "numlist": "count"},
+                "readings": {"type": "double", "dynamic_array": True},
+            }
+
+        assert CountedMessage._field_plan is None
+        msg = CountedMessage(count=3, values=[-1, 0, 300], readings=[0.25])
+        serialized = msg.serialize_bytes()
+        assert serialized[:7] == b"\x03\xff\xff\x00\x00\x2c\x01"
+
+        deserialized, consumed = CountedMessage.deserialize_bytes(serialized)
+        assert consumed == len(serialized)
+        assert deserialized.values == [-1, 0, 300]
+        assert deserialized.readings == [0.25]
+        with pytest.raises(ValueError, match="Insufficient data"):
+            CountedMessage.deserialize_bytes(serialized[:5])
+
+    def test_bool_arrays_match_generic_path(self):
+        """Test that struct-packed bool arrays produce the generic encoding."""
+
+        class BoolArrayMessage(Message):
+            fields = {
+                "fixed": {"type": "bool", "numlist": 3},
+                "flags": {"type": "bool", "dynamic_array": True},
+            }
+
+        msg = BoolArrayMessage(fixed=[True, False, 1], flags=[False, True])
+        serialized = msg.serialize_bytes()
+        assert serialized == b"\x01\x00\x01\x00\x00\x00\x02\x00\x01"
+        plan = BoolArrayMessage._field_plan
+        BoolArrayMessage._field_plan = None
+        try:
+            assert serialized == msg.serialize_bytes()
+        finally:
+            BoolArrayMessage._field_plan = plan
+
+        deserialized, consumed = BoolArrayMessage.deserialize_bytes(serialized)
+        assert consumed == len(serialized)
+        assert deserialized.fixed == [True, False, True]
+        assert deserialized.flags == [False, True]
+
+        with pytest.raises(ValueError, match="Insufficient data"):
+            BoolArrayMessage.deserialize_bytes(serialized[:-1])
+
+
+class TestMessageInterning:
+    """Test the 'intern' option for string fields."""
+
+    def test_interned_strings(self):
+        """Test decoded strings are interned on both decode paths."""
+
+        class InternMessage(Message):
+            fields = {
+                "sensor": {"type": "str", "intern": True},
+                "tags": {"type": "str", "dynamic_array": True, "intern": True},
+            }
+
+        class GenericInternMessage(Message):
+            fields = {
+                "sensor": {"type": "str", "intern": True},
+                "note": {"type": "str", "condition": lambda msg: True},
+            }
+
+        assert InternMessage._field_plan is not None
+        assert GenericInternMessage._field_plan is None
+
+        name = "".join(["sensor", "_01"])
+        data = InternMessage(sensor=name, tags=[name]).serialize_bytes()
+        first, _ = InternMessage.deserialize_bytes(data)
+        second, _ = InternMessage.deserialize_bytes(data)
+        assert first.sensor is second.sensor
+        assert first.tags[0] is first.sensor
+
+        data = GenericInternMessage(sensor=name, note="x").serialize_bytes()
+        first, _ = GenericInternMessage.deserialize_bytes(data)
+        second, _ = GenericInternMessage.deserialize_bytes(data)
+        assert first.sensor == name
+        assert first.sensor is second.sensor
+
 
 class TestMessageNested:
     """Test nested MessagePartial in messages."""
@@ -278,6 +465,46 @@ class TestMessageBitwise:
         assert deserialized.flag_b == 0
         assert deserialized.counter == 30
 
+    def test_generated_bitwise_matches_bit_context(self):
+        """Test the per-class generated bit functions against the generic packer."""
+
+        class LayoutMessage(Message):
+            bitwise = True
+            fields = {
+                "a": {"type": "bit", "bits": 3},
+                "b": {"type": "bit", "bits": 5, "signed": True},
+                "arr": {"type": "bit", "bits": 4, "numlist": 3, "signed": True},
+                "magic": {"type": "bit", "bits": 7, "static": 0x55},
+                "u": {"type": "bit", "bits": 2, "numlist": 2},
+            }
+
+        assert LayoutMessage._bit_pack is not None
+
+        msg = LayoutMessage(a=5, b=-16, arr=[-8, 7, -1], u=[3, 0])
+        serialized = msg.serialize_bytes()
+        pack, unpack = LayoutMessage._bit_pack, LayoutMessage._bit_unpack
+        LayoutMessage._bit_pack = LayoutMessage._bit_unpack = None
+        try:
+            assert serialized == msg.serialize_bytes()
+        finally:
+            LayoutMessage._bit_pack, LayoutMessage._bit_unpack = pack, unpack
+
+        deserialized, consumed = LayoutMessage.deserialize_bytes(serialized)
+        assert consumed == len(serialized) == 4
+        assert (deserialized.a, deserialized.b) == (5, -16)
+        assert deserialized.arr == [-8, 7, -1]
+        assert deserialized.u == [3, 0]
+        assert deserialized.magic == 0x55
+
+        with pytest.raises(ValueError, match="out of range for 5-bit signed"):
+            LayoutMessage(a=0, b=16, arr=[0, 0, 0], u=[0, 0]).serialize_bytes()
+        with pytest.raises(ValueError, match="must have 2 elements"):
+            LayoutMessage(a=0, b=0, arr=[0, 0, 0], u=[0]).serialize_bytes()
+        with pytest.raises(ValueError, match="expected static value"):
+            LayoutMessage.deserialize_bytes(bytes(4))
+        with pytest.raises(ValueError, match="Insufficient data"):
+            LayoutMessage.deserialize_bytes(serialized[:3])
+
 
 class TestMessageEncodings:
     """Test different byte order encodings."""
@@ -331,6 +558,34 @@ class TestMessageEnums:
 class TestMessageEdgeCases:
     """Test edge cases and error handling."""
 
+    def test_generic_decode_materializes_values(self):
+        """Test the generic path returns str/bytes and hands decoders bytes."""
+        seen = []
+
+        def decode_tag(data, byteorder):
+            seen.append(type(data))
+            return data[:2].decode("ascii"), 2
+
+        class GenericMessage(Message):
+            fields = {
+                "text": {"type": "str"},
+                "blob": {"type": "bytes"},
+                "tag": {
+                    "type": "custom",
+                    "encode": lambda value, byteorder: value.encode("ascii"),
+                    "decode": decode_tag,
+                },
+            }
+
+        assert GenericMessage._field_plan is None
+        msg = GenericMessage(text="x" * 10000, blob=b"\x01" * 10000, tag="ok")
+        restored, consumed = GenericMessage.deserialize_bytes(msg.serialize_bytes())
+
+        assert type(restored.text) is str and restored.text == msg.text
+        assert type(restored.blob) is bytes and restored.blob == msg.blob
+        assert restored.tag == "ok"
+        assert seen == [bytes]
+
     def test_empty_string(self):
         """Test message with empty string."""
         msg = SimpleMessage(id=1, text="")
@@ -407,6 +662,24 @@ class TestMessageValidation:
         # None is a valid value for fields
         assert msg.validate() is True
 
+    def test_missing_field_is_invalid(self):
+        """Test that an unset regular field fails validation."""
+        assert SimpleMessage(id=1).validate() is False
+
+    def test_computed_and_conditional_fields_not_required(self):
+        """Test that computed and conditional fields may be left unset."""
+
+        class OptionalFieldsMessage(Message):
+            fields = {
+                "length": {"type": "uint(32)", "length_of": "data"},
+                "data": {"type": "str"},
+                "extra": {"type": "int(8)", "condition": lambda msg: False},
+            }
+
+        assert OptionalFieldsMessage._required_fields == ("data",)
+        assert OptionalFieldsMessage(data="x").validate() is True
+        assert OptionalFieldsMessage().validate() is False
+
 
 class TestMessageInheritance:
     """Test Message inheritance patterns."""
@@ -429,3 +702,342 @@ class TestMessageInheritance:
         serialized = msg.serialize_bytes()
         deserialized, _ = CustomMessage.deserialize_bytes(serialized)
         assert deserialized.custom_field == "custom"
+
+
+class TestMessageSizeEstimate:
+    """Test the exact-size buffer used by the compiled encode path."""
+
+    def test_array_sizes_match_packed_length(self):
+        """Test that array codec sizes only count a prefix for dynamic arrays."""
+        from packerpy.protocols.message_partial import (
+            _NumericArrayCodec,
+            _StructArrayCodec,
+        )
+
+        for count in (3, None):
+            numeric = _NumericArrayCodec("readings", "H", count, "big")
+            flags = _StructArrayCodec("flags", "?", count, "big")
+            for codec, value in ((numeric, [1, 2, 3]), (flags, [True, False, True])):
+                buf = bytearray(16)
+                assert codec.pack_into(buf, 0, value) == codec.size(value)
+
+    def test_arrays_of_partials_encode_each_partial_once(self):
+        """Test that arrays of nested partials reuse one encode per element."""
+        calls = []
+
+        class Point(MessagePartial):
+            fields = {"x": {"type": "int(16)"}, "label": {"type": "str"}}
+
+            def serialize_bytes(self):
+                calls.append(self)
+                return super().serialize_bytes()
+
+        class PathMessage(Message):
+            fields = {
+                "points": {"type": Point, "dynamic_array": True},
+                "ends": {"type": Point, "numlist": 2},
+            }
+
+        points = [Point(x=i, label=f"p{i}") for i in range(3)]
+        msg = PathMessage(points=points, ends=points[:2])
+        serialized = msg.serialize_bytes()
+
+        assert len(calls) == 5
+        deserialized, consumed = PathMessage.deserialize_bytes(serialized)
+        assert consumed == len(serialized)
+        assert deserialized.fields_equal(msg)
+
+    def test_compiled_path_matches_generic_path(self):
+        """Test that compiled and generic encoding produce identical bytes."""
+        msg = SimpleMessage(id=-3, text="same bytes")
+        compiled = msg.serialize_bytes()
+
+        plan = SimpleMessage._field_plan
+        SimpleMessage._field_plan = None
+        try:
+            generic = msg.serialize_bytes()
+        finally:
+            SimpleMessage._field_plan = plan
+
+        assert compiled == generic
+
+    def test_complex_fields_use_generic_path(self):
+        """Test that classes with computed fields are not compiled."""
+
+        class ComputedMessage(Message):
+            fields = {
+                "length": {"type": "int(32)", "length_of": "data"},
+                "data": {"type": "str"},
+            }
+
+        assert ComputedMessage._field_plan is None
+        assert SimpleMessage._field_plan is not None
+
+    def test_slotted_subclass_uses_slot_getters(self):
+        """Test that fields declared in __slots__ are read via slot descriptors."""
+
+        class SlottedMessage(Message):
+            __slots__ = ("id", "text")
+            fields = {"id": {"type": "int(32)"}, "text": {"type": "str"}}
+
+        getter, _ = SlottedMessage._encode_steps[0]
+        assert getter == SlottedMessage.__dict__["id"].__get__
+
+        msg = SlottedMessage(id=5, text="slots")
+        deserialized, _ = SlottedMessage.deserialize_bytes(msg.serialize_bytes())
+        assert deserialized.id == 5
+        assert deserialized.text == "slots"
+
+
+class TestMessageCompiledDecode:
+    """Test decoding through the compiled field plan."""
+
+    def test_decode_matches_generic_path(self):
+        """Test that compiled and generic decoding agree."""
+
+        class ArrayMessage(Message):
+            encoding = Encoding.LITTLE_ENDIAN
+            fields = {
+                "flag": {"type": "bool"},
+                "values": {"type": "int(16)", "numlist": 2},
+                "blob": {"type": "bytes"},
+                "tags": {"type": "str", "dynamic_array": True},
+            }
+
+        data = ArrayMessage(
+            flag=True, values=[-1, 2], blob=b"\x01\x02", tags=["a", "bc"]
+        ).serialize_bytes()
+
+        compiled, consumed = ArrayMessage.deserialize_bytes(data + b"extra")
+        plan = ArrayMessage._field_plan
+        ArrayMessage._field_plan = None
+        try:
+            generic, generic_consumed = ArrayMessage.deserialize_bytes(data + b"extra")
+        finally:
+            ArrayMessage._field_plan = plan
+
+        assert consumed == generic_consumed == len(data)
+        for name in ArrayMessage.fields:
+            assert getattr(compiled, name) == getattr(generic, name)
+        assert isinstance(compiled.blob, bytes)
+
+    def test_static_value_mismatch_raises(self):
+        """Test that compiled decoding verifies static fields."""
+
+        class StaticMessage(Message):
+            fields = {
+                "magic": {"type": "uint(16)", "static": 0xCAFE},
+                "value": {"type": "int(8)"},
+            }
+
+        with pytest.raises(ValueError, match="expected static value"):
+            StaticMessage.deserialize_bytes(b"\xbe\xef\x01")
+
+    def test_truncated_string_raises(self):
+        """Test that a truncated length-prefixed field raises ValueError."""
+        data = SimpleMessage(id=1, text="truncated").serialize_bytes()
+
+        with pytest.raises(ValueError, match="Insufficient data"):
+            SimpleMessage.deserialize_bytes(data[:-3])
+
+
+class TestMessageStructRuns:
+    """Test batching of adjacent fixed-width fields into one struct."""
+
+    def test_adjacent_scalars_share_one_step(self):
+        """Test that a run of scalar fields is packed by a single step."""
+
+        class RunMessage(Message):
+            encoding = Encoding.LITTLE_ENDIAN
+            fields = {
+                "a": {"type": "int(8)"},
+                "b": {"type": "uint(16)"},
+                "c": {"type": "float"},
+                "d": {"type": "bool"},
+                "label": {"type": "str"},
+                "e": {"type": "double"},
+                "f": {"type": "int(64)"},
+            }
+
+        assert len(RunMessage._encode_steps) == 3
+
+        msg = RunMessage(a=-1, b=65535, c=1.5, d=True, label="x", e=0.25, f=-(2**40))
+        serialized = msg.serialize_bytes()
+        assert serialized[:8] == b"\xff\xff\xff\x00\x00\xc0\x3f\x01"
+
+        deserialized, consumed = RunMessage.deserialize_bytes(serialized)
+        assert consumed == len(serialized)
+        assert (deserialized.a, deserialized.b, deserialized.c) == (-1, 65535, 1.5)
+        assert deserialized.d is True
+        assert (deserialized.e, deserialized.f) == (0.25, -(2**40))
+
+    def test_static_fields_join_runs(self):
+        """Test that static fields are packed in runs and still verified."""
+
+        class StaticRunMessage(Message):
+            fields = {
+                "magic": {"type": "uint(16)", "static": 0xABCD},
+                "a": {"type": "int(16)"},
+                "b": {"type": "int(16)"},
+            }
+
+        assert len(StaticRunMessage._encode_steps) == 1
+        msg = StaticRunMessage(a=1, b=2)
+        serialized = msg.serialize_bytes()
+        assert serialized == b"\xab\xcd\x00\x01\x00\x02"
+
+        deserialized, _ = StaticRunMessage.deserialize_bytes(serialized)
+        assert (deserialized.magic, deserialized.b) == (0xABCD, 2)
+        with pytest.raises(ValueError, match="expected static value 43981, got 1"):
+            StaticRunMessage.deserialize_bytes(b"\x00\x01" + serialized[2:])
+
+    def test_single_and_odd_width_integers(self):
+        """Test lone integer fields and widths struct has no code for."""
+
+        class OddWidthMessage(Message):
+            encoding = Encoding.LITTLE_ENDIAN
+            fields = {
+                "a": {"type": "uint(32)"},
+                "label": {"type": "str"},
+                "b": {"type": "int(24)"},
+            }
+
+        msg = OddWidthMessage(a=0xDEADBEEF, label="", b=-2)
+        serialized = msg.serialize_bytes()
+        assert serialized == b"\xef\xbe\xad\xde" + bytes(4) + b"\xfe\xff\xff"
+
+        deserialized, _ = OddWidthMessage.deserialize_bytes(serialized)
+        assert (deserialized.a, deserialized.b) == (0xDEADBEEF, -2)
+
+
+class TestMessageGeneratedFunctions:
+    """Test the serialize/decode functions generated from the field plan."""
+
+    def test_deserialize_view_decodes_fields_on_access(self):
+        """Test that deserialize_view decodes each field when first read."""
+
+        class ViewMessage(Message):
+            fields = {
+                "magic": {"type": "uint(16)", "static": 0xABCD},
+                "count": {"type": "int(16)"},
+                "text": {"type": "str"},
+                "values": {"type": "int(32)", "dynamic_array": True},
+                "tail": {"type": "bool"},
+            }
+
+        msg = ViewMessage(count=3, text="é" * 1000, values=[1, 2, 3], tail=True)
+        serialized = msg.serialize_bytes()
+
+        view, consumed = ViewMessage.deserialize_view(serialized + b"extra")
+
+        assert consumed == len(serialized)
+        assert view.tail is True
+        with pytest.raises(AttributeError):
+            ViewMessage.text.__get__(view)  # not decoded yet
+        assert view.count == 3
+        assert view.fields_equal(msg)
+        assert view.serialize_bytes() == serialized
+        with pytest.raises(AttributeError):
+            view.missing
+
+        with pytest.raises(ValueError, match="Insufficient data"):
+            ViewMessage.deserialize_view(serialized[:-1])
+        # Static fields are class attributes, so they are checked up front
+        with pytest.raises(ValueError, match="expected static value"):
+            ViewMessage.deserialize_view(b"\x00\x01" + serialized[2:])
+
+    def test_deserialize_view_copies_mutable_buffers(self):
+        """Test that a view does not alias or pin a bytearray it was read from."""
+        serialized = SimpleMessage(id=1, text="hello").serialize_bytes()
+        buf = bytearray(serialized + b"next message")
+
+        view, consumed = SimpleMessage.deserialize_view(buf)
+        buf[consumed - 1] = ord("X")
+        del buf[:consumed]
+
+        assert buf == b"next message"
+        assert view.text == "hello"
+
+    def test_deserialize_view_pickles_and_copies(self):
+        """Test that pickling or copying a view decodes its pending fields."""
+        serialized = SimpleMessage(id=4, text="lazy").serialize_bytes()
+
+        for clone in (
+            lambda view: pickle.loads(pickle.dumps(view)),
+            copy.deepcopy,
+            copy.copy,
+        ):
+            view, _ = SimpleMessage.deserialize_view(serialized)
+            restored = clone(view)
+
+            assert (restored.id, restored.text) == (4, "lazy")
+            assert "_view" not in vars(restored)
+            assert "_view" not in vars(view)
+
+    def test_deserialize_view_stores_no_static_values(self):
+        """Test that reading a view never copies static values onto it."""
+
+        class StaticViewMessage(Message):
+            fields = {
+                "magic": {"type": "uint(16)", "static": 0xABCD},
+                "count": {"type": "int(16)"},
+                "tag": {"type": "str", "static": "PROTO"},
+            }
+
+        serialized = StaticViewMessage(count=4).serialize_bytes()
+        view, _ = StaticViewMessage.deserialize_view(serialized)
+
+        assert (view.magic, view.count, view.tag) == (0xABCD, 4, "PROTO")
+        assert "magic" not in vars(view)
+        assert "tag" not in vars(view)
+
+    def test_deserialize_view_falls_back_to_eager_decoding(self):
+        """Test that classes with their own __init__ are decoded eagerly."""
+
+        class InitMessage(Message):
+            fields = {"id": {"type": "int(32)"}}
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.seen = True
+
+        view, consumed = InitMessage.deserialize_view(
+            InitMessage(id=5).serialize_bytes()
+        )
+
+        assert (view.id, view.seen, consumed) == (5, True, 4)
+
+    def test_generated_pack_round_trips(self):
+        """Test that the generated pack function backs serialize_bytes."""
+        msg = TemperatureMessage(sensor_id="sensor-é", temperature=21.5, timestamp=9)
+        serialized = msg._pack_plan()
+
+        assert serialized == msg.serialize_bytes()
+
+        deserialized, consumed = TemperatureMessage.deserialize_bytes(serialized)
+        assert consumed == len(serialized)
+        assert deserialized.sensor_id == "sensor-é"
+        assert deserialized.timestamp == 9
+
+    def test_non_identifier_field_names(self):
+        """Test that fields which are not valid attribute names still work."""
+
+        class OddNameMessage(Message):
+            fields = {
+                "class": {"type": "int(8)"},
+                "not-an-identifier": {"type": "int(8)"},
+                "text": {"type": "str"},
+                "version": {"type": "uint(16)", "static": 3},
+            }
+
+        msg = OddNameMessage(**{"class": 1, "not-an-identifier": 2, "text": "x"})
+        serialized = msg.serialize_bytes()
+        assert serialized == b"\x01\x02\x00\x00\x00\x01x\x00\x03"
+
+        with pytest.raises(ValueError, match="need 2, got 1"):
+            OddNameMessage.deserialize_bytes(serialized[:1])
+
+        deserialized, _ = OddNameMessage.deserialize_bytes(serialized)
+        assert getattr(deserialized, "class") == 1
+        assert getattr(deserialized, "not-an-identifier") == 2
+        assert deserialized.version == 3
@@ -1,8 +1,11 @@
 """Unit tests for protocols.message_partial module."""
 
+import binascii
+import copy
 import pytest
 import struct
 from enum import IntEnum
+from unittest.mock import patch
 
 from packerpy.protocols.message_partial import (
     MessagePartial,
@@ -170,6 +173,77 @@ class TestMessagePartialBasic:
         assert partial.name == "test"
         assert partial.value == 42
 
+    def test_dict_round_trip_converts_enums_and_bytes(self):
+        """Test that enum and bytes fields survive to_dict/from_dict."""
+        status = EnumPartial(status=StatusEnum.ERROR)
+        data = status.to_dict()
+        assert data["status"] == {"enum": "StatusEnum", "value": 2}
+        assert EnumPartial.from_dict(data).status is StatusEnum.ERROR
+
+        partial = ComplexPartial(int_field=1, bytes_field=b"\x00\xff")
+        data = partial.to_dict(for_json=True)
+        assert data["bytes_field"] == "AP8="
+        assert ComplexPartial.from_dict(data, for_json=True).bytes_field == (
+            b"\x00\xff"
+        )
+
+    def test_from_dict_keeps_str_for_bytes_field_outside_json(self):
+        """Test that plain from_dict does not base64-decode str bytes values."""
+        assert ComplexPartial.from_dict({"bytes_field": "abcd"}).bytes_field == "abcd"
+        assert ComplexPartial.from_dict({"bytes_field": "hello"}).bytes_field == (
+            "hello"
+        )
+
+    def test_from_dict_for_json_rejects_invalid_base64(self):
+        """Test that JSON bytes values must be valid base64."""
+        with pytest.raises(binascii.Error):
+            ComplexPartial.from_dict({"bytes_field": "not base64!"}, for_json=True)
+
+    def test_fields_equal_compares_field_values(self):
+        """Test that partials of the same class compare by field values."""
+        original = SimplePartial(name="x" * 10000, value=42)
+        deserialized, _ = SimplePartial.deserialize_bytes(original.serialize_bytes())
+
+        assert deserialized.fields_equal(original)
+        assert not SimplePartial(name="x" * 10000, value=43).fields_equal(original)
+        assert not SimplePartial(name="y" * 10000, value=42).fields_equal(original)
+        assert not ComplexPartial(int_field=42).fields_equal(SimplePartial(value=42))
+
+    def test_fields_equal_rejects_on_hash_mismatch(self):
+        """Test that differing strings are rejected by their cached hashes."""
+        original = SimplePartial(name="x" * 10000, value=42)
+        other = SimplePartial(name="x" * 9999 + "y", value=42)
+        assert SimplePartial._eq_hashed == (1,)
+
+        with patch(
+            "packerpy.protocols.message_partial._value_equal",
+            side_effect=AssertionError("compared after a hash mismatch"),
+        ):
+            assert not original.fields_equal(other)
+
+    def test_fields_equal_recurses_into_nested_partials(self):
+        """Test that nested partials are compared by value, not identity."""
+        first = NestedPartial(nested=SimplePartial(name="inner", value=1))
+        second = NestedPartial(nested=SimplePartial(name="inner", value=1))
+
+        assert first.fields_equal(second)
+        second.nested.value = 2
+        assert not first.fields_equal(second)
+
+    def test_equality_checks_scalars_first(self):
+        """Test that scalar fields are compared before strings."""
+        assert SimplePartial._eq_fields == ("value", "name")
+
+    def test_equality_and_hash_are_identity_based(self):
+        """Test that == and hash() agree, so partials work as dict keys."""
+        first = SimplePartial(name="x", value=1)
+        second = SimplePartial(name="x", value=1)
+
+        assert first == first and first != second
+        assert first.fields_equal(second)
+        assert {first: "pending"}[first] == "pending"
+        assert second not in {first}
+
 
 class TestMessagePartialFieldTypes:
     """Test different field types."""
@@ -376,6 +450,34 @@ class TestMessagePartialNested:
         assert deserialized.nested.name == "inner"
         assert deserialized.nested.value == 99
 
+    def test_nested_partial_non_ascii_and_wrong_type(self):
+        """Test nested non-ASCII strings and rejection of foreign partials."""
+        outer = NestedPartial(nested=SimplePartial(name="größe ✓", value=-1))
+
+        serialized = outer.serialize_bytes()
+
+        decoded, consumed = NestedPartial.deserialize_bytes(serialized)
+        assert decoded.fields_equal(outer)
+        assert consumed == len(serialized)
+        with pytest.raises(ValueError, match="Expected SimplePartial"):
+            NestedPartial(nested=EnumPartial(status=StatusEnum.IDLE)).serialize_bytes()
+
+    def test_nested_partial_deserialize_view(self):
+        """Test lazy deserialization of a partial holding a nested partial."""
+        outer = NestedPartial(nested=SimplePartial(name="inner", value=99))
+        serialized = outer.serialize_bytes()
+
+        view, consumed = NestedPartial.deserialize_view(serialized)
+
+        assert consumed == len(serialized)
+        assert view.nested.fields_equal(outer.nested)
+        assert view.validate() is True
+
+        view, _ = NestedPartial.deserialize_view(bytearray(serialized))
+        clone = copy.deepcopy(view)
+        assert clone.nested.fields_equal(outer.nested)
+        assert "_view" not in vars(clone)
+
     def test_nested_partial_to_dict(self):
         """Test nested partial to_dict."""
         inner = SimplePartial(name="inner", value=99)
@@ -388,6 +490,55 @@ class TestMessagePartialNested:
         assert result["nested"]["name"] == "inner"
         assert result["nested"]["value"] == 99
 
+    def test_nested_list_to_dict(self):
+        """Test to_dict on lists of partials and enums keeps field order."""
+
+        class ListPartial(MessagePartial):
+            fields = {
+                "items": {"type": SimplePartial, "dynamic_array": True},
+                "states": {"type": "enum", "enum": StatusEnum, "numlist": 2},
+                "tail": {"type": NestedPartial},
+            }
+
+        partial = ListPartial(
+            items=[SimplePartial(name="a", value=1), SimplePartial(name="b", value=2)],
+            states=[StatusEnum.IDLE, StatusEnum.ERROR],
+            tail=NestedPartial(nested=SimplePartial(name="c", value=3)),
+        )
+
+        result = partial.to_dict()
+
+        assert list(result) == ["type", "items", "states", "tail"]
+        assert result["items"][1] == {"type": "SimplePartial", "name": "b", "value": 2}
+        assert result["states"] == [
+            {"enum": "StatusEnum", "value": 0},
+            {"enum": "StatusEnum", "value": 2},
+        ]
+        assert result["tail"]["nested"]["name"] == "c"
+        assert list(result["tail"]["nested"]) == ["type", "name", "value"]
+
+    def test_cache_serialized(self):
+        """Test cached bytes are reused until an attribute is assigned."""
+
+        class CachedPartial(MessagePartial):
+            cache_serialized = True
+            fields = {"name": {"type": "str"}, "value": {"type": "int(32)"}}
+
+        class Holder(MessagePartial):
+            fields = {"inner": {"type": CachedPartial}, "tail": {"type": "uint(8)"}}
+
+        inner = CachedPartial(name="a", value=1)
+        first = inner.serialize_bytes()
+        assert inner.serialize_bytes() is first
+
+        holder = Holder(inner=inner, tail=7)
+        assert holder.serialize_bytes() == first + b"\x07"
+
+        inner.value = 2
+        second = inner.serialize_bytes()
+        assert second != first
+        assert Holder.deserialize_bytes(holder.serialize_bytes())[0].inner.value == 2
+
     def test_nested_partial_from_dict(self):
         """Test nested partial from_dict."""
         data = {
@@ -400,6 +551,36 @@ class TestMessagePartialNested:
         assert partial.nested.name == "inner"
         assert partial.nested.value == 99
 
+    def test_nested_and_enum_fields_are_compiled(self):
+        """Test that enum and nested partial fields get a compiled plan."""
+        assert EnumPartial._field_plan is not None
+        assert NestedPartial._field_plan is not None
+        assert BitwisePartial._field_plan is None
+        assert BitwisePartial._is_bitwise is True
+
+    def test_wrong_nested_type_raises_error(self):
+        """Test that a nested field rejects instances of the wrong class."""
+        outer = NestedPartial(nested=EnumPartial(status=StatusEnum.IDLE))
+
+        with pytest.raises(ValueError, match="Expected SimplePartial"):
+            outer.serialize_bytes()
+
+    def test_custom_serialization_is_not_inlined(self):
+        """Test that partials overriding serialize_bytes keep their own codec."""
+
+        class UpperPartial(MessagePartial):
+            fields = {"text": {"type": "str"}}
+
+            def serialize_bytes(self):
+                return self.text.upper().encode("ascii") + b"\x00"
+
+        class Holder(MessagePartial):
+            fields = {"inner": {"type": UpperPartial}}
+
+        assert UpperPartial._custom_serialization is True
+        assert Holder._field_plan is None
+        assert Holder(inner=UpperPartial(text="abc")).serialize_bytes() == b"ABC\x00"
+
 
 class TestFixedPointEncoder:
     """Test FixedPointEncoder."""
@@ -443,6 +624,14 @@ class TestFixedPointEncoder:
         with pytest.raises(ValueError, match="out of range"):
             encoder.encode(value, "big")
 
+    def test_odd_width_format(self):
+        """Test formats whose byte size struct has no code for."""
+        encoder = FixedPointEncoder(12, 12)
+
+        encoded = encoder.encode(-1.5, "little")
+        assert encoded == (-(3 << 11)).to_bytes(3, "little", signed=True)
+        assert encoder.decode(encoded, "little") == (-1.5, 3)
+
 
 class TestEnumEncoder:
     """Test EnumEncoder."""
@@ -484,6 +673,20 @@ class TestEnumEncoder:
 
         assert deserialized.status == StatusEnum.ACTIVE
 
+    @pytest.mark.parametrize("size", [1, 2, 3, 4, 8])
+    def test_sizes_and_byte_orders(self, size):
+        """Test struct-backed and odd enum sizes in both byte orders."""
+        encoder = EnumEncoder(StatusEnum, size)
+
+        for byteorder in ("big", "little"):
+            encoded = encoder.encode(StatusEnum.ACTIVE, byteorder)
+            assert encoded == int(StatusEnum.ACTIVE).to_bytes(size, byteorder)
+            assert encoder.encode(int(StatusEnum.ACTIVE), byteorder) == encoded
+
+            decoded, consumed = encoder.decode(encoded + b"\xff", byteorder)
+            assert decoded is StatusEnum.ACTIVE
+            assert consumed == size
+
 
 class TestRunLengthEncoder:
     """Test RunLengthEncoder."""
@@ -518,6 +721,40 @@ class TestRunLengthEncoder:
 
         assert decoded == data
 
+    def test_long_runs_split_at_255(self):
+        """Test that runs longer than 255 bytes are split into several pairs."""
+        encoder = RunLengthEncoder()
+        data = b"\xaa" * 510 + b"\xbb" * 300
+
+        encoded = encoder.encode(data, "big")
+
+        assert encoded == b"\x00\x00\x00\x08\xff\xaa\xff\xaa\xff\xbb\x2d\xbb"
+        assert encoder.decode(encoded, "big") == (data, len(encoded))
+
+    def test_decode_is_given_a_view_of_the_message(self):
+        """Test that built-in encoders decode from a view, custom ones from bytes."""
+        seen = []
+
+        class RecordingEncoder(RunLengthEncoder):
+            def decode(self, data, byteorder):
+                seen.append(type(data))
+                return super().decode(data, byteorder)
+
+        class CopyingEncoder(RecordingEncoder):
+            accepts_memoryview = False
+
+        class RlePartial(MessagePartial):
+            fields = {
+                "a": {"type": "custom", "encoder": RecordingEncoder()},
+                "b": {"type": "custom", "encoder": CopyingEncoder()},
+            }
+
+        partial = RlePartial(a=b"\x01" * 20, b=b"\x02" * 3)
+        decoded, _ = RlePartial.deserialize_bytes(partial.serialize_bytes())
+
+        assert decoded.fields_equal(partial)
+        assert seen == [memoryview, bytes]
+
 
 class TestSevenBitASCIIEncoder:
     """Test SevenBitASCIIEncoder."""
@@ -551,6 +788,27 @@ class TestSevenBitASCIIEncoder:
 
         assert decoded == text
 
+    def test_bit_layout(self):
+        """Test the exact MSB-first layout across a partial final block."""
+        encoder = SevenBitASCIIEncoder()
+
+        encoded = encoder.encode("AB" * 5, "big")
+        # 'A' = 1000001, 'B' = 1000010, packed back to back
+        assert encoded[:4] == b"\x00\x0a\x83\x0a"
+        assert len(encoded) == 2 + 9
+
+        decoded, consumed = encoder.decode(encoded + b"tail", "big")
+        assert decoded == "AB" * 5
+        assert consumed == len(encoded)
+
+    def test_non_ascii_characters_are_masked(self):
+        """Test that characters above 0x7F keep only their low 7 bits."""
+        encoder = SevenBitASCIIEncoder()
+
+        decoded, _ = encoder.decode(encoder.encode("é", "little"), "little")
+
+        assert decoded == chr(ord("é") & 0x7F)
+
 
 class TestBitwiseEncoder:
     """Test BitwiseEncoder."""
@@ -629,10 +887,46 @@ class TestBitPackingContext:
         assert result1 == b"\xff"
         assert result2 == b""
 
+    def test_bits_in_buffer_counts_partial_byte(self):
+        """Test that bits_in_buffer reports bits past the last full byte."""
+        context = BitPackingContext("big")
+        context.pack_bits(0b1, 1)
+        context.pack_bits(0x1FF, 9)
+
+        assert context.bits_in_buffer == 2
+        assert context.flush() == b"\xff\xc0"
+        assert context.bits_in_buffer == 0
+
+    def test_value_is_masked_to_bit_count(self):
+        """Test that bits above bit_count are dropped."""
+        context = BitPackingContext("big")
+        context.pack_bits(0xFFF, 4)
+        context.pack_bits(0, 4)
+
+        assert context.flush() == b"\xf0"
+
+    def test_pack_array(self):
+        """Test packing a sequence of same-width values, masking negatives."""
+        context = BitPackingContext("big")
+        context.pack_bits(0b1, 1)
+        context.pack_array([0b101, -1, 0], 3)
+
+        assert context.bits_in_buffer == 2
+        assert context.flush() == b"\xde\x00"
+
 
 class TestBitUnpackingContext:
     """Test BitUnpackingContext."""
 
+    def test_unpack_array(self):
+        """Test unpacking a sequence of same-width values."""
+        context = BitUnpackingContext(b"\xde\x00", "big")
+
+        assert context.unpack_bits(1) == 1
+        assert context.unpack_array(3, 3) == [0b101, 0b111, 0]
+        assert context.unpack_array(0, 3) == []
+        assert context.bit_position == 10
+
     def test_unpack_single_byte(self):
         """Test unpacking bits from one byte."""
         data = b"\xac"  # 0b10101100
@@ -674,6 +968,24 @@ class TestBitUnpackingContext:
 
         assert context.get_bytes_consumed() == 2
 
+    def test_unpack_across_window_boundaries(self):
+        """Test reads spanning the int windows used for long inputs."""
+        data = bytes(range(256)) * 3
+        context = BitUnpackingContext(data, "big")
+        as_int = int.from_bytes(data, "big")
+        total = len(data) * 8
+
+        position = 0
+        for bit_count in [3, 13, 1, 64, 7] * 60:
+            if position + bit_count > total:
+                break
+            expected = (as_int >> (total - position - bit_count)) & (
+                (1 << bit_count) - 1
+            )
+            assert context.unpack_bits(bit_count) == expected
+            position += bit_count
+            assert context.get_bytes_consumed() == (position + 7) // 8
+
 
 class TestBitwisePartial:
     """Test MessagePartial with bitwise encoding."""
@@ -716,6 +1028,36 @@ class TestBitwisePartial:
         with pytest.raises(ValueError, match="out of range"):
             partial.serialize_bytes()
 
+    def test_generated_functions_match_bit_contexts(self):
+        """Test that the generated bit functions match the context-based path."""
+
+        class SignedBits(MessagePartial):
+            bitwise = True
+            fields = {
+                "head": {"type": "bit", "bits": 3, "signed": True},
+                "items": {"type": "bit", "bits": 5, "numlist": 3, "signed": True},
+                "tail": {"type": "bit", "bits": 2, "static": 3},
+            }
+
+        assert SignedBits._bit_pack is not None
+        partial = SignedBits(head=-4, items=[-16, 15, -1], tail=1)
+        generated = partial.serialize_bytes()
+        decoded, consumed = SignedBits.deserialize_bytes(generated + b"\xff")
+
+        pack, unpack = SignedBits._bit_pack, SignedBits._bit_unpack
+        SignedBits._bit_pack = SignedBits._bit_unpack = None
+        try:
+            assert partial._serialize_bitwise("big") == generated
+            assert SignedBits._deserialize_bitwise(generated, "big") == (
+                {"head": -4, "items": [-16, 15, -1], "tail": 1},
+                consumed,
+            )
+        finally:
+            SignedBits._bit_pack, SignedBits._bit_unpack = pack, unpack
+
+        assert consumed == len(generated) == 3
+        assert decoded.fields_equal(partial)
+
 
 class TestMessagePartialEdgeCases:
     """Test edge cases and error handling."""
@@ -765,3 +1107,122 @@ class TestMessagePartialEdgeCases:
         deserialized, _ = SimplePartial.deserialize_bytes(serialized)
 
         assert deserialized.name == "Hello 世界 🌍"
+
+    def test_empty_partial(self):
+        """Test that a field-less partial encodes to nothing."""
+
+        class EmptyPartial(MessagePartial):
+            fields = {}
+
+        assert EmptyPartial().serialize_bytes() == b""
+
+        deserialized, consumed = EmptyPartial.deserialize_bytes(b"trailing")
+        assert isinstance(deserialized, EmptyPartial)
+        assert consumed == 0
+
+    def test_generic_path_numbers_match_compiled_path(self):
+        """Test that the generic path encodes numbers like the compiled plan."""
+
+        class NumberPartial(MessagePartial):
+            encoding = Encoding.LITTLE_ENDIAN
+            fields = {
+                "a": {"type": "int"},
+                "b": {"type": "uint(16)"},
+                "c": {"type": "float"},
+                "d": {"type": "double"},
+                "e": {"type": "int(24)"},
+            }
+
+        partial = NumberPartial(a=-5, b=65535, c=0.5, d=-1.25, e=-3)
+        compiled = partial.serialize_bytes()
+
+        plan = NumberPartial._field_plan
+        NumberPartial._field_plan = None
+        try:
+            assert partial.serialize_bytes() == compiled
+            generic, consumed = NumberPartial.deserialize_bytes(compiled)
+            with pytest.raises(ValueError, match="Insufficient data"):
+                NumberPartial.deserialize_bytes(compiled[:12])
+        finally:
+            NumberPartial._field_plan = plan
+
+        assert consumed == len(compiled)
+        assert generic.fields_equal(partial)
+
+    def test_generic_path_packs_builtin_types(self):
+        """Test generic-path packing of str, bytes and bool, and unknown types."""
+        partial = ComplexPartial()
+
+        assert (
+            partial._serialize_value("hé", {"type": "str"}, "little")
+            == b"\x03\0\0\0h\xc3\xa9"
+        )
+        assert partial._serialize_value(b"\x07", {"type": "bytes"}, "big") == (
+            b"\0\0\0\x01\x07"
+        )
+        assert partial._serialize_value(0, {"type": "bool"}, "big") == b"\x00"
+        with pytest.raises(ValueError, match="Unsupported type: int\\(x\\)"):
+            partial._serialize_value(1, {"type": "int(x)"}, "big")
+
+    def test_fields_are_not_slotted_by_default(self):
+        """Test that subclasses keep field values in __dict__ unless opted in."""
+        assert "__slots__" not in SimplePartial.__dict__
+
+        partial = SimplePartial(name="dict", value=7)
+        assert vars(partial) == {"name": "dict", "value": 7}
+
+    def test_unslotted_field_classes_combine_as_bases(self):
+        """Test that two field-declaring classes can be combined as bases."""
+
+        class Left(MessagePartial):
+            fields = {"a": {"type": "int(8)"}}
+
+        class Right(MessagePartial):
+            fields = {"b": {"type": "int(8)"}}
+
+        class Combined(Left, Right):
+            fields = {"a": {"type": "int(8)"}, "b": {"type": "int(8)"}}
+
+        combined = Combined(a=1, b=2)
+        decoded, _ = Combined.deserialize_bytes(combined.serialize_bytes())
+        assert (decoded.a, decoded.b) == (1, 2)
+
+    def test_fields_are_stored_in_slots(self):
+        """Test that slots=True gives a slot per field and keeps __dict__."""
+
+        class SlottedPartial(MessagePartial, slots=True):
+            encoding = Encoding.BIG_ENDIAN
+            fields = {"name": {"type": "str"}, "value": {"type": "int(32)"}}
+
+        assert SlottedPartial.__slots__ == ("name", "value")
+
+        partial = SlottedPartial(name="slot", value=7)
+        assert "name" not in partial.__dict__
+        assert "value" not in partial.__dict__
+
+        partial.note = "extra"
+        assert partial.note == "extra"
+
+        decoded, _ = SlottedPartial.deserialize_bytes(partial.serialize_bytes())
+        assert decoded.fields_equal(partial)
+
+    def test_slots_skip_names_defined_on_bases(self):
+        """Test that fields shadowing base attributes are not slotted."""
+
+        class Base(MessagePartial, slots=True):
+            fields = {"a": {"type": "int(8)"}}
+
+        class Child(Base, slots=True):
+            fields = {"a": {"type": "int(8)"}, "b": {"type": "int(8)"}}
+
+        class Mixin(MessagePartial):
+            fields = {"c": {"type": "int(8)"}}
+
+        class Both(Base, Mixin, slots=True):
+            fields = {"a": {"type": "int(8)"}, "c": {"type": "int(8)"}}
+
+        assert Child.__slots__ == ("b",)
+        assert Both.__slots__ == ("c",)
+
+        both = Both(a=1, c=2)
+        assert Both.deserialize_bytes(both.serialize_bytes())[0].fields_equal(both)
@@ -1,30 +1,58 @@
 """Tests for Protocol message scheduling feature."""
 
+import os
 import pytest
+import subprocess
+import sys
+import textwrap
 import time
 import threading
 from unittest.mock import Mock
 
 from packerpy.protocols.message import Message
 from packerpy.protocols.message_partial import Encoding
-from packerpy.protocols.protocol import Protocol, protocol
+from packerpy.protocols.protocol import Protocol, _Scheduler, protocol
+
+
+class _CountingCallback:
+    """Send callback that only counts calls, without Mock's call recording."""
+
+    __slots__ = ("call_count", "last_data")
+
+    def __init__(self):
+        self.call_count = 0
+        self.last_data = None
+
+    def __call__(self, data):
+        self.call_count += 1
+        self.last_data = data
+
+
+class _ValueMessage(Message):
+    """Message shared by the scheduling tests; compiled once per module."""
+
+    encoding = Encoding.BIG_ENDIAN
+    fields = {"value": {"type": "int(32)"}}
+
+
+@pytest.fixture
+def value_protocol():
+    """Fresh Protocol with the shared value message registered."""
+    test_protocol = Protocol()
+    test_protocol.register(_ValueMessage)
+    return test_protocol, _ValueMessage
 
 
 class TestMessageScheduling:
     """Test suite for message scheduling functionality."""
 
-    def test_schedule_message_basic(self):
+    def test_schedule_message_basic(self, value_protocol):
         """Test basic message scheduling."""
         # Create protocol and message
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg = TestMessage(value=42)
-        callback = Mock()
+        callback = _CountingCallback()
 
         # Schedule message
         schedule_id = test_protocol.schedule_message(
@@ -44,14 +72,9 @@ class TestMessageScheduling:
         # Verify callback was called multiple times
         assert callback.call_count >= 3
 
-    def test_schedule_message_sends_encoded_data(self):
+    def test_schedule_message_sends_encoded_data(self, value_protocol):
         """Test that scheduled messages send properly encoded data."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg = TestMessage(value=100)
         expected_data = test_protocol.encode(msg)
@@ -88,8 +111,8 @@ class TestMessageScheduling:
         msg1 = Message1(value=1)
         msg2 = Message2(text="test")
 
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = _CountingCallback()
+        callback2 = _CountingCallback()
 
         # Schedule both messages
         id1 = test_protocol.schedule_message(msg1, 0.1, callback1)
@@ -109,17 +132,12 @@ class TestMessageScheduling:
         assert callback1.call_count >= 2
         assert callback2.call_count >= 2
 
-    def test_cancel_scheduled_message(self):
+    def test_cancel_scheduled_message(self, value_protocol):
         """Test cancelling a scheduled message."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg = TestMessage(value=1)
-        callback = Mock()
+        callback = _CountingCallback()
 
         schedule_id = test_protocol.schedule_message(msg, 0.1, callback)
 
@@ -141,17 +159,12 @@ class TestMessageScheduling:
         result = test_protocol.cancel_scheduled_message(999)
         assert result is False
 
-    def test_cancel_all_scheduled_messages(self):
+    def test_cancel_all_scheduled_messages(self, value_protocol):
         """Test cancelling all scheduled messages at once."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         # Schedule multiple messages
-        callbacks = [Mock() for _ in range(3)]
+        callbacks = [_CountingCallback() for _ in range(3)]
         for i, callback in enumerate(callbacks):
             msg = TestMessage(value=i)
             test_protocol.schedule_message(msg, 0.1, callback)
@@ -170,19 +183,14 @@ class TestMessageScheduling:
         for i, callback in enumerate(callbacks):
             assert callback.call_count == counts[i]
 
-    def test_get_scheduled_messages(self):
+    def test_get_scheduled_messages(self, value_protocol):
         """Test retrieving information about scheduled messages."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg1 = TestMessage(value=1)
         msg2 = TestMessage(value=2)
 
-        callback = Mock()
+        callback = _CountingCallback()
 
         id1 = test_protocol.schedule_message(msg1, 1.0, callback)
         id2 = test_protocol.schedule_message(msg2, 2.0, callback)
@@ -200,17 +208,12 @@ class TestMessageScheduling:
         # Clean up
         test_protocol.cancel_all_scheduled_messages()
 
-    def test_schedule_invalid_interval(self):
+    def test_schedule_invalid_interval(self, value_protocol):
         """Test that scheduling with invalid interval raises error."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg = TestMessage(value=1)
-        callback = Mock()
+        callback = _CountingCallback()
 
         # Test zero interval
         with pytest.raises(ValueError, match="Interval must be positive"):
@@ -261,20 +264,15 @@ class TestMessageScheduling:
         # Verify it kept trying despite exceptions
         assert call_count >= 3
 
-    def test_different_intervals(self):
+    def test_different_intervals(self, value_protocol):
         """Test that different intervals work correctly."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg1 = TestMessage(value=1)
         msg2 = TestMessage(value=2)
 
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = _CountingCallback()
+        callback2 = _CountingCallback()
 
         # Schedule with different intervals
         id1 = test_protocol.schedule_message(msg1, 0.1, callback1)  # Fast
@@ -293,21 +291,16 @@ class TestMessageScheduling:
         assert callback2.call_count >= 2
         assert callback1.call_count > callback2.call_count
 
-    def test_thread_safety(self):
+    def test_thread_safety(self, value_protocol):
         """Test thread-safe scheduling and cancellation."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         schedule_ids = []
 
         def schedule_many():
             for i in range(10):
                 msg = TestMessage(value=i)
-                sid = test_protocol.schedule_message(msg, 0.5, Mock())
+                sid = test_protocol.schedule_message(msg, 0.5, _CountingCallback())
                 schedule_ids.append(sid)
 
         # Schedule from multiple threads
@@ -335,7 +328,7 @@ class TestMessageScheduling:
             fields = {"counter": {"type": "int(32)"}}
 
         msg = CounterMessage(counter=0)
-        callback = Mock()
+        callback = _CountingCallback()
 
         # Define update callback that increments counter
         def update_counter(m):
@@ -398,17 +391,12 @@ class TestMessageScheduling:
         # All timestamps should be unique (updated each time)
         assert len(set(timestamps)) == len(timestamps)
 
-    def test_update_callback_none(self):
+    def test_update_callback_none(self, value_protocol):
         """Test that None update callback works (backward compatibility)."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg = TestMessage(value=42)
-        callback = Mock()
+        callback = _CountingCallback()
 
         # Schedule without update callback (None)
         schedule_id = test_protocol.schedule_message(msg, 0.1, callback, None)
@@ -421,17 +409,12 @@ class TestMessageScheduling:
         # Value should remain unchanged
         assert msg.value == 42
 
-    def test_update_callback_exception_handling(self):
+    def test_update_callback_exception_handling(self, value_protocol):
         """Test that exceptions in update callback are handled."""
-        test_protocol = Protocol()
-
-        @protocol(test_protocol)
-        class TestMessage(Message):
-            encoding = Encoding.BIG_ENDIAN
-            fields = {"value": {"type": "int(32)"}}
+        test_protocol, TestMessage = value_protocol
 
         msg = TestMessage(value=1)
-        callback = Mock()
+        callback = _CountingCallback()
 
         call_count = 0
 
@@ -493,3 +476,232 @@ class TestMessageScheduling:
             # First: seq=1, value=101
             # Second: seq=2, value=103
             # Third: seq=3, value=106
+
+    def test_thread_count_does_not_grow_with_schedules(self, value_protocol):
+        """Test that schedules share one dispatcher and a bounded worker pool."""
+        test_protocol, TestMessage = value_protocol
+
+        before = threading.active_count()
+        callbacks = [_CountingCallback() for _ in range(20)]
+        for i, callback in enumerate(callbacks):
+            test_protocol.schedule_message(TestMessage(value=i), 0.05, callback)
+
+        time.sleep(0.15)
+        assert threading.active_count() <= before + 1 + _Scheduler.max_workers
+        test_protocol.cancel_all_scheduled_messages()
+
+        for callback in callbacks:
+            assert callback.call_count >= 2
+
+        # The dispatcher and its pool exit once nothing is scheduled
+        time.sleep(0.1)
+        assert threading.active_count() <= before
+
+    def test_interpreter_exits_with_live_schedules(self):
+        """Test that exiting without cancelling neither errors nor hangs."""
+        script = textwrap.dedent("""
+            import threading, time
+            from packerpy.protocols.message import Message
+            from packerpy.protocols.protocol import Protocol
+
+            class Ping(Message):
+                fields = {"value": {"type": "int(32)"}}
+
+            proto = Protocol()
+            proto.register(Ping)
+            proto.schedule_message(Ping(value=1), 0.001, lambda data: None)
+            proto.schedule_message(
+                Ping(value=2), 0.001, lambda data: threading.Event().wait()
+            )
+            time.sleep(0.05)
+            """)
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env={
+                **os.environ,
+                "PYTHONPATH": os.path.join(os.path.dirname(__file__), "../../src"),
+            },
+        )
+
+        assert result.returncode == 0
+        assert result.stderr == ""
+
+    def test_slow_callback_does_not_delay_other_schedules(self, value_protocol):
+        """Test that a blocking send callback does not hold up other messages."""
+        test_protocol, TestMessage = value_protocol
+
+        release = threading.Event()
+        slow_calls = []
+
+        def slow_callback(data):
+            slow_calls.append(data)
+            release.wait(1.0)
+
+        fast_callback = _CountingCallback()
+        slow_id = test_protocol.schedule_message(
+            TestMessage(value=1), 0.05, slow_callback
+        )
+        fast_id = test_protocol.schedule_message(
+            TestMessage(value=2), 0.05, fast_callback
+        )
+
+        time.sleep(0.2)
+        fast_count = fast_callback.call_count
+        release.set()
+        test_protocol.cancel_scheduled_message(slow_id)
+        test_protocol.cancel_scheduled_message(fast_id)
+
+        # The slow entry is never sent again while its previous send runs
+        assert len(slow_calls) == 1
+        assert fast_count >= 3
+
+    def test_message_without_update_callback_is_encoded_once(self, value_protocol):
+        """Test that a static scheduled message is not re-encoded on every send."""
+        test_protocol, TestMessage = value_protocol
+
+        msg = TestMessage(value=7)
+        expected_data = test_protocol.encode(msg)
+        callback = Mock()
+
+        encode = Mock(wraps=test_protocol.encode)
+        test_protocol.encode = encode
+
+        schedule_id = test_protocol.schedule_message(msg, 0.05, callback)
+        time.sleep(0.18)
+        test_protocol.cancel_scheduled_message(schedule_id)
+
+        assert callback.call_count >= 3
+        assert encode.call_count == 1
+        for call in callback.call_args_list:
+            assert call.args == (expected_data,)
+
+    def test_header_change_refreshes_scheduled_bytes(self, value_protocol):
+        """Test that changing headers re-encodes a cached scheduled message."""
+        test_protocol, TestMessage = value_protocol
+
+        msg = TestMessage(value=7)
+        callback = Mock()
+
+        schedule_id = test_protocol.schedule_message(msg, 0.05, callback)
+        time.sleep(0.02)
+        test_protocol.set_headers({"marker": {"type": "uint(8)", "static": 0xAB}})
+        expected_data = test_protocol.encode(msg)
+        time.sleep(0.1)
+        test_protocol.cancel_scheduled_message(schedule_id)
+
+        callback.assert_called_with(expected_data)
+
+    def test_compute_header_is_recomputed_per_send(self, value_protocol):
+        """Test that scheduled sends are not cached while a header is computed."""
+        test_protocol, TestMessage = value_protocol
+        counter = iter(range(256))
+        test_protocol.set_headers(
+            {"sequence": {"type": "uint(8)", "compute": lambda msg: next(counter)}}
+        )
+        sent = []
+
+        schedule_id = test_protocol.schedule_message(
+            TestMessage(value=7), 0.05, sent.append
+        )
+        time.sleep(0.18)
+        test_protocol.cancel_scheduled_message(schedule_id)
+
+        assert len(sent) >= 3
+        # Each send carries the next sequence number, not a cached copy
+        assert len(set(sent)) == len(sent)
+
+    def test_get_scheduled_messages_is_live_view(self, value_protocol):
+        """Test that get_scheduled_messages reflects later changes."""
+        test_protocol, TestMessage = value_protocol
+
+        scheduled = test_protocol.get_scheduled_messages()
+        assert len(scheduled) == 0
+
+        msg = TestMessage(value=1)
+        schedule_id = test_protocol.schedule_message(msg, 1.0, Mock())
+        assert dict(scheduled) == {schedule_id: {"message": msg, "interval": 1.0}}
+
+        with pytest.raises(TypeError):
+            scheduled[schedule_id] = {}
+
+        test_protocol.cancel_scheduled_message(schedule_id)
+        assert schedule_id not in scheduled
+        assert len(scheduled) == 0
+
+    def test_scheduled_entries_have_no_instance_dict(self, value_protocol):
+        """Test that per-schedule entries are slotted."""
+        test_protocol, TestMessage = value_protocol
+
+        schedule_id = test_protocol.schedule_message(
+            TestMessage(value=1), 1.0, _CountingCallback()
+        )
+        entry = test_protocol._scheduled_messages[schedule_id]
+        test_protocol.cancel_all_scheduled_messages()
+
+        assert not hasattr(entry, "__dict__")
+
+    def test_update_callback_sends_validate_once(self):
+        """Test that updated scheduled messages are only validated up front."""
+        test_protocol = Protocol()
+        validations = []
+
+        @protocol(test_protocol)
+        class CounterMessage(Message):
+            encoding = Encoding.BIG_ENDIAN
+            fields = {"counter": {"type": "int(32)"}}
+
+            def validate(self):
+                validations.append(self.counter)
+                return super().validate()
+
+        msg = CounterMessage(counter=0)
+        sent_data = []
+
+        def update_counter(m):
+            m.counter += 1
+
+        schedule_id = test_protocol.schedule_message(
+            msg, 0.05, sent_data.append, update_counter
+        )
+        time.sleep(0.18)
+        test_protocol.cancel_scheduled_message(schedule_id)
+
+        assert len(sent_data) >= 3
+        # Once by schedule_message, once by the first send's encode()
+        assert len(validations) == 2
+        decoded = [test_protocol.decode(data)[0].counter for data in sent_data]
+        assert decoded == list(range(1, len(sent_data) + 1))
+
+    def test_schedule_into_sink(self, value_protocol):
+        """Test scheduling into a bytearray sink instead of a callback."""
+        test_protocol, TestMessage = value_protocol
+
+        msg = TestMessage(value=3)
+        expected_data = test_protocol.encode(msg)
+        sink = bytearray()
+
+        schedule_id = test_protocol.schedule_message(msg, 0.05, sink=sink)
+        time.sleep(0.13)
+        test_protocol.cancel_scheduled_message(schedule_id)
+
+        data = test_protocol.drain_sink(sink)
+        assert len(data) >= 2 * len(expected_data)
+        assert data == expected_data * (len(data) // len(expected_data))
+        assert sink == bytearray()
+
+    def test_schedule_requires_one_destination(self, value_protocol):
+        """Test that exactly one of send_callback and sink must be given."""
+        test_protocol, TestMessage = value_protocol
+        msg = TestMessage(value=1)
+
+        with pytest.raises(ValueError, match="send_callback or sink"):
+            test_protocol.schedule_message(msg, 0.1)
+        with pytest.raises(ValueError, match="either send_callback or sink"):
+            test_protocol.schedule_message(
+                msg, 0.1, _CountingCallback(), sink=bytearray()
+            )
+        assert len(test_protocol.get_scheduled_messages()) == 0
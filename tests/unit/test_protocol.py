@@ -76,6 +76,16 @@ class TestProtocol:
         assert isinstance(encoded, bytes)
         assert len(encoded) > 4  # Type header + data
 
+    def test_encode_type_header(self):
+        """Test the type header is the 2-byte length-prefixed class name."""
+        proto = Protocol()
+        proto.register(SampleMessageA)
+
+        encoded = proto.encode(SampleMessageA(value_a=42))
+
+        assert encoded.startswith(b"\x00\x0eSampleMessageA")
+        assert SampleMessageA._type_header == b"\x00\x0eSampleMessageA"
+
     def test_encode_unregistered_message_raises_error(self):
         """Test encoding unregistered message raises error."""
         proto = Protocol()
@@ -88,6 +98,18 @@ class TestProtocol:
         with pytest.raises(ValueError, match="not registered"):
             proto.encode(msg)
 
+    def test_encode_same_named_unregistered_class_raises_error(self):
+        """Test encoding a class that only shares a registered class's name."""
+        proto = Protocol()
+        proto.register(SampleMessageA)
+
+        impostor = type(
+            "SampleMessageA", (Message,), {"fields": {"other": {"type": "str"}}}
+        )
+
+        with pytest.raises(ValueError, match="not registered"):
+            proto.encode(impostor(other="x"))
+
     def test_decode_registered_message(self):
         """Test decoding returns correct message type."""
         proto = Protocol()
@@ -158,6 +180,33 @@ class TestProtocol:
         # Should return InvalidMessage when type is not registered
         assert isinstance(decoded, InvalidMessage)
 
+    def test_decode_unknown_type_reports_name(self):
+        """Test decoding an unknown type keeps the wire name on InvalidMessage."""
+        from packerpy.protocols.protocol import InvalidMessage
+
+        proto = Protocol()
+        proto.register(SampleMessageA)
+
+        name = "Unknown".encode("utf-8")
+        result = proto.decode(len(name).to_bytes(2, "big") + name + b"\x00" * 4)
+        assert result is not None
+        decoded, _ = result
+        assert isinstance(decoded, InvalidMessage)
+        assert decoded.partial_type == "Unknown"
+        assert "Unknown message type 'Unknown'" in str(decoded.error)
+
+    def test_decode_bytearray_input(self):
+        """Test decoding from a bytearray looks up the type by its wire name."""
+        proto = Protocol()
+        proto.register(SampleMessageA)
+
+        data = bytearray(proto.encode(SampleMessageA(value_a=7)))
+        decoded, remaining = proto.decode(data)
+
+        assert isinstance(decoded, SampleMessageA)
+        assert decoded.value_a == 7
+        assert remaining == b""
+
     def test_decode_invalid_data_returns_none(self):
         """Test decode with invalid data returns None."""
         proto = Protocol()
@@ -186,6 +235,23 @@ class TestProtocol:
         result = Protocol.validate_message(msg)
         assert result is True
 
+    def test_validate_message_without_required_fields(self):
+        """Test messages with only optional fields validate without checks."""
+
+        class OptionalOnly(Message):
+            fields = {
+                "size": {"type": "uint(8)", "compute": lambda msg: 0},
+                "note": {"type": "str", "condition": lambda msg: False},
+            }
+
+        class Rejecting(OptionalOnly):
+            def validate(self):
+                return False
+
+        assert Protocol.validate_message(OptionalOnly())
+        # An overridden validate() is still consulted
+        assert not Protocol.validate_message(Rejecting())
+
     def test_encode_message_legacy_alias(self):
         """Test encode_message as legacy alias for encode."""
         proto = Protocol()
@@ -216,6 +282,36 @@ class TestProtocol:
         assert isinstance(result2, SampleMessageA)
         assert decoded1.value_a == result2.value_a
 
+    def test_decode_one_returns_message_only(self):
+        """Test decode_one returns the message and drops trailing bytes."""
+        proto = Protocol()
+        proto.register(SampleMessageA)
+
+        encoded = proto.encode(SampleMessageA(value_a=5))
+        decoded = proto.decode_one(encoded + b"trailing")
+
+        assert isinstance(decoded, SampleMessageA)
+        assert decoded.value_a == 5
+        assert proto.decode_one(encoded[:1]) is None
+        assert proto.get_incomplete_buffer_size() == 1
+
+    def test_encode_into_matches_encode(self):
+        """Test encode_into writes encode()'s bytes at an offset."""
+        proto = Protocol()
+        proto.register(SampleMessageB)
+        msg = SampleMessageB(value_b=7, name="scratch")
+        expected = proto.encode(msg)
+
+        buf = bytearray(64)
+        written = proto.encode_into(buf, msg, offset=3)
+
+        assert written == len(expected)
+        assert buf[3 : 3 + written] == expected
+        assert len(buf) == 64
+
+        with pytest.raises(ValueError, match="Buffer too small"):
+            proto.encode_into(bytearray(len(expected) - 1), msg)
+
     def test_round_trip_encode_decode(self):
         """Test encoding and then decoding a message."""
         proto = Protocol()
@@ -1,5 +1,7 @@
 """Unit tests for protocols.serializer module."""
 
+import logging
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -117,13 +119,13 @@ class TestBytesSerializer:
         assert callable(serializer.deserialize)
 
     @patch("packerpy.protocols.message.Message.deserialize_bytes")
-    def test_deserialize_prints_error_message(self, mock_deserialize, capsys):
-        """Test that deserialize prints error message on failure."""
+    def test_deserialize_logs_error_message(self, mock_deserialize, caplog):
+        """Test that deserialize logs a warning on failure."""
         serializer = BytesSerializer()
         mock_deserialize.side_effect = ValueError("Test error")
 
-        result = serializer.deserialize(b"bad_data")
+        with caplog.at_level(logging.WARNING, logger="packerpy.protocols.serializer"):
+            result = serializer.deserialize(b"bad_data")
 
-        captured = capsys.readouterr()
-        assert "Bytes deserialization failed:" in captured.out
+        assert "Bytes deserialization failed: Test error" in caplog.text
         assert result is None
@@ -1,13 +1,29 @@
 """Unit tests for server module."""
 
+import asyncio
+import logging
 import threading
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
 
 from packerpy.server import Server, ConnectionStatus
 from packerpy.protocols.protocol import Protocol
 from packerpy.protocols.message import Message
 
 
+@pytest.fixture
+def server():
+    """Server on the default test address with no handler."""
+    return Server("0.0.0.0", 8080)
+
+
+@pytest.fixture
+def mock_message():
+    """Message stand-in for tests that only pass it through the server."""
+    return Mock(spec=Message)
+
+
 class TestServerConnectionStatus:
     """Test ConnectionStatus enum for server."""
 
@@ -51,119 +67,146 @@ class TestServer:
         assert server.host == "0.0.0.0"
         assert server.port == 8080
 
-    def test_handle_raw_data_decode_failure(self):
+    def test_handle_raw_data_decode_failure(self, server):
         """Test handling data that fails to decode."""
-        server = Server("0.0.0.0", 8080)
-
         with patch.object(server.protocol, "decode", return_value=None):
             result = server._handle_raw_data(b"invalid", ("127.0.0.1", 54321))
 
         # Failed decode returns None instead of error message
         assert result is None
 
-    def test_handle_raw_data_invalid_message(self):
+    def test_handle_raw_data_invalid_message(self, server, mock_message):
         """Test handling invalid message."""
-        server = Server("0.0.0.0", 8080)
-        mock_message = Mock(spec=Message)
-
-        with patch.object(
-            server.protocol, "decode", return_value=(mock_message, b"")
-        ), patch.object(server.protocol, "validate_message", return_value=False):
+        with (
+            patch.object(server.protocol, "decode", return_value=(mock_message, b"")),
+            patch.object(server.protocol, "validate_message", return_value=False),
+        ):
             result = server._handle_raw_data(b"data", ("127.0.0.1", 54321))
 
         # Invalid message returns None instead of error message
         assert result is None
 
-    def test_handle_raw_data_stores_in_queue(self):
+    def test_handle_raw_data_stores_in_queue(self, server, mock_message):
         """Test that valid messages are stored in queue."""
-        server = Server("0.0.0.0", 8080)
-        mock_message = Mock(spec=Message)
-
-        with patch.object(
-            server.protocol, "decode", return_value=(mock_message, b"")
-        ), patch.object(server.protocol, "validate_message", return_value=True):
+        with (
+            patch.object(server.protocol, "decode", return_value=(mock_message, b"")),
+            patch.object(server.protocol, "validate_message", return_value=True),
+        ):
 
             server._handle_raw_data(b"data", ("127.0.0.1", 54321))
 
-        assert not server._received_messages.empty()
-        msg, addr = server._received_messages.get()
+        assert len(server._received_messages) == 1
+        msg, addr = server._received_messages.popleft()
         assert msg == mock_message
         assert addr == ("127.0.0.1", 54321)
 
-    def test_handle_raw_data_with_handler(self):
+    def test_handle_raw_data_with_handler(self, mock_message):
         """Test handling data with message handler."""
-        handler = Mock(return_value=Mock(spec=Message))
+        response = object()
+        calls = []
+
+        def handler(message, address):
+            calls.append((message, address))
+            return response
+
         server = Server("0.0.0.0", 8080, message_handler=handler)
-        mock_message = Mock(spec=Message)
-
-        with patch.object(
-            server.protocol, "decode", return_value=(mock_message, b"")
-        ), patch.object(
-            server.protocol, "validate_message", return_value=True
-        ), patch.object(
-            server.protocol, "encode_message", return_value=b"response"
+
+        with (
+            patch.object(server.protocol, "decode", return_value=(mock_message, b"")),
+            patch.object(server.protocol, "validate_message", return_value=True),
+            patch.object(
+                server.protocol, "encode_message", return_value=b"response"
+            ) as encode_message,
         ):
 
             result = server._handle_raw_data(b"data", ("127.0.0.1", 54321))
 
-        handler.assert_called_once_with(mock_message, ("127.0.0.1", 54321))
+        assert calls == [(mock_message, ("127.0.0.1", 54321))]
+        encode_message.assert_called_once_with(response)
         assert result == b"response"
 
-    def test_handle_raw_data_handler_returns_none(self):
+    def test_handle_raw_data_handler_returns_none(self, mock_message):
         """Test when message handler returns None."""
         handler = Mock(return_value=None)
         server = Server("0.0.0.0", 8080, message_handler=handler)
-        mock_message = Mock(spec=Message)
 
-        with patch.object(
-            server.protocol, "decode", return_value=(mock_message, b"")
-        ), patch.object(server.protocol, "validate_message", return_value=True):
+        with (
+            patch.object(server.protocol, "decode", return_value=(mock_message, b"")),
+            patch.object(server.protocol, "validate_message", return_value=True),
+        ):
 
             result = server._handle_raw_data(b"data", ("127.0.0.1", 54321))
 
         assert result is None
 
     @patch("packerpy.server.AsyncTCPServer")
-    def test_start_creates_thread(self, mock_async_server):
+    def test_start_creates_thread(self, mock_async_server, server):
         """Test that start creates background thread."""
-        server = Server("0.0.0.0", 8080)
-
         with patch.object(threading.Thread, "start"):
             server.start()
 
         assert server._server_thread is not None
 
-    def test_stop(self):
-        """Test stopping server."""
-        server = Server("0.0.0.0", 8080)
-        server._status = ConnectionStatus.RUNNING
+    def test_start_in_thread_uses_executor(self, server):
+        """Test that start_in_thread submits to a supplied executor."""
+        executor = Mock()
+
+        server.start_in_thread(executor=executor)
+
+        executor.submit.assert_called_once_with(server._run_in_thread)
+        assert server._server_future is executor.submit.return_value
+        assert server._server_thread is None
+
+    def test_stop_executor_job(self, server):
+        """Test stopping a server running on an executor."""
         server._loop = Mock()
-        mock_transport = Mock()
-        server._transport = mock_transport
-        server._server_thread = Mock()
+        server._task = Mock()
+        server._server_future = Mock()
+
+        assert server.stop() is None
+
+        server._loop.call_soon_threadsafe.assert_called_once_with(server._task.cancel)
+        server._server_future.result.assert_called_once_with(timeout=5.0)
+
+    @pytest.mark.asyncio
+    async def test_stop(self, server):
+        """Test stopping a server running on the caller's loop."""
+        with patch("packerpy.server.AsyncTCPServer") as mock_async_server:
+            mock_async_server.return_value.start = AsyncMock(
+                side_effect=asyncio.Event().wait
+            )
+            server.start()
+            await asyncio.sleep(0)
+            assert server.get_status() == ConnectionStatus.RUNNING
 
-        # Mock run_coroutine_threadsafe to avoid creating unawaited coroutines
-        with patch("asyncio.run_coroutine_threadsafe") as mock_run_coro:
-            mock_future = Mock()
-            mock_future.result = Mock(return_value=None)
-            mock_run_coro.return_value = mock_future
+            await server.stop()
 
-            server.stop()
+        assert server._server_thread is None
+        assert server._task.done()
+        assert server.get_status() == ConnectionStatus.STOPPED
+
+    def test_stop_threaded(self, server):
+        """Test stopping a server running in a background thread."""
+        server._loop = Mock()
+        server._task = Mock()
+        server._server_thread = Mock()
 
+        assert server.stop() is None
+
+        server._loop.call_soon_threadsafe.assert_called_once_with(server._task.cancel)
+        server._server_thread.join.assert_called_once()
         assert server._status == ConnectionStatus.STOPPING
 
-    def test_get_status(self):
+    def test_get_status(self, server):
         """Test getting server status."""
-        server = Server("0.0.0.0", 8080)
         server._status = ConnectionStatus.RUNNING
 
         status = server.get_status()
 
         assert status == ConnectionStatus.RUNNING
 
-    def test_get_error(self):
+    def test_get_error(self, server):
         """Test getting last error."""
-        server = Server("0.0.0.0", 8080)
         test_error = ValueError("Test error")
         server._error = test_error
 
@@ -171,69 +214,101 @@ class TestServer:
 
         assert error == test_error
 
-    def test_get_error_when_none(self):
+    def test_get_error_when_none(self, server):
         """Test getting error when none exists."""
-        server = Server("0.0.0.0", 8080)
-
         error = server.get_error()
 
         assert error is None
 
-    def test_receive_with_timeout(self):
+    def test_receive_with_timeout(self, server):
         """Test receiving message with timeout."""
-        server = Server("0.0.0.0", 8080)
-
-        result = server.receive(timeout=0.1)
+        result = server.receive(timeout=0.01)
 
         assert result is None
 
-    def test_receive_returns_message_from_queue(self):
+    def test_receive_returns_message_from_queue(self, server, mock_message):
         """Test receiving returns message and address from queue."""
-        server = Server("0.0.0.0", 8080)
-        mock_message = Mock(spec=Message)
         address = ("127.0.0.1", 54321)
-        server._received_messages.put((mock_message, address))
+        server._received_messages.append((mock_message, address))
 
         result = server.receive(timeout=0.1)
 
         assert result == (mock_message, address)
 
-    def test_receive_non_blocking(self):
-        """Test non-blocking receive."""
-        server = Server("0.0.0.0", 8080)
+    def test_receive_wakes_on_message_from_another_thread(self, server, mock_message):
+        """Test a blocking receive returns once another thread queues a message."""
+        address = ("127.0.0.1", 54321)
+        timer = threading.Timer(0.05, server._queue_message, [(mock_message, address)])
+        timer.start()
+
+        assert server.receive(timeout=2.0) == (mock_message, address)
+        timer.join()
 
+    def test_receive_non_blocking(self, server):
+        """Test non-blocking receive."""
         result = server.receive(timeout=0)
 
         assert result is None
 
-    def test_send_invalid_message(self, capsys):
-        """Test sending invalid message returns False."""
-        server = Server("0.0.0.0", 8080)
-        mock_message = Mock(spec=Message)
+    @pytest.mark.asyncio
+    async def test_receive_async_with_timeout(self, server):
+        """Test receive_async returns None once the timeout passes."""
+        assert await server.receive_async(timeout=0.001) is None
+        assert len(server._receive_waiters) == 0
+
+    @pytest.mark.asyncio
+    async def test_receive_async_wakes_on_queued_message(self, server, mock_message):
+        """Test that a waiting receive_async returns once a message is queued."""
+        address = ("127.0.0.1", 54321)
+        waiter = asyncio.ensure_future(server.receive_async(timeout=1.0))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        server._queue_message((mock_message, address))
+
+        assert await waiter == (mock_message, address)
+        assert len(server._received_messages) == 0
+
+    @pytest.mark.asyncio
+    async def test_receive_async_wakes_from_another_thread(self, server, mock_message):
+        """Test a message queued on another thread wakes receive_async promptly."""
+        address = ("127.0.0.1", 54321)
+        loop = asyncio.get_running_loop()
+        timer = threading.Timer(0.05, server._queue_message, [(mock_message, address)])
+        timer.start()
+
+        started = loop.time()
+        result = await server.receive_async(timeout=2.0)
+
+        assert result == (mock_message, address)
+        assert loop.time() - started < 1.0
+        timer.join()
 
+    @pytest.mark.asyncio
+    async def test_receive_async_non_blocking(self, server):
+        """Test non-blocking receive_async."""
+        assert await server.receive_async(timeout=0) is None
+
+    def test_send_invalid_message(self, server, caplog, mock_message):
+        """Test sending invalid message returns False."""
         with patch.object(server.protocol, "validate_message", return_value=False):
-            result = server.send(mock_message, ("127.0.0.1", 54321))
+            with caplog.at_level(logging.WARNING, logger="packerpy.server"):
+                result = server.send(mock_message, ("127.0.0.1", 54321))
 
         assert result is False
-        captured = capsys.readouterr()
-        assert "Invalid message" in captured.out
-
-    def test_send_prints_warning(self, capsys):
-        """Test that send prints warning about connection management."""
-        server = Server("0.0.0.0", 8080)
-        mock_message = Mock(spec=Message)
+        assert "Invalid message" in caplog.text
 
+    def test_send_logs_warning(self, server, caplog, mock_message):
+        """Test that send logs a warning about connection management."""
         with patch.object(server.protocol, "validate_message", return_value=True):
-            result = server.send(mock_message, ("127.0.0.1", 54321))
+            with caplog.at_level(logging.WARNING, logger="packerpy.server"):
+                result = server.send(mock_message, ("127.0.0.1", 54321))
 
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "connection management" in caplog.text
         assert result is False
 
-    def test_status_transitions(self):
+    def test_status_transitions(self, server):
         """Test server status transitions."""
-        server = Server("0.0.0.0", 8080)
-
         # Initial state
         assert server.get_status() == ConnectionStatus.STOPPED
 
@@ -253,73 +328,66 @@ class TestServer:
         server._status = ConnectionStatus.ERROR
         assert server.get_status() == ConnectionStatus.ERROR
 
-    def test_protocol_decode_and_encode(self):
+    def test_protocol_decode_and_encode(self, server):
         """Test that protocol is used for decode and encode."""
-        server = Server("0.0.0.0", 8080)
-
         assert isinstance(server.protocol, Protocol)
         assert hasattr(server.protocol, "decode_message")
         assert hasattr(server.protocol, "encode_message")
         assert hasattr(server.protocol, "validate_message")
 
-    def test_multiple_messages_in_queue(self):
+    def test_multiple_messages_in_queue(self, server):
         """Test receiving multiple messages from queue."""
-        server = Server("0.0.0.0", 8080)
-
         msg1 = Mock(spec=Message)
         msg2 = Mock(spec=Message)
         addr1 = ("127.0.0.1", 54321)
         addr2 = ("127.0.0.1", 54322)
 
-        server._received_messages.put((msg1, addr1))
-        server._received_messages.put((msg2, addr2))
+        server._received_messages.append((msg1, addr1))
+        server._received_messages.append((msg2, addr2))
 
         result1 = server.receive(timeout=0.1)
         result2 = server.receive(timeout=0.1)
-        result3 = server.receive(timeout=0.1)
+        result3 = server.receive(timeout=0)
 
         assert result1 == (msg1, addr1)
         assert result2 == (msg2, addr2)
         assert result3 is None
 
-    def test_received_messages_queue_empty(self):
+    def test_received_messages_queue_empty(self, server):
         """Test that received messages queue starts empty."""
-        server = Server("0.0.0.0", 8080)
-
-        assert server._received_messages.empty()
+        assert len(server._received_messages) == 0
 
-    def test_error_message_creation(self):
+    def test_error_message_creation(self, server):
         """Test that decode errors return None instead of error messages."""
-        server = Server("0.0.0.0", 8080)
-
         with patch.object(server.protocol, "decode", return_value=None):
             result = server._handle_raw_data(b"invalid", ("127.0.0.1", 54321))
 
         # Decode failures now return None
         assert result is None
 
-    def test_handler_called_with_message_and_address(self):
+    def test_handler_called_with_message_and_address(self, mock_message):
         """Test that handler is called with correct parameters."""
-        handler = Mock(return_value=None)
-        server = Server("0.0.0.0", 8080, message_handler=handler)
-        mock_message = Mock(spec=Message)
+        calls = []
+        server = Server(
+            "0.0.0.0",
+            8080,
+            message_handler=lambda message, address: calls.append((message, address)),
+        )
         address = ("192.168.1.100", 12345)
 
-        with patch.object(
-            server.protocol, "decode", return_value=(mock_message, b"")
-        ), patch.object(server.protocol, "validate_message", return_value=True):
+        with (
+            patch.object(server.protocol, "decode", return_value=(mock_message, b"")),
+            patch.object(server.protocol, "validate_message", return_value=True),
+        ):
 
             server._handle_raw_data(b"data", address)
 
-        handler.assert_called_once_with(mock_message, address)
+        assert calls == [(mock_message, address)]
 
-    def test_receive_with_none_timeout_blocks(self):
+    def test_receive_with_none_timeout_blocks(self, server, mock_message):
         """Test that receive with None timeout would block."""
-        server = Server("0.0.0.0", 8080)
-
         # Put a message so it doesn't block
-        mock_message = Mock(spec=Message)
-        server._received_messages.put((mock_message, ("127.0.0.1", 54321)))
+        server._received_messages.append((mock_message, ("127.0.0.1", 54321)))
 
         result = server.receive(timeout=None)
 
@@ -1,49 +1,167 @@
 """Test static field values in Messages."""
 
+from enum import IntEnum
+
 import pytest
 from packerpy.protocols import Protocol, Message, protocol
-from packerpy.protocols.message_partial import Encoding
-
-
-def test_static_field_basic():
-    """Test basic static field functionality."""
-    test_protocol = Protocol()
-
-    @protocol(test_protocol)
-    class MagicMessage(Message):
-        encoding = Encoding.BIG_ENDIAN
-        fields = {
-            "magic": {"type": "int(32)", "static": 0x12345678},
-            "version": {"type": "int(16)", "static": 1},
-            "data": {"type": "str"},
-        }
-
-    # Create message - static fields should be set automatically
-    msg = MagicMessage(data="Hello")
-
-    # Verify static fields are set
-    assert msg.magic == 0x12345678
-    assert msg.version == 1
-    assert msg.data == "Hello"
-
-    # Encode
-    encoded = test_protocol.encode(msg)
-
-    # Decode
-    result = test_protocol.decode(encoded)
+from packerpy.protocols.message_partial import Encoding, _NO_STATIC
+
+
+@pytest.fixture
+def test_protocol():
+    """Fresh Protocol for registering each test's message classes."""
+    return Protocol()
+
+
+# Round-trip cases share one protocol and are defined once per module
+_PROTOCOL = Protocol()
+
+
+class MessageType(IntEnum):
+    REQUEST = 1
+    RESPONSE = 2
+    ERROR = 3
+
+
+@protocol(_PROTOCOL)
+class MagicMessage(Message):
+    encoding = Encoding.BIG_ENDIAN
+    fields = {
+        "magic": {"type": "int(32)", "static": 0x12345678},
+        "version": {"type": "int(16)", "static": 1},
+        "data": {"type": "str"},
+    }
+
+
+@protocol(_PROTOCOL)
+class VerifyMessage(Message):
+    fields = {
+        "header": {"type": "uint(16)", "static": 0xABCD},
+        "payload": {"type": "int(32)"},
+    }
+
+
+@protocol(_PROTOCOL)
+class MultiTypeMessage(Message):
+    encoding = Encoding.LITTLE_ENDIAN
+    fields = {
+        "magic_byte": {"type": "uint(8)", "static": 0xFF},
+        "protocol_version": {"type": "uint(16)", "static": 256},
+        "flags": {"type": "uint(32)", "static": 0x0000FFFF},
+        "identifier": {"type": "str", "static": "PROTO"},
+        "data": {"type": "bytes"},
+    }
+
+
+@protocol(_PROTOCOL)
+class BoolMessage(Message):
+    fields = {
+        "is_request": {"type": "bool", "static": True},
+        "data": {"type": "int(32)"},
+    }
+
+
+@protocol(_PROTOCOL)
+class RequestMessage(Message):
+    fields = {
+        "msg_type": {
+            "type": "enum",
+            "enum": MessageType,
+            "size": 1,
+            "static": MessageType.REQUEST,
+        },
+        "data": {"type": "int(32)"},
+    }
+
+
+@protocol(_PROTOCOL)
+class OrderedMessage(Message):
+    fields = {
+        "header1": {"type": "uint(16)", "static": 0x1111},
+        "dynamic1": {"type": "uint(16)"},
+        "header2": {"type": "uint(16)", "static": 0x2222},
+        "dynamic2": {"type": "uint(16)"},
+        "footer": {"type": "uint(16)", "static": 0xFFFF},
+    }
+
+
+@protocol(_PROTOCOL)
+class AutoMessage(Message):
+    fields = {
+        "magic": {"type": "uint(32)", "static": 0xDEADBEEF},
+        "data": {"type": "str"},
+    }
+
+
+@pytest.mark.parametrize(
+    "cls, kwargs, static_fields",
+    [
+        pytest.param(
+            MagicMessage,
+            {"data": "Hello"},
+            {"magic": 0x12345678, "version": 1},
+            id="basic",
+        ),
+        pytest.param(
+            VerifyMessage, {"payload": 123}, {"header": 0xABCD}, id="verification"
+        ),
+        pytest.param(
+            VerifyMessage, {"payload": 456}, {"header": 0xABCD}, id="same_static"
+        ),
+        pytest.param(
+            MultiTypeMessage,
+            {"data": b"test data"},
+            {
+                "magic_byte": 0xFF,
+                "protocol_version": 256,
+                "flags": 0x0000FFFF,
+                "identifier": "PROTO",
+            },
+            id="multiple_types",
+        ),
+        pytest.param(BoolMessage, {"data": 42}, {"is_request": True}, id="bool"),
+        pytest.param(
+            RequestMessage,
+            {"data": 100},
+            {"msg_type": MessageType.REQUEST},
+            id="enum",
+        ),
+        pytest.param(
+            OrderedMessage,
+            {"dynamic1": 0xAAAA, "dynamic2": 0xBBBB},
+            {"header1": 0x1111, "header2": 0x2222, "footer": 0xFFFF},
+            id="serialization_order",
+        ),
+        pytest.param(
+            AutoMessage,
+            {"data": "test"},
+            {"magic": 0xDEADBEEF},
+            id="no_attribute_set_needed",
+        ),
+    ],
+)
+def test_static_field_round_trip(cls, kwargs, static_fields):
+    """Test that static fields are set on creation and survive a round trip."""
+    msg = cls(**kwargs)
+
+    # Static fields are set without being passed
+    for name, expected in static_fields.items():
+        assert getattr(msg, name) == expected
+        assert type(getattr(msg, name)) is type(expected)
+
+    result = _PROTOCOL.decode(_PROTOCOL.encode(msg))
     assert result is not None
     decoded, remaining = result
 
-    # Verify all fields match
-    assert decoded.magic == 0x12345678
-    assert decoded.version == 1
-    assert decoded.data == "Hello"
+    assert type(decoded) is cls
     assert remaining == b""
+    for name, expected in {**static_fields, **kwargs}.items():
+        assert getattr(decoded, name) == expected
+        assert type(getattr(decoded, name)) is type(expected)
 
 
-def test_static_field_ignored_in_kwargs():
+def test_static_field_ignored_in_kwargs(test_protocol):
     """Test that static fields ignore kwargs values."""
-    test_protocol = Protocol()
 
     @protocol(test_protocol)
     class ConstMessage(Message):
@@ -60,74 +178,8 @@ def test_static_field_ignored_in_kwargs():
     assert msg.variable == 100
 
 
-def test_static_field_verification_on_decode():
-    """Test that deserialization correctly handles static field values."""
-    test_protocol = Protocol()
-
-    @protocol(test_protocol)
-    class VerifyMessage(Message):
-        fields = {
-            "header": {"type": "uint(16)", "static": 0xABCD},
-            "payload": {"type": "int(32)"},
-        }
-
-    # Create valid message
-    msg = VerifyMessage(payload=123)
-    encoded = test_protocol.encode(msg)
-
-    # Should decode successfully
-    result = test_protocol.decode(encoded)
-    assert result is not None
-    decoded, _ = result
-    assert decoded.header == 0xABCD
-    assert decoded.payload == 123
-
-    # Static field should always be set to the same value
-    msg2 = VerifyMessage(payload=456)
-    assert msg2.header == 0xABCD  # Same static value
-    assert msg2.payload == 456
-
-
-def test_static_field_with_multiple_types():
-    """Test static fields with different types."""
-    test_protocol = Protocol()
-
-    @protocol(test_protocol)
-    class MultiTypeMessage(Message):
-        encoding = Encoding.LITTLE_ENDIAN
-        fields = {
-            "magic_byte": {"type": "uint(8)", "static": 0xFF},
-            "protocol_version": {"type": "uint(16)", "static": 256},
-            "flags": {"type": "uint(32)", "static": 0x0000FFFF},
-            "identifier": {"type": "str", "static": "PROTO"},
-            "data": {"type": "bytes"},
-        }
-
-    msg = MultiTypeMessage(data=b"test data")
-
-    # Verify all static fields
-    assert msg.magic_byte == 0xFF
-    assert msg.protocol_version == 256
-    assert msg.flags == 0x0000FFFF
-    assert msg.identifier == "PROTO"
-    assert msg.data == b"test data"
-
-    # Round trip
-    encoded = test_protocol.encode(msg)
-    result = test_protocol.decode(encoded)
-    assert result is not None
-    decoded, _ = result
-
-    assert decoded.magic_byte == 0xFF
-    assert decoded.protocol_version == 256
-    assert decoded.flags == 0x0000FFFF
-    assert decoded.identifier == "PROTO"
-    assert decoded.data == b"test data"
-
-
-def test_static_field_protocol_discrimination():
+def test_static_field_protocol_discrimination(test_protocol):
     """Test static fields for protocol version discrimination."""
-    test_protocol = Protocol()
 
     @protocol(test_protocol)
     class V1Message(Message):
@@ -170,68 +222,70 @@ def test_static_field_protocol_discrimination():
     assert decoded2.version == 2
 
 
-def test_static_field_with_bool():
-    """Test static fields with boolean type."""
-    test_protocol = Protocol()
+def test_static_field_encode_into(test_protocol):
+    """Test that encode_into writes the same bytes as encode."""
 
     @protocol(test_protocol)
-    class BoolMessage(Message):
+    class ScratchMessage(Message):
         fields = {
-            "is_request": {"type": "bool", "static": True},
-            "data": {"type": "int(32)"},
+            "magic": {"type": "uint(32)", "static": 0xCAFEBABE},
+            "value": {"type": "uint(16)"},
         }
 
-    msg = BoolMessage(data=42)
-    assert msg.is_request is True
-
-    encoded = test_protocol.encode(msg)
-    result = test_protocol.decode(encoded)
-    assert result is not None
-    decoded, _ = result
-    assert decoded.is_request is True
-    assert decoded.data == 42
+    msg = ScratchMessage(value=0x1234)
+    buf = bytearray(64)
 
+    written = test_protocol.encode_into(buf, msg)
 
-def test_static_field_with_enum():
-    """Test static fields with enum type."""
-    from enum import IntEnum
+    assert bytes(buf[:written]) == test_protocol.encode(msg)
 
-    test_protocol = Protocol()
 
-    class MessageType(IntEnum):
-        REQUEST = 1
-        RESPONSE = 2
-        ERROR = 3
+def test_static_field_with_bitwise(test_protocol):
+    """Test static fields with bitwise encoding."""
 
     @protocol(test_protocol)
-    class RequestMessage(Message):
+    class BitwiseMessage(Message):
+        bitwise = True
         fields = {
-            "msg_type": {
-                "type": "enum",
-                "enum": MessageType,
-                "size": 1,
-                "static": MessageType.REQUEST,
-            },
-            "data": {"type": "int(32)"},
+            "version": {"type": "bit", "bits": 4, "static": 0b0001},
+            "flags": {"type": "bit", "bits": 4, "static": 0b1111},
+            "data": {"type": "bit", "bits": 8},
         }
 
-    msg = RequestMessage(data=100)
-    assert msg.msg_type == MessageType.REQUEST
+    msg = BitwiseMessage(data=0xAB)
+    assert msg.version == 0b0001
+    assert msg.flags == 0b1111
+    assert msg.data == 0xAB
 
     encoded = test_protocol.encode(msg)
     result = test_protocol.decode(encoded)
     assert result is not None
     decoded, _ = result
-    assert decoded.msg_type == MessageType.REQUEST
-    assert decoded.data == 100
+
+    assert decoded.version == 0b0001
+    assert decoded.flags == 0b1111
+    assert decoded.data == 0xAB
+    assert msg.serialize_bytes() == b"\x1f\xab"
 
 
-def test_static_field_serialization_order():
-    """Test that static fields maintain proper serialization order."""
-    test_protocol = Protocol()
+def test_static_field_with_bitwise_out_of_range():
+    """Test that a bitwise static too wide for its field fails on encode."""
 
-    @protocol(test_protocol)
-    class OrderedMessage(Message):
+    class WideStaticMessage(Message):
+        bitwise = True
+        fields = {
+            "version": {"type": "bit", "bits": 4, "static": 0x1F},
+            "data": {"type": "bit", "bits": 4},
+        }
+
+    with pytest.raises(ValueError, match="out of range"):
+        WideStaticMessage(data=1).serialize_bytes()
+
+
+def test_static_fields_join_fixed_width_run():
+    """Test that static and dynamic fixed-width fields pack as one struct run."""
+
+    class RunMessage(Message):
         fields = {
             "header1": {"type": "uint(16)", "static": 0x1111},
             "dynamic1": {"type": "uint(16)"},
@@ -240,78 +294,47 @@ def test_static_field_serialization_order():
             "footer": {"type": "uint(16)", "static": 0xFFFF},
         }
 
-    msg = OrderedMessage(dynamic1=0xAAAA, dynamic2=0xBBBB)
-
-    encoded = test_protocol.encode(msg)
-
-    # Manually verify the byte order
-    # Skip protocol header (type info), then check field bytes
-    # Since this is big endian and fields are int(16):
-    # Should be: header1, dynamic1, header2, dynamic2, footer
+    assert len(RunMessage._encode_steps) == 1
 
-    result = test_protocol.decode(encoded)
-    assert result is not None
-    decoded, _ = result
+    msg = RunMessage(dynamic1=0xAAAA, dynamic2=0xBBBB)
+    assert msg.serialize_bytes() == bytes.fromhex("1111aaaa2222bbbbffff")
 
-    assert decoded.header1 == 0x1111
-    assert decoded.dynamic1 == 0xAAAA
-    assert decoded.header2 == 0x2222
-    assert decoded.dynamic2 == 0xBBBB
-    assert decoded.footer == 0xFFFF
 
+def test_static_fields_use_generated_encoder():
+    """Test that static-field messages encode through their generated function."""
 
-def test_static_field_with_bitwise():
-    """Test static fields with bitwise encoding."""
-    test_protocol = Protocol()
-
-    @protocol(test_protocol)
-    class BitwiseMessage(Message):
-        bitwise = True
+    class GeneratedMessage(Message):
         fields = {
-            "version": {"type": "bit", "bits": 4, "static": 0b0001},
-            "flags": {"type": "bit", "bits": 4, "static": 0b1111},
-            "data": {"type": "bit", "bits": 8},
+            "magic": {"type": "int(32)", "static": 0x12345678},
+            "version": {"type": "int(16)", "static": 1},
+            "data": {"type": "str"},
         }
 
-    msg = BitwiseMessage(data=0xAB)
-    assert msg.version == 0b0001
-    assert msg.flags == 0b1111
-    assert msg.data == 0xAB
-
-    encoded = test_protocol.encode(msg)
-    result = test_protocol.decode(encoded)
-    assert result is not None
-    decoded, _ = result
-
-    assert decoded.version == 0b0001
-    assert decoded.flags == 0b1111
-    assert decoded.data == 0xAB
+    pack = GeneratedMessage._pack_plan
+    assert pack.__code__.co_filename == "<plan GeneratedMessage>"
+    assert pack(GeneratedMessage(data="Hi")) == (
+        bytes.fromhex("123456780001") + b"\x00\x00\x00\x02Hi"
+    )
 
 
-def test_static_field_no_attribute_set_needed():
-    """Test that static fields don't require setting before serialization."""
-    test_protocol = Protocol()
+def test_static_fields_are_class_attributes():
+    """Test that static values live on the class, not on each instance."""
 
-    @protocol(test_protocol)
-    class AutoMessage(Message):
+    class ClassStaticMessage(Message, slots=True):
         fields = {
             "magic": {"type": "uint(32)", "static": 0xDEADBEEF},
-            "data": {"type": "str"},
+            "version": {"type": "uint(8)", "static": 2},
+            "data": {"type": "int(32)"},
         }
 
-    # Create without explicitly setting magic
-    msg = AutoMessage(data="test")
+    assert ClassStaticMessage.magic == 0xDEADBEEF
+    assert ClassStaticMessage.__slots__ == ("data",)
+    assert ClassStaticMessage._init_fields == (("data", _NO_STATIC),)
 
-    # Magic should already be set
-    assert hasattr(msg, "magic")
+    msg = ClassStaticMessage(magic=1, data=5)
     assert msg.magic == 0xDEADBEEF
-
-    # Should serialize correctly
-    encoded = test_protocol.encode(msg)
-    result = test_protocol.decode(encoded)
-    assert result is not None
-    decoded, _ = result
-    assert decoded.magic == 0xDEADBEEF
+    assert msg.version == 2
+    assert "magic" not in vars(msg)
 
 
 if __name__ == "__main__":
@@ -2,15 +2,17 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
+from unittest.mock import Mock, patch, AsyncMock, MagicMock, call
 
 from packerpy.transports.tcp.async_client import AsyncTCPClient
 
 
-def create_mock_writer():
+@pytest.fixture
+def mock_writer():
     """Create a properly configured mock writer with sync and async methods."""
     mock_writer = Mock()
     mock_writer.write = Mock()  # Synchronous
+    mock_writer.writelines = Mock()  # Synchronous
     mock_writer.drain = AsyncMock()  # Asynchronous
     mock_writer.close = Mock()  # Synchronous
     mock_writer.wait_closed = AsyncMock()  # Asynchronous
@@ -31,10 +33,9 @@ class TestAsyncTCPClient:
         assert client.writer is None
 
     @patch("asyncio.open_connection")
-    async def test_connect(self, mock_open_connection):
+    async def test_connect(self, mock_open_connection, mock_writer):
         """Test connection to server."""
         mock_reader = AsyncMock()
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -52,10 +53,9 @@ class TestAsyncTCPClient:
             await client.send(b"data")
 
     @patch("asyncio.open_connection")
-    async def test_send(self, mock_open_connection):
+    async def test_send(self, mock_open_connection, mock_writer):
         """Test sending data."""
         mock_reader = AsyncMock()
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -73,11 +73,10 @@ class TestAsyncTCPClient:
             await client.receive()
 
     @patch("asyncio.open_connection")
-    async def test_receive(self, mock_open_connection):
+    async def test_receive(self, mock_open_connection, mock_writer):
         """Test receiving data."""
         mock_reader = AsyncMock()
         mock_reader.read.return_value = b"response data"
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -88,11 +87,10 @@ class TestAsyncTCPClient:
         mock_reader.read.assert_called_once_with(4096)
 
     @patch("asyncio.open_connection")
-    async def test_receive_custom_buffer_size(self, mock_open_connection):
+    async def test_receive_custom_buffer_size(self, mock_open_connection, mock_writer):
         """Test receiving with custom buffer size."""
         mock_reader = AsyncMock()
         mock_reader.read.return_value = b"data"
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -102,10 +100,33 @@ class TestAsyncTCPClient:
         mock_reader.read.assert_called_once_with(8192)
 
     @patch("asyncio.open_connection")
-    async def test_close(self, mock_open_connection):
+    async def test_receive_framed(self, mock_open_connection, mock_writer):
+        """Test receiving a length-prefixed frame with exact reads."""
+        mock_reader = AsyncMock()
+        mock_reader.readexactly = AsyncMock(
+            side_effect=[b"\x00\x00\x00\x05", b"hello"]
+        )
+        mock_open_connection.return_value = (mock_reader, mock_writer)
+
+        client = AsyncTCPClient("127.0.0.1", 8080)
+        await client.connect()
+        frame = await client.receive_framed(4, lambda hdr: int.from_bytes(hdr, "big"))
+
+        assert frame == b"\x00\x00\x00\x05hello"
+        assert mock_reader.readexactly.call_args_list == [call(4), call(5)]
+        mock_reader.read.assert_not_called()
+
+    async def test_receive_framed_not_connected(self):
+        """Test receiving a frame when not connected raises error."""
+        client = AsyncTCPClient("127.0.0.1", 8080)
+
+        with pytest.raises(ConnectionError, match="Not connected"):
+            await client.receive_framed(4, len)
+
+    @patch("asyncio.open_connection")
+    async def test_close(self, mock_open_connection, mock_writer):
         """Test closing connection."""
         mock_reader = AsyncMock()
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -126,10 +147,9 @@ class TestAsyncTCPClient:
         assert client.reader is None
 
     @patch("asyncio.open_connection")
-    async def test_async_context_manager(self, mock_open_connection):
+    async def test_async_context_manager(self, mock_open_connection, mock_writer):
         """Test using client as async context manager."""
         mock_reader = AsyncMock()
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         async with AsyncTCPClient("127.0.0.1", 8080) as client:
@@ -140,10 +160,9 @@ class TestAsyncTCPClient:
         mock_writer.wait_closed.assert_called_once()
 
     @patch("asyncio.open_connection")
-    async def test_async_context_manager_exception(self, mock_open_connection):
+    async def test_async_context_manager_exception(self, mock_open_connection, mock_writer):
         """Test context manager cleanup on exception."""
         mock_reader = AsyncMock()
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         with pytest.raises(ValueError):
@@ -155,10 +174,9 @@ class TestAsyncTCPClient:
         mock_writer.wait_closed.assert_called_once()
 
     @patch("asyncio.open_connection")
-    async def test_multiple_sends(self, mock_open_connection):
+    async def test_multiple_sends(self, mock_open_connection, mock_writer):
         """Test multiple send operations."""
         mock_reader = AsyncMock()
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -172,10 +190,31 @@ class TestAsyncTCPClient:
         assert mock_writer.drain.call_count == 3
 
     @patch("asyncio.open_connection")
-    async def test_send_empty_data(self, mock_open_connection):
+    async def test_send_many(self, mock_open_connection, mock_writer):
+        """Test sending several chunks with one write and one drain."""
+        mock_reader = AsyncMock()
+        mock_open_connection.return_value = (mock_reader, mock_writer)
+
+        client = AsyncTCPClient("127.0.0.1", 8080)
+        await client.connect()
+
+        await client.send_many([b"a", b"b", b"c"])
+
+        mock_writer.writelines.assert_called_once_with([b"a", b"b", b"c"])
+        mock_writer.write.assert_not_called()
+        mock_writer.drain.assert_called_once()
+
+    async def test_send_many_not_connected(self):
+        """Test sending chunks when not connected raises error."""
+        client = AsyncTCPClient("127.0.0.1", 8080)
+
+        with pytest.raises(ConnectionError, match="Not connected"):
+            await client.send_many([b"data"])
+
+    @patch("asyncio.open_connection")
+    async def test_send_empty_data(self, mock_open_connection, mock_writer):
         """Test sending empty data."""
         mock_reader = AsyncMock()
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -185,11 +224,10 @@ class TestAsyncTCPClient:
         mock_writer.write.assert_called_once_with(b"")
 
     @patch("asyncio.open_connection")
-    async def test_receive_empty_response(self, mock_open_connection):
+    async def test_receive_empty_response(self, mock_open_connection, mock_writer):
         """Test receiving empty response."""
         mock_reader = AsyncMock()
         mock_reader.read.return_value = b""
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
@@ -209,11 +247,10 @@ class TestAsyncTCPClient:
             await client.connect()
 
     @patch("asyncio.open_connection")
-    async def test_send_receive_cycle(self, mock_open_connection):
+    async def test_send_receive_cycle(self, mock_open_connection, mock_writer):
         """Test send and receive cycle."""
         mock_reader = AsyncMock()
         mock_reader.read.return_value = b"echo: test"
-        mock_writer = create_mock_writer()
         mock_open_connection.return_value = (mock_reader, mock_writer)
 
         client = AsyncTCPClient("127.0.0.1", 8080)
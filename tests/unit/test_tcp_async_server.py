@@ -2,6 +2,10 @@
 
 import pytest
 import asyncio
+import io
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, AsyncMock, MagicMock, call
 
 from packerpy.transports.tcp.async_server import AsyncTCPServer
@@ -15,9 +19,114 @@ def create_mock_writer():
     mock_writer.close = Mock()  # Synchronous
     mock_writer.wait_closed = AsyncMock()  # Asynchronous
     mock_writer.get_extra_info = Mock(return_value=("127.0.0.1", 12345))
+    mock_writer.transport.get_write_buffer_size.return_value = 0
     return mock_writer
 
 
+def stream_reader(*chunks, eof=True):
+    """Create a real StreamReader already fed with chunks and, by default, EOF."""
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+@pytest.fixture
+def mock_writer():
+    """Create a mock writer for a single client connection."""
+    return create_mock_writer()
+
+
+@pytest.fixture
+def mock_reader():
+    """Create a mock stream reader whose read methods are awaitable."""
+    return AsyncMock(spec=asyncio.StreamReader)
+
+
+def _uvloop_factory():
+    uvloop = pytest.importorskip("uvloop")
+    return uvloop.new_event_loop()
+
+
+@pytest.mark.parametrize(
+    "loop_factory",
+    [
+        pytest.param(asyncio.new_event_loop, id="asyncio"),
+        pytest.param(_uvloop_factory, id="uvloop"),
+    ],
+)
+def test_round_trip_on_event_loop(loop_factory):
+    """Test a real request/response round trip on each event loop."""
+
+    async def round_trip():
+        server = AsyncTCPServer("127.0.0.1", 0, lambda data, addr: data.upper())
+        task = asyncio.create_task(server.start())
+        while server.server is None:
+            await asyncio.sleep(0)
+        port = server.server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"ping")
+        response = await reader.read()
+        writer.close()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return response
+
+    loop = loop_factory()
+    try:
+        assert loop.run_until_complete(round_trip()) == b"PING"
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize(
+    "loop_factory",
+    [
+        pytest.param(asyncio.new_event_loop, id="asyncio"),
+        pytest.param(_uvloop_factory, id="uvloop"),
+    ],
+)
+@pytest.mark.parametrize("kind", ["file", "bytesio"])
+def test_file_response_on_event_loop(loop_factory, kind, tmp_path):
+    """Test a file-object response reaches the client on each event loop."""
+    payload = bytes(range(256)) * 4096
+    path = tmp_path / "payload.bin"
+    path.write_bytes(payload)
+
+    def handler(data, addr):
+        if kind == "file":
+            return open(path, "rb")
+        return io.BytesIO(payload)
+
+    async def fetch():
+        server = AsyncTCPServer("127.0.0.1", 0, handler, write_buffer_high=65536)
+        task = asyncio.create_task(server.start())
+        while server.server is None:
+            await asyncio.sleep(0)
+        port = server.server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"get")
+        response = await reader.read()
+        writer.close()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return response
+
+    loop = loop_factory()
+    try:
+        assert loop.run_until_complete(fetch()) == payload
+    finally:
+        loop.close()
+
+
 @pytest.mark.asyncio
 class TestAsyncTCPServer:
     """Test suite for AsyncTCPServer."""
@@ -30,62 +139,213 @@ class TestAsyncTCPServer:
         assert server.host == "0.0.0.0"
         assert server.port == 8080
         assert server.handler == handler
+        assert server.executor is None
+        assert server.buffer_size == 65536
+        assert server.body_len_fn is None
+        assert server.write_buffer_high == 256 * 1024
+        assert server.pipeline is False
         assert server.server is None
 
+    async def test_slots_defined(self):
+        """Test the server keeps its state in slots, not an instance dict."""
+        server = AsyncTCPServer("0.0.0.0", 8080, Mock())
+
+        assert not hasattr(server, "__dict__")
+        with pytest.raises(AttributeError):
+            server.unknown = 1
+
     @patch("asyncio.start_server")
     async def test_start(self, mock_start_server):
         """Test starting the server."""
+        serving = asyncio.Event()
+
+        async def serve_forever():
+            serving.set()
+            await asyncio.Event().wait()
+
         mock_server = AsyncMock()
-        mock_server.serve_forever = AsyncMock()
+        mock_server.serve_forever = AsyncMock(side_effect=serve_forever)
         mock_server.__aenter__ = AsyncMock(return_value=mock_server)
-        mock_server.__aexit__ = AsyncMock()
+        mock_server.__aexit__ = AsyncMock(return_value=False)
         mock_start_server.return_value = mock_server
 
         handler = Mock()
         server = AsyncTCPServer("0.0.0.0", 8080, handler)
 
-        # Start in a task and cancel after a short time
+        # Start in a task and cancel once it is serving
         task = asyncio.create_task(server.start())
-        await asyncio.sleep(0.1)
+        await serving.wait()
         task.cancel()
 
-        try:
+        with pytest.raises(asyncio.CancelledError):
             await task
-        except asyncio.CancelledError:
-            pass
 
         mock_start_server.assert_called_once()
         call_args = mock_start_server.call_args
         assert call_args[0][1] == "0.0.0.0"
         assert call_args[0][2] == 8080
+        assert call_args[1]["reuse_port"] is False
+        assert call_args[1]["backlog"] == 1024
 
-    async def test_handle_client(self):
+    async def test_handle_client(self, mock_reader, mock_writer):
         """Test handling a client connection."""
-        mock_reader = AsyncMock()
-        mock_reader.read.return_value = b"request data"
+        mock_reader.read.side_effect = [b"request data", b""]
 
-        mock_writer = create_mock_writer()
-        # Use Mock instead of AsyncMock for get_extra_info
-        mock_writer.get_extra_info = Mock(return_value=("127.0.0.1", 54321))
+        mock_writer.get_extra_info.return_value = ("127.0.0.1", 54321)
 
         handler = Mock(return_value=b"response data")
         server = AsyncTCPServer("0.0.0.0", 8080, handler)
 
         await server._handle_client(mock_reader, mock_writer)
 
-        mock_reader.read.assert_called_once_with(4096)
+        mock_reader.read.assert_called_once_with(65536)
         handler.assert_called_once_with(b"request data", ("127.0.0.1", 54321))
         mock_writer.write.assert_called_once_with(b"response data")
-        mock_writer.drain.assert_called_once()
+        mock_writer.drain.assert_not_called()
         mock_writer.close.assert_called_once()
         mock_writer.wait_closed.assert_called_once()
 
-    async def test_handle_client_no_data(self):
+    async def test_handle_client_framed(self, mock_writer):
+        """Test framed requests are read whole, however the bytes arrive."""
+        reader = stream_reader(
+            b"\x00\x00", b"\x00\x0crequest", b" data\x00\x00\x00\x02", b"hi"
+        )
+
+        handler = Mock(side_effect=[b"response data", b"response hi"])
+        server = AsyncTCPServer(
+            "0.0.0.0",
+            8080,
+            handler,
+            header_size=4,
+            body_len_fn=lambda header: struct.unpack("!I", header)[0],
+            pipeline=True,
+        )
+
+        await server._handle_client(reader, mock_writer)
+
+        assert handler.call_args_list == [
+            call(struct.pack("!I", 12) + b"request data", ("127.0.0.1", 12345)),
+            call(struct.pack("!I", 2) + b"hi", ("127.0.0.1", 12345)),
+        ]
+        assert mock_writer.write.call_args_list == [
+            call(b"response data"),
+            call(b"response hi"),
+        ]
+
+    async def test_pipelined_requests(self, mock_writer):
+        """Test one connection serves every request until the client closes."""
+        reader = stream_reader(b"request1", eof=False)
+        handler = Mock(side_effect=[b"response1", b"response2", b"response3"])
+        server = AsyncTCPServer("0.0.0.0", 8080, handler, pipeline=True)
+
+        task = asyncio.create_task(server._handle_client(reader, mock_writer))
+        await asyncio.sleep(0)
+        for chunk in (b"request2", b"request3"):
+            reader.feed_data(chunk)
+            await asyncio.sleep(0)
+        reader.feed_eof()
+        await task
+
+        assert [args[0] for args, _ in handler.call_args_list] == [
+            b"request1",
+            b"request2",
+            b"request3",
+        ]
+        assert mock_writer.write.call_args_list == [
+            call(b"response1"),
+            call(b"response2"),
+            call(b"response3"),
+        ]
+        mock_writer.drain.assert_not_called()
+        mock_writer.close.assert_called_once()
+
+    async def test_closes_after_first_reply_by_default(self, mock_writer):
+        """Test the connection closes after one reply without pipelining."""
+        reader = stream_reader(b"request1", eof=False)
+        handler = Mock(return_value=b"response1")
+        server = AsyncTCPServer("0.0.0.0", 8080, handler)
+
+        await server._handle_client(reader, mock_writer)
+
+        handler.assert_called_once_with(b"request1", ("127.0.0.1", 12345))
+        mock_writer.write.assert_called_once_with(b"response1")
+        mock_writer.close.assert_called_once()
+
+    async def test_handle_client_framed_closed_before_header(self, mock_writer):
+        """Test a client closing before sending a frame is not an error."""
+        handler = Mock()
+        server = AsyncTCPServer(
+            "0.0.0.0", 8080, handler, header_size=4, body_len_fn=len
+        )
+
+        await server._handle_client(stream_reader(), mock_writer)
+
+        handler.assert_not_called()
+        mock_writer.close.assert_called_once()
+
+    async def test_handle_client_framed_truncated_header(self, mock_writer):
+        """Test a client closing mid-header raises IncompleteReadError."""
+        handler = Mock()
+        server = AsyncTCPServer(
+            "0.0.0.0", 8080, handler, header_size=4, body_len_fn=len
+        )
+
+        with pytest.raises(asyncio.IncompleteReadError):
+            await server._handle_client(stream_reader(b"\x00"), mock_writer)
+
+        handler.assert_not_called()
+        mock_writer.close.assert_called_once()
+
+    async def test_handler_runs_in_executor(self, mock_reader, mock_writer):
+        """Test a plain handler is dispatched to the configured executor."""
+        mock_reader.read.side_effect = [b"request data", b""]
+
+        threads = []
+
+        def handler(data, address):
+            threads.append(threading.current_thread())
+            return b"response data"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            server = AsyncTCPServer("0.0.0.0", 8080, handler, executor=executor)
+            await server._handle_client(mock_reader, mock_writer)
+
+        assert threads and threads[0] is not threading.current_thread()
+        mock_writer.write.assert_called_once_with(b"response data")
+
+    async def test_coroutine_handler_is_awaited(self, mock_reader, mock_writer):
+        """Test a coroutine handler is awaited on the loop."""
+        mock_reader.read.side_effect = [b"request data", b""]
+
+        handler = AsyncMock(return_value=b"response data")
+        server = AsyncTCPServer("0.0.0.0", 8080, handler)
+
+        await server._handle_client(mock_reader, mock_writer)
+
+        handler.assert_awaited_once_with(b"request data", ("127.0.0.1", 12345))
+        mock_writer.write.assert_called_once_with(b"response data")
+
+    async def test_large_response_uses_sendfile(self, mock_reader, mock_writer):
+        """Test a file-like response is sent with loop.sendfile, not write."""
+        mock_reader.read.side_effect = [b"request data", b""]
+        response = io.BytesIO(b"x" * 1_000_000)
+
+        handler = Mock(return_value=response)
+        server = AsyncTCPServer("0.0.0.0", 8080, handler)
+
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "sendfile", AsyncMock()) as mock_sendfile:
+            await server._handle_client(mock_reader, mock_writer)
+
+        mock_sendfile.assert_awaited_once_with(mock_writer.transport, response)
+        mock_writer.write.assert_not_called()
+        assert response.closed
+        mock_writer.close.assert_called_once()
+
+    async def test_handle_client_no_data(self, mock_reader, mock_writer):
         """Test handling client when no data received."""
-        mock_reader = AsyncMock()
-        mock_reader.read.return_value = b""
+        mock_reader.read.side_effect = [b""]
 
-        mock_writer = create_mock_writer()
         mock_writer.get_extra_info.return_value = ("127.0.0.1", 54321)
 
         handler = Mock()
@@ -97,13 +357,11 @@ class TestAsyncTCPServer:
         handler.assert_not_called()
         mock_writer.close.assert_called_once()
 
-    async def test_handle_client_exception(self):
+    async def test_handle_client_exception(self, mock_reader, mock_writer):
         """Test handling exception in handler."""
-        mock_reader = AsyncMock()
-        mock_reader.read.return_value = b"data"
+        mock_reader.read.side_effect = [b"data", b""]
 
-        mock_writer = create_mock_writer()
-        mock_writer.get_extra_info = Mock(return_value=("127.0.0.1", 54321))
+        mock_writer.get_extra_info.return_value = ("127.0.0.1", 54321)
 
         handler = Mock(side_effect=Exception("Handler error"))
         server = AsyncTCPServer("0.0.0.0", 8080, handler)
@@ -142,13 +400,9 @@ class TestAsyncTCPServer:
 
         assert server.server is None
 
-    async def test_handler_returns_none(self):
+    async def test_handler_returns_none(self, mock_reader, mock_writer):
         """Test when handler returns None."""
-        mock_reader = AsyncMock()
-        mock_reader.read.return_value = b"data"
-
-        mock_writer = create_mock_writer()
-        mock_writer.get_extra_info = Mock(return_value=("127.0.0.1", 12345))
+        mock_reader.read.side_effect = [b"data", b""]
 
         handler = Mock(return_value=None)
         server = AsyncTCPServer("0.0.0.0", 8080, handler)
@@ -162,33 +416,29 @@ class TestAsyncTCPServer:
 
     async def test_multiple_clients(self):
         """Test handling multiple client connections."""
-        mock_reader1 = AsyncMock()
-        mock_reader1.read.return_value = b"data1"
+        reader1 = stream_reader(b"data1")
         mock_writer1 = create_mock_writer()
         mock_writer1.get_extra_info = Mock(return_value=("127.0.0.1", 54321))
 
-        mock_reader2 = AsyncMock()
-        mock_reader2.read.return_value = b"data2"
+        reader2 = stream_reader(b"data2")
         mock_writer2 = create_mock_writer()
         mock_writer2.get_extra_info = Mock(return_value=("127.0.0.1", 54322))
 
         handler = Mock(side_effect=[b"response1", b"response2"])
         server = AsyncTCPServer("0.0.0.0", 8080, handler)
 
-        await server._handle_client(mock_reader1, mock_writer1)
-        await server._handle_client(mock_reader2, mock_writer2)
+        await server._handle_client(reader1, mock_writer1)
+        await server._handle_client(reader2, mock_writer2)
 
         assert handler.call_count == 2
         mock_writer1.write.assert_called_once_with(b"response1")
         mock_writer2.write.assert_called_once_with(b"response2")
 
-    async def test_get_client_address(self):
+    async def test_get_client_address(self, mock_reader, mock_writer):
         """Test getting client address from writer."""
-        mock_reader = AsyncMock()
-        mock_reader.read.return_value = b"data"
+        mock_reader.read.side_effect = [b"data", b""]
 
-        mock_writer = create_mock_writer()
-        mock_writer.get_extra_info = Mock(return_value=("192.168.1.100", 12345))
+        mock_writer.get_extra_info.return_value = ("192.168.1.100", 12345)
 
         handler = Mock(return_value=b"response")
         server = AsyncTCPServer("0.0.0.0", 8080, handler)
@@ -198,13 +448,10 @@ class TestAsyncTCPServer:
         mock_writer.get_extra_info.assert_called_once_with("peername")
         handler.assert_called_once_with(b"data", ("192.168.1.100", 12345))
 
-    async def test_write_and_drain(self):
-        """Test that write is followed by drain."""
-        mock_reader = AsyncMock()
-        mock_reader.read.return_value = b"data"
+    async def test_write_then_close_without_drain(self, mock_reader, mock_writer):
+        """Test that the reply is written and flushed by close, not drain."""
+        mock_reader.read.side_effect = [b"data", b""]
 
-        mock_writer = create_mock_writer()
-        mock_writer.get_extra_info = Mock(return_value=("127.0.0.1", 12345))
         mock_writer.get_extra_info.return_value = ("127.0.0.1", 54321)
 
         handler = Mock(return_value=b"response")
@@ -212,10 +459,94 @@ class TestAsyncTCPServer:
 
         await server._handle_client(mock_reader, mock_writer)
 
-        # Verify write is called before drain
-        calls = mock_writer.method_calls
-        write_call = call.write(b"response")
-        drain_call = call.drain()
+        calls = [name for name, _, _ in mock_writer.method_calls]
+        assert calls.index("write") < calls.index("close")
+        mock_writer.drain.assert_not_called()
+
+    async def test_write_backpressure_only_on_high_water(self, mock_writer):
+        """Test drain is awaited only once the write buffer passes the mark."""
+        mock_writer.transport.get_write_buffer_size.side_effect = [100, 100_000]
+
+        handler = Mock(return_value=b"response")
+        server = AsyncTCPServer("0.0.0.0", 8080, handler, write_buffer_high=65536)
+
+        await server._handle_client(stream_reader(b"data1"), mock_writer)
+        mock_writer.drain.assert_not_called()
+
+        await server._handle_client(stream_reader(b"data2"), mock_writer)
+        mock_writer.drain.assert_awaited_once()
+
+        mock_writer.transport.set_write_buffer_limits.assert_called_with(high=65536)
+
+    async def test_clean_shutdown_after_client_eof(self, mock_writer):
+        """Test a client's half-close ends the connection with a single close."""
+        handler = Mock(return_value=b"response")
+        server = AsyncTCPServer("0.0.0.0", 8080, handler)
+
+        await server._handle_client(stream_reader(b"data"), mock_writer)
+
+        calls = [name for name, _, _ in mock_writer.method_calls]
+        assert calls[-2:] == ["close", "wait_closed"]
+        assert "write_eof" not in calls
+        mock_writer.close.assert_called_once()
+
+    async def test_cancelled_during_drain_still_closes(self, mock_writer):
+        """Test a cancel while draining still closes the connection."""
+        mock_writer.transport.get_write_buffer_size.return_value = 1_000_000
+        mock_writer.drain.side_effect = asyncio.CancelledError
+
+        server = AsyncTCPServer("0.0.0.0", 8080, Mock(return_value=b"response"))
+
+        with pytest.raises(asyncio.CancelledError):
+            await server._handle_client(stream_reader(b"data"), mock_writer)
+
+        mock_writer.close.assert_called_once()
+        mock_writer.wait_closed.assert_awaited_once()
+
+    async def test_cancel_does_not_abort_wait_closed(self, mock_writer):
+        """Test cancelling the handler mid-close lets wait_closed finish."""
+        closing = asyncio.Event()
+        release = asyncio.Event()
+        finished = []
+
+        async def wait_closed():
+            closing.set()
+            await release.wait()
+            finished.append(True)
+
+        mock_writer.wait_closed = wait_closed
+        server = AsyncTCPServer("0.0.0.0", 8080, Mock(return_value=None))
+
+        task = asyncio.create_task(
+            server._handle_client(stream_reader(b"data"), mock_writer)
+        )
+        await closing.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        release.set()
+        await asyncio.sleep(0)
+        assert finished == [True]
+
+    async def test_concurrent_handlers_share_writer(self, mock_writer):
+        """Test two handlers sharing a writer concurrently both finish."""
+
+        async def wait_closed():
+            await asyncio.sleep(0)
+
+        mock_writer.wait_closed = AsyncMock(side_effect=wait_closed)
+
+        handler = Mock(side_effect=[b"response1", b"response2"])
+        server = AsyncTCPServer("0.0.0.0", 8080, handler)
+
+        await asyncio.gather(
+            server._handle_client(stream_reader(b"data1"), mock_writer),
+            server._handle_client(stream_reader(b"data2"), mock_writer),
+        )
 
-        assert write_call in calls
-        assert drain_call in calls
+        assert mock_writer.write.call_args_list == [
+            call(b"response1"),
+            call(b"response2"),
+        ]
+        assert mock_writer.wait_closed.call_count == 2
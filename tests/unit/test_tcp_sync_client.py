@@ -2,8 +2,9 @@
 
 import pytest
 import socket
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, call, patch, MagicMock
 
+from packerpy.transports.tcp import sync_client
 from packerpy.transports.tcp.sync_client import SyncTCPClient
 
 
@@ -17,6 +18,7 @@ class TestSyncTCPClient:
         assert client.host == "127.0.0.1"
         assert client.port == 8080
         assert client.timeout == 30.0
+        assert client.socket_buffer_size is None
         assert client.socket is None
 
     def test_initialization_with_timeout(self):
@@ -35,10 +37,132 @@ class TestSyncTCPClient:
         client.connect()
 
         mock_socket_class.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
+        mock_socket.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1
+        )
         mock_socket.settimeout.assert_called_once_with(30.0)
         mock_socket.connect.assert_called_once_with(("127.0.0.1", 8080))
         assert client.socket == mock_socket
 
+    @patch("socket.socket")
+    def test_tcp_nodelay_set(self, mock_socket_class):
+        """Test Nagle's algorithm is disabled before connecting."""
+        mock_socket = Mock()
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+
+        mock_socket.setsockopt.assert_any_call(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+
+    @pytest.mark.skipif(
+        not hasattr(socket, "TCP_QUICKACK"), reason="TCP_QUICKACK unavailable"
+    )
+    @patch("socket.socket")
+    def test_tcp_quickack_set_after_connect(self, mock_socket_class):
+        """Test delayed ACKs are turned off once connected where supported."""
+        mock_socket = Mock()
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+
+        assert mock_socket.method_calls[-1] == call.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1
+        )
+
+    @pytest.mark.skipif(
+        not hasattr(socket, "TCP_QUICKACK"), reason="TCP_QUICKACK unavailable"
+    )
+    @patch("socket.socket")
+    def test_tcp_quickack_rearmed_after_receive(self, mock_socket_class):
+        """Test delayed ACKs are turned off again after every read."""
+        mock_socket = Mock()
+        mock_socket.recv.return_value = b"data"
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        for _ in range(2):
+            mock_socket.reset_mock()
+            client.receive()
+
+            assert mock_socket.method_calls == [
+                call.recv(4096),
+                call.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1),
+            ]
+
+    @patch.object(sync_client, "_TCP_QUICKACK", None)
+    @patch("socket.socket")
+    def test_receive_without_tcp_quickack(self, mock_socket_class):
+        """Test platforms without TCP_QUICKACK only read."""
+        mock_socket = Mock()
+        mock_socket.recv.return_value = b"data"
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        mock_socket.reset_mock()
+
+        assert client.receive() == b"data"
+        assert mock_socket.method_calls == [call.recv(4096)]
+
+    @patch("socket.socket")
+    def test_socket_buffers_tuned(self, mock_socket_class):
+        """Test requested socket buffer sizes are set before connecting."""
+        mock_socket = Mock()
+        mock_socket_class.return_value = mock_socket
+
+        size = 4 * 1024 * 1024
+        client = SyncTCPClient("127.0.0.1", 8080, socket_buffer_size=size)
+        client.connect()
+
+        calls = mock_socket.method_calls
+        connect_index = calls.index(call.connect(("127.0.0.1", 8080)))
+        for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+            setsockopt = call.setsockopt(socket.SOL_SOCKET, option, size)
+            assert calls.index(setsockopt) < connect_index
+
+    @patch("socket.socket")
+    def test_socket_buffers_default_untouched(self, mock_socket_class):
+        """Test the OS buffer sizes are left alone unless requested."""
+        mock_socket = Mock()
+        mock_socket_class.return_value = mock_socket
+
+        SyncTCPClient("127.0.0.1", 8080).connect()
+
+        options = [args[1] for args, _ in mock_socket.setsockopt.call_args_list]
+        assert socket.SO_SNDBUF not in options
+        assert socket.SO_RCVBUF not in options
+
+    @patch("socket.socket")
+    def test_connect_reuses_open_socket(self, mock_socket_class):
+        """Test connecting twice keeps the already open socket."""
+        mock_socket = Mock()
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        client.connect()
+
+        mock_socket_class.assert_called_once()
+        mock_socket.connect.assert_called_once()
+        assert client.socket == mock_socket
+
+    @patch("socket.socket")
+    def test_connect_after_close_opens_new_socket(self, mock_socket_class):
+        """Test a closed client opens a fresh socket on the next connect."""
+        mock_socket_class.side_effect = [Mock(), Mock()]
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        client.close()
+        client.connect()
+
+        assert mock_socket_class.call_count == 2
+
     @patch("socket.socket")
     def test_send(self, mock_socket_class):
         """Test sending data."""
@@ -152,6 +276,101 @@ class TestSyncTCPClient:
 
         assert mock_socket.sendall.call_count == 3
 
+    @patch("socket.socket")
+    def test_send_many(self, mock_socket_class):
+        """Test sending several chunks with one vectored write."""
+        mock_socket = Mock()
+        mock_socket.sendmsg.return_value = 15
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        client.send_many([b"data1", b"data2", b"data3"])
+
+        mock_socket.sendmsg.assert_called_once_with([b"data1", b"data2", b"data3"])
+        mock_socket.sendall.assert_not_called()
+
+    @patch("socket.socket")
+    def test_send_many_partial_write(self, mock_socket_class):
+        """Test a short sendmsg resumes from the first unsent byte."""
+        mock_socket = Mock()
+        sent = []
+
+        def sendmsg(buffers):
+            sent.append([bytes(buffer) for buffer in buffers])
+            return min(7, sum(len(buffer) for buffer in buffers))
+
+        mock_socket.sendmsg.side_effect = sendmsg
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        client.send_many([b"data1", b"data2", b"data3"])
+
+        assert sent == [
+            [b"data1", b"data2", b"data3"],
+            [b"ta2", b"data3"],
+            [b"3"],
+        ]
+
+    @patch("socket.socket")
+    def test_send_many_splits_at_iov_max(self, mock_socket_class):
+        """Test no sendmsg call is handed more than IOV_MAX buffers."""
+        mock_socket = Mock()
+        batch_sizes = []
+
+        def sendmsg(buffers):
+            batch_sizes.append(len(buffers))
+            return sum(len(buffer) for buffer in buffers)
+
+        mock_socket.sendmsg.side_effect = sendmsg
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        client.send_many([b"x"] * (2 * sync_client._IOV_MAX + 1))
+
+        assert batch_sizes == [sync_client._IOV_MAX, sync_client._IOV_MAX, 1]
+
+    def test_send_many_more_chunks_than_iov_max(self):
+        """Test a batch larger than IOV_MAX goes out whole on a real socket."""
+        count = sync_client._IOV_MAX + 1000
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.socket, peer = socket.socketpair()
+        try:
+            client.send_many([b"x"] * count)
+            client.socket.shutdown(socket.SHUT_WR)
+
+            received = b""
+            while chunk := peer.recv(65536):
+                received += chunk
+        finally:
+            client.close()
+            peer.close()
+
+        assert received == b"x" * count
+
+    @patch("socket.socket")
+    def test_send_many_without_sendmsg(self, mock_socket_class):
+        """Test falling back to one sendall where sendmsg is unavailable."""
+        mock_socket = Mock(
+            spec=["connect", "setsockopt", "settimeout", "sendall", "close"]
+        )
+        mock_socket_class.return_value = mock_socket
+
+        client = SyncTCPClient("127.0.0.1", 8080)
+        client.connect()
+        client.send_many([b"data1", b"data2"])
+
+        mock_socket.sendall.assert_called_once_with(b"data1data2")
+
+    def test_send_many_not_connected(self):
+        """Test sending chunks when not connected raises error."""
+        client = SyncTCPClient("127.0.0.1", 8080)
+
+        with pytest.raises(ConnectionError, match="Not connected"):
+            client.send_many([b"data"])
+
     @patch("socket.socket")
     def test_send_empty_data(self, mock_socket_class):
         """Test sending empty data."""
@@ -1,12 +1,27 @@
 """Unit tests for transports.tcp.sync_server module."""
 
+import os
 import pytest
+import signal
 import socket
-from unittest.mock import Mock, patch, MagicMock
+import subprocess
+import sys
+import threading
+from unittest.mock import Mock, call, patch, MagicMock
 
 from packerpy.transports.tcp.sync_server import SyncTCPServer
 
 
+def _recv_into(data):
+    """Build a recv_into side effect that copies data into the caller's buffer."""
+
+    def fill(buffer):
+        buffer[: len(data)] = data
+        return len(data)
+
+    return fill
+
+
 class TestSyncTCPServer:
     """Test suite for SyncTCPServer."""
 
@@ -20,6 +35,11 @@ class TestSyncTCPServer:
         assert server.handler == handler
         assert server.socket is None
         assert server.running is False
+        assert server.buffer_size == 65536
+        assert server.reuse_port is False
+        assert server.worker_pids == []
+        assert server.max_workers is None
+        assert server.socket_buffer_size is None
 
     @patch("socket.socket")
     def test_start(self, mock_socket_class):
@@ -41,15 +61,201 @@ class TestSyncTCPServer:
             socket.SOL_SOCKET, socket.SO_REUSEADDR, 1
         )
         mock_socket.bind.assert_called_once_with(("0.0.0.0", 8080))
-        mock_socket.listen.assert_called_once_with(5)
+        mock_socket.listen.assert_called_once_with(1024)
         assert server.running is True
 
+    @pytest.mark.skipif(
+        not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT unavailable"
+    )
+    @pytest.mark.parametrize("reuse_port", [False, True])
+    @patch("socket.socket")
+    def test_start_socket_options(self, mock_socket_class, reuse_port):
+        """Test SO_REUSEPORT is set only when requested."""
+        mock_socket = Mock()
+        mock_socket.accept.side_effect = KeyboardInterrupt()
+        mock_socket_class.return_value = mock_socket
+
+        server = SyncTCPServer("0.0.0.0", 8080, Mock(), reuse_port=reuse_port)
+
+        with pytest.raises(KeyboardInterrupt):
+            server.start()
+
+        reuse_port_call = call(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        assert (reuse_port_call in mock_socket.setsockopt.call_args_list) is reuse_port
+        mock_socket.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_REUSEADDR, 1
+        )
+
+    @patch("os.fork", side_effect=[1001, 1002])
+    def test_run_workers_forks_n_minus_one(self, mock_fork):
+        """Test run_workers forks the extra workers and serves in the parent."""
+        server = SyncTCPServer("0.0.0.0", 8080, Mock())
+
+        with patch.object(server, "start") as mock_start:
+            server.run_workers(3)
+
+        assert mock_fork.call_count == 2
+        mock_start.assert_called_once()
+        assert server.reuse_port is True
+        assert server.worker_pids == [1001, 1002]
+
+    @patch("os._exit")
+    @patch("os.fork", return_value=0)
+    def test_run_workers_child_serves_then_exits(self, mock_fork, mock_exit):
+        """Test a forked worker serves and exits instead of forking further."""
+        mock_exit.side_effect = SystemExit
+        server = SyncTCPServer("0.0.0.0", 8080, Mock())
+
+        with patch.object(server, "start") as mock_start:
+            with pytest.raises(SystemExit):
+                server.run_workers(3)
+
+        mock_fork.assert_called_once()
+        mock_start.assert_called_once()
+        mock_exit.assert_called_once_with(0)
+
+    @patch("os.waitpid")
+    @patch("os.kill")
+    def test_stop_terminates_workers(self, mock_kill, mock_waitpid):
+        """Test stop signals and reaps forked workers, then forgets them."""
+        mock_kill.side_effect = [None, ProcessLookupError()]
+        mock_waitpid.side_effect = [(1001, 0), ChildProcessError()]
+        server = SyncTCPServer("0.0.0.0", 8080, Mock())
+        server.worker_pids = [1001, 1002]
+
+        server.stop()
+
+        assert mock_kill.call_args_list == [
+            call(1001, signal.SIGTERM),
+            call(1002, signal.SIGTERM),
+        ]
+        assert mock_waitpid.call_args_list == [call(1001, 0), call(1002, 0)]
+        assert server.worker_pids == []
+
+    def test_stop_leaves_no_zombie_workers(self):
+        """Test a real child process is reaped by stop()."""
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        server = SyncTCPServer("0.0.0.0", 8080, Mock())
+        server.worker_pids = [child.pid]
+
+        server.stop()
+
+        with pytest.raises(ChildProcessError):
+            os.waitpid(child.pid, os.WNOHANG)
+        child.wait(timeout=5)  # already reaped; only settles Popen's state
+
+    @patch("os.fork")
+    @patch("socket.socket")
+    def test_reuse_port_unsupported(self, mock_socket_class, mock_fork, monkeypatch):
+        """Test a clear error when the platform has no SO_REUSEPORT."""
+        monkeypatch.delattr(socket, "SO_REUSEPORT", raising=False)
+        server = SyncTCPServer("0.0.0.0", 8080, Mock(), reuse_port=True)
+
+        with pytest.raises(ValueError, match="reuse_port not supported"):
+            server.start()
+        with pytest.raises(ValueError, match="reuse_port not supported"):
+            server.run_workers(2)
+
+        mock_fork.assert_not_called()
+        mock_socket_class.assert_not_called()
+
+    @patch("packerpy.transports.tcp.sync_server.ThreadPoolExecutor")
+    @patch("socket.socket")
+    def test_start_uses_threadpool(self, mock_socket_class, mock_pool_class):
+        """Test each accepted connection is handed to the thread pool."""
+        client1, client2 = Mock(), Mock()
+        mock_socket = Mock()
+        mock_socket.accept.side_effect = [
+            (client1, ("127.0.0.1", 54321)),
+            (client2, ("127.0.0.1", 54322)),
+            KeyboardInterrupt(),
+        ]
+        mock_socket_class.return_value = mock_socket
+        pool = mock_pool_class.return_value.__enter__.return_value
+
+        server = SyncTCPServer("0.0.0.0", 8080, Mock(), max_workers=4)
+
+        with pytest.raises(KeyboardInterrupt):
+            server.start()
+
+        mock_pool_class.assert_called_once_with(max_workers=4)
+        assert pool.submit.call_args_list == [
+            call(server._handle_client, client1, ("127.0.0.1", 54321)),
+            call(server._handle_client, client2, ("127.0.0.1", 54322)),
+        ]
+
+    @patch("socket.socket")
+    def test_start_reports_handler_errors(self, mock_socket_class, capsys):
+        """Test an exception raised on a worker thread is still printed."""
+        client = Mock()
+        client.recv_into.side_effect = _recv_into(b"data")
+        mock_socket = Mock()
+        mock_socket.accept.side_effect = [
+            (client, ("127.0.0.1", 54321)),
+            KeyboardInterrupt(),
+        ]
+        mock_socket_class.return_value = mock_socket
+
+        handler = Mock(side_effect=Exception("Handler error"))
+        server = SyncTCPServer("0.0.0.0", 8080, handler)
+
+        with pytest.raises(KeyboardInterrupt):
+            server.start()
+
+        assert "Error handling client: Handler error" in capsys.readouterr().out
+        client.close.assert_called_once()
+
+    def test_recv_buffer_per_thread(self):
+        """Test each thread gets its own receive buffer, reused across calls."""
+        server = SyncTCPServer("0.0.0.0", 8080, Mock())
+        buffers = []
+        worker = threading.Thread(target=lambda: buffers.append(server._recv_buffer()))
+        worker.start()
+        worker.join()
+
+        assert server._recv_buffer() is server._recv_buffer()
+        assert buffers[0] is not server._recv_buffer()
+        assert len(buffers[0]) == server.buffer_size
+
+    @patch("socket.socket")
+    def test_socket_buffers_tuned(self, mock_socket_class):
+        """Test requested socket buffer sizes are set before listening."""
+        mock_socket = Mock()
+        mock_socket.accept.side_effect = KeyboardInterrupt()
+        mock_socket_class.return_value = mock_socket
+
+        size = 4 * 1024 * 1024
+        server = SyncTCPServer("0.0.0.0", 8080, Mock(), socket_buffer_size=size)
+
+        with pytest.raises(KeyboardInterrupt):
+            server.start()
+
+        calls = mock_socket.method_calls
+        listen_index = calls.index(call.listen(1024))
+        for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+            setsockopt = call.setsockopt(socket.SOL_SOCKET, option, size)
+            assert calls.index(setsockopt) < listen_index
+
+    @patch("socket.socket")
+    def test_start_custom_backlog(self, mock_socket_class):
+        """Test the listen backlog is configurable."""
+        mock_socket = Mock()
+        mock_socket.accept.side_effect = KeyboardInterrupt()
+        mock_socket_class.return_value = mock_socket
+
+        server = SyncTCPServer("0.0.0.0", 8080, Mock(), backlog=64)
+
+        with pytest.raises(KeyboardInterrupt):
+            server.start()
+
+        mock_socket.listen.assert_called_once_with(64)
+
     @patch("socket.socket")
     def test_handle_client(self, mock_socket_class):
         """Test handling a client connection."""
         mock_server_socket = Mock()
         mock_client_socket = Mock()
-        mock_client_socket.recv.return_value = b"request data"
+        mock_client_socket.recv_into.side_effect = _recv_into(b"request data")
         mock_server_socket.accept.return_value = (
             mock_client_socket,
             ("127.0.0.1", 54321),
@@ -62,16 +268,73 @@ class TestSyncTCPServer:
         # Manually call _handle_client
         server._handle_client(mock_client_socket, ("127.0.0.1", 54321))
 
-        mock_client_socket.recv.assert_called_once_with(4096)
+        mock_client_socket.recv_into.assert_called_once()
         handler.assert_called_once_with(b"request data", ("127.0.0.1", 54321))
         mock_client_socket.sendall.assert_called_once_with(b"response data")
         mock_client_socket.close.assert_called_once()
 
+    def test_handle_client_batched_messages(self):
+        """Test back-to-back messages are read with one recv_into call."""
+        mock_client_socket = Mock()
+        mock_client_socket.recv_into.side_effect = _recv_into(b"first" b"second")
+
+        handler = Mock(return_value=None)
+        server = SyncTCPServer("0.0.0.0", 8080, handler)
+        server._handle_client(mock_client_socket, ("127.0.0.1", 54321))
+
+        mock_client_socket.recv_into.assert_called_once()
+        mock_client_socket.recv.assert_not_called()
+        handler.assert_called_once_with(b"firstsecond", ("127.0.0.1", 54321))
+
+    def test_uses_recv_into_bytearray(self):
+        """Test reads go into one preallocated bytearray, not fresh bytes."""
+        buffers = []
+
+        def recv_into(buffer):
+            buffers.append(buffer)
+            return 0
+
+        server = SyncTCPServer("0.0.0.0", 8080, Mock())
+        for _ in range(2):
+            client = Mock()
+            client.recv_into.side_effect = recv_into
+            server._handle_client(client, ("127.0.0.1", 54321))
+            client.recv.assert_not_called()
+
+        assert isinstance(buffers[0].obj, bytearray)
+        assert len(buffers[0]) == server.buffer_size
+        assert buffers[0] is buffers[1]
+
+    def test_handle_client_respects_buffer_size(self):
+        """Test a client read is capped at buffer_size bytes."""
+        mock_client_socket = Mock()
+        mock_client_socket.recv_into.side_effect = lambda buffer: len(buffer)
+
+        handler = Mock(return_value=None)
+        server = SyncTCPServer("0.0.0.0", 8080, handler, buffer_size=16)
+        server._handle_client(mock_client_socket, ("127.0.0.1", 54321))
+
+        data, _ = handler.call_args.args
+        assert len(data) == 16
+
+    def test_handle_client_copies_out_of_buffer(self):
+        """Test data passed to the handler survives the buffer being reused."""
+        first, second = Mock(), Mock()
+        first.recv_into.side_effect = _recv_into(b"aaaa")
+        second.recv_into.side_effect = _recv_into(b"bbbb")
+
+        seen = []
+        server = SyncTCPServer("0.0.0.0", 8080, lambda data, addr: seen.append(data))
+        server._handle_client(first, ("127.0.0.1", 54321))
+        server._handle_client(second, ("127.0.0.1", 54322))
+
+        assert seen == [b"aaaa", b"bbbb"]
+
     @patch("socket.socket")
     def test_handle_client_no_data(self, mock_socket_class):
         """Test handling client when no data received."""
         mock_client_socket = Mock()
-        mock_client_socket.recv.return_value = b""
+        mock_client_socket.recv_into.side_effect = _recv_into(b"")
 
         handler = Mock()
         server = SyncTCPServer("0.0.0.0", 8080, handler)
@@ -112,7 +375,7 @@ class TestSyncTCPServer:
     def test_handler_exception(self, mock_socket_class):
         """Test handling exception in handler."""
         mock_client_socket = Mock()
-        mock_client_socket.recv.return_value = b"data"
+        mock_client_socket.recv_into.side_effect = _recv_into(b"data")
 
         handler = Mock(side_effect=Exception("Handler error"))
         server = SyncTCPServer("0.0.0.0", 8080, handler)
@@ -128,7 +391,7 @@ class TestSyncTCPServer:
     def test_handler_returns_none(self, mock_socket_class):
         """Test when handler returns None."""
         mock_client_socket = Mock()
-        mock_client_socket.recv.return_value = b"data"
+        mock_client_socket.recv_into.side_effect = _recv_into(b"data")
 
         handler = Mock(return_value=None)
         server = SyncTCPServer("0.0.0.0", 8080, handler)
@@ -143,10 +406,10 @@ class TestSyncTCPServer:
     def test_multiple_clients(self, mock_socket_class):
         """Test handling multiple client connections."""
         mock_client1 = Mock()
-        mock_client1.recv.return_value = b"data1"
+        mock_client1.recv_into.side_effect = _recv_into(b"data1")
 
         mock_client2 = Mock()
-        mock_client2.recv.return_value = b"data2"
+        mock_client2.recv_into.side_effect = _recv_into(b"data2")
 
         handler = Mock(side_effect=[b"response1", b"response2"])
         server = SyncTCPServer("0.0.0.0", 8080, handler)
@@ -0,0 +1,108 @@
+"""Unit tests for transports.udp.async_client module."""
+
+import pytest
+import asyncio
+from unittest.mock import Mock, AsyncMock
+
+from packerpy.transports.udp.async_client import AsyncUDPClient
+from packerpy.transports.udp.async_socket import AsyncUDPProtocol
+
+
+@pytest.fixture
+def mock_loop(monkeypatch):
+    """Make asyncio.get_event_loop return a loop with a mocked endpoint."""
+    mock_loop = Mock()
+    mock_loop.create_datagram_endpoint = AsyncMock(
+        return_value=(Mock(), AsyncUDPProtocol())
+    )
+    monkeypatch.setattr(asyncio, "get_event_loop", lambda: mock_loop)
+    return mock_loop
+
+
+@pytest.mark.asyncio
+class TestAsyncUDPClient:
+    """Test suite for AsyncUDPClient."""
+
+    async def test_initialization(self):
+        """Test client initialization."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+
+        assert client.host == "127.0.0.1"
+        assert client.port == 8080
+        assert client.transport is None
+        assert client.protocol is None
+
+    async def test_connect(self, mock_loop):
+        """Test connecting opens an endpoint to the server address."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+        await client.connect()
+
+        mock_loop.create_datagram_endpoint.assert_called_once()
+        _, kwargs = mock_loop.create_datagram_endpoint.call_args
+        assert kwargs["remote_addr"] == ("127.0.0.1", 8080)
+        assert client.transport is not None
+        assert isinstance(client.protocol, AsyncUDPProtocol)
+
+    async def test_send_not_connected(self):
+        """Test sending when not connected raises error."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+
+        with pytest.raises(ConnectionError, match="Not connected"):
+            await client.send(b"data")
+
+    async def test_send(self, mock_loop):
+        """Test sending a datagram."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+        await client.connect()
+        await client.send(b"test data")
+
+        client.transport.sendto.assert_called_once_with(b"test data")
+
+    async def test_receive_not_connected(self):
+        """Test receiving when not connected raises error."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+
+        with pytest.raises(ConnectionError, match="Not connected"):
+            await client.receive()
+
+    async def test_receive(self, mock_loop):
+        """Test receiving a datagram."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+        await client.connect()
+        client.protocol.datagram_received(b"response data", ("127.0.0.1", 8080))
+
+        assert await client.receive() == b"response data"
+
+    async def test_receive_custom_buffer_size(self, mock_loop):
+        """Test that datagrams longer than buffer_size are truncated."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+        await client.connect()
+        client.protocol.datagram_received(b"response data", ("127.0.0.1", 8080))
+
+        assert await client.receive(buffer_size=8) == b"response"
+
+    async def test_close(self, mock_loop):
+        """Test closing the client."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+        await client.connect()
+        transport = client.transport
+        await client.close()
+
+        transport.close.assert_called_once()
+        assert client.transport is None
+        assert client.protocol is None
+
+    async def test_close_when_not_connected(self):
+        """Test closing when not connected does nothing."""
+        client = AsyncUDPClient("127.0.0.1", 8080)
+        await client.close()  # Should not raise
+
+        assert client.transport is None
+
+    async def test_async_context_manager(self, mock_loop):
+        """Test using client as async context manager."""
+        async with AsyncUDPClient("127.0.0.1", 8080) as client:
+            transport = client.transport
+            assert transport is not None
+
+        transport.close.assert_called_once()
@@ -1,10 +1,74 @@
 """Unit tests for transports.udp.async_socket module."""
 
 import pytest
+import pytest_asyncio
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
+import logging
 
 from packerpy.transports.udp.async_socket import AsyncUDPSocket, AsyncUDPProtocol
+from tests.unit._fakes import RecordingTransport
+
+PACKETS = [
+    pytest.param([(b"", ("127.0.0.1", 9000))], id="empty"),
+    pytest.param(
+        [
+            (b"data1", ("127.0.0.1", 9000)),
+            (b"data2", ("127.0.0.1", 9001)),
+            (b"data3", ("192.168.1.1", 8080)),
+        ],
+        id="same-host",
+    ),
+    pytest.param(
+        [
+            (b"data1", ("127.0.0.1", 9000)),
+            (b"data2", ("192.168.1.1", 8080)),
+            (b"data3", ("10.0.0.1", 5555)),
+        ],
+        id="different-hosts",
+    ),
+]
+
+
+# Async tests and fixtures here share one module-scoped event loop instead of
+# building and closing a loop per test.
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture
+def rec_transport():
+    """Create the datagram transport the mocked endpoint hands back."""
+    return RecordingTransport()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def endpoint_calls(monkeypatch, rec_transport):
+    """Stub create_datagram_endpoint on the running loop and record its kwargs."""
+    calls = []
+
+    async def create_datagram_endpoint(protocol_factory, **kwargs):
+        calls.append(kwargs)
+        protocol = protocol_factory()
+        protocol.connection_made(rec_transport)
+        return rec_transport, protocol
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "create_datagram_endpoint", create_datagram_endpoint)
+    return calls
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def bound_async_sock(endpoint_calls):
+    """Create an AsyncUDPSocket bound to the stubbed endpoint."""
+    sock = AsyncUDPSocket("0.0.0.0", 8080)
+    await sock.bind()
+    yield sock
+    await sock.close()
+
+
+@pytest.fixture(scope="module")
+def unbound_async_sock():
+    """Share one never-bound AsyncUDPSocket across the not-bound tests."""
+    return AsyncUDPSocket("0.0.0.0", 8080)
 
 
 class TestAsyncUDPProtocol:
@@ -15,16 +79,20 @@ class TestAsyncUDPProtocol:
         protocol = AsyncUDPProtocol()
 
         assert protocol.transport is None
-        assert isinstance(protocol.received_data, asyncio.Queue)
+        assert len(protocol.received_data) == 0
+
+    def test_slots_defined(self):
+        """Test the protocol stores its state in slots, not an instance dict."""
+        assert not hasattr(AsyncUDPProtocol(), "__dict__")
 
     def test_connection_made(self):
         """Test connection_made callback."""
         protocol = AsyncUDPProtocol()
-        mock_transport = Mock()
+        transport = RecordingTransport()
 
-        protocol.connection_made(mock_transport)
+        protocol.connection_made(transport)
 
-        assert protocol.transport == mock_transport
+        assert protocol.transport is transport
 
     def test_datagram_received(self):
         """Test datagram_received callback."""
@@ -32,36 +100,68 @@ class TestAsyncUDPProtocol:
 
         protocol.datagram_received(b"test data", ("127.0.0.1", 9000))
 
-        # Data should be in queue
-        assert not protocol.received_data.empty()
+        assert list(protocol.received_data) == [(b"test data", ("127.0.0.1", 9000))]
 
-    @pytest.mark.asyncio
+    @module_loop
     async def test_datagram_received_can_be_retrieved(self):
-        """Test that received datagrams can be retrieved from queue."""
+        """Test that received datagrams can be retrieved in order."""
         protocol = AsyncUDPProtocol()
 
         protocol.datagram_received(b"data1", ("127.0.0.1", 9000))
         protocol.datagram_received(b"data2", ("127.0.0.1", 9001))
 
-        data1, addr1 = await protocol.received_data.get()
-        data2, addr2 = await protocol.received_data.get()
+        assert len(protocol.received_data) == 2
+        data1, addr1 = await protocol.receive()
+        data2, addr2 = await protocol.receive()
 
         assert data1 == b"data1"
         assert addr1 == ("127.0.0.1", 9000)
         assert data2 == b"data2"
         assert addr2 == ("127.0.0.1", 9001)
 
-    def test_error_received(self, capsys):
-        """Test error_received callback."""
+    @module_loop
+    async def test_receive_waits_for_datagram(self):
+        """Test receive wakes when a datagram arrives after it started waiting."""
+        protocol = AsyncUDPProtocol()
+
+        task = asyncio.create_task(protocol.receive())
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        protocol.datagram_received(b"late", ("127.0.0.1", 9000))
+
+        assert await task == (b"late", ("127.0.0.1", 9000))
+        assert len(protocol.received_data) == 0
+
+    @module_loop
+    async def test_cancelled_receive_does_not_block_others(self):
+        """Test cancelling one waiting receive leaves another able to wake."""
+        protocol = AsyncUDPProtocol()
+
+        cancelled = asyncio.create_task(protocol.receive())
+        waiting = asyncio.create_task(protocol.receive())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        protocol.datagram_received(b"data", ("127.0.0.1", 9000))
+
+        assert await waiting == (b"data", ("127.0.0.1", 9000))
+        assert cancelled.cancelled()
+
+    def test_error_received(self, caplog):
+        """Test error_received logs the error."""
         protocol = AsyncUDPProtocol()
 
-        protocol.error_received(Exception("Test error"))
+        with caplog.at_level(
+            logging.ERROR, logger="packerpy.transports.udp.async_socket"
+        ):
+            protocol.error_received(Exception("Test error"))
 
-        captured = capsys.readouterr()
-        assert "UDP error" in captured.out
+        assert "UDP error: Test error" in caplog.text
 
 
-@pytest.mark.asyncio
+@module_loop
 class TestAsyncUDPSocket:
     """Test suite for AsyncUDPSocket."""
 
@@ -74,236 +174,115 @@ class TestAsyncUDPSocket:
         assert sock.transport is None
         assert sock.protocol is None
 
+    async def test_slots_defined(self):
+        """Test the socket stores its state in slots, not an instance dict."""
+        assert not hasattr(AsyncUDPSocket("0.0.0.0", 8080), "__dict__")
+
     async def test_initialization_auto_port(self):
         """Test initialization with auto-assigned port."""
         sock = AsyncUDPSocket("0.0.0.0", 0)
 
         assert sock.port == 0
 
-    @patch("asyncio.get_event_loop")
-    async def test_bind(self, mock_get_loop):
+    async def test_bind(self, endpoint_calls, rec_transport):
         """Test binding socket."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
-
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
-
         sock = AsyncUDPSocket("0.0.0.0", 8080)
         await sock.bind()
 
-        mock_loop.create_datagram_endpoint.assert_called_once()
-        assert sock.transport == mock_transport
+        assert len(endpoint_calls) == 1
+        assert endpoint_calls[0]["local_addr"] == ("0.0.0.0", 8080)
+        assert sock.transport is rec_transport
         assert isinstance(sock.protocol, AsyncUDPProtocol)
 
-    async def test_send_to_not_bound(self):
+    async def test_send_to_not_bound(self, unbound_async_sock):
         """Test sending when not bound raises error."""
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-
         with pytest.raises(ConnectionError, match="Socket not bound"):
-            await sock.send_to(b"data", ("127.0.0.1", 9000))
+            await unbound_async_sock.send_to(b"data", ("127.0.0.1", 9000))
 
-    @patch("asyncio.get_event_loop")
-    async def test_send_to(self, mock_get_loop):
+    async def test_send_to(self, bound_async_sock, rec_transport):
         """Test sending data to address."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
-
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
+        await bound_async_sock.send_to(b"test data", ("127.0.0.1", 9000))
 
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.bind()
-        await sock.send_to(b"test data", ("127.0.0.1", 9000))
+        assert rec_transport.calls == [("sendto", b"test data", ("127.0.0.1", 9000))]
 
-        mock_transport.sendto.assert_called_once_with(b"test data", ("127.0.0.1", 9000))
-
-    async def test_receive_from_not_bound(self):
+    async def test_receive_from_not_bound(self, unbound_async_sock):
         """Test receiving when not bound raises error."""
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-
         with pytest.raises(ConnectionError, match="Socket not bound"):
-            await sock.receive_from()
+            await unbound_async_sock.receive_from()
 
-    @patch("asyncio.get_event_loop")
-    async def test_receive_from(self, mock_get_loop):
+    async def test_receive_from(self, bound_async_sock):
         """Test receiving data from sender."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
-
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
+        bound_async_sock.protocol.datagram_received(
+            b"response data", ("127.0.0.1", 9000)
         )
-        mock_get_loop.return_value = mock_loop
-
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.bind()
-
-        # Simulate received data
-        sock.protocol.datagram_received(b"response data", ("127.0.0.1", 9000))
 
-        data, address = await sock.receive_from()
+        data, address = await bound_async_sock.receive_from()
 
         assert data == b"response data"
         assert address == ("127.0.0.1", 9000)
 
-    @patch("asyncio.get_event_loop")
-    async def test_close(self, mock_get_loop):
+    async def test_close(self, bound_async_sock, rec_transport):
         """Test closing socket."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
+        await bound_async_sock.close()
 
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
-
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.bind()
-        await sock.close()
-
-        mock_transport.close.assert_called_once()
-        assert sock.transport is None
-        assert sock.protocol is None
+        assert rec_transport.calls == [("close",)]
+        assert bound_async_sock.transport is None
+        assert bound_async_sock.protocol is None
 
-    async def test_close_when_not_bound(self):
+    async def test_close_when_not_bound(self, unbound_async_sock):
         """Test closing when not bound does nothing."""
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.close()  # Should not raise
+        await unbound_async_sock.close()  # Should not raise
 
-        assert sock.transport is None
-        assert sock.protocol is None
+        assert unbound_async_sock.transport is None
+        assert unbound_async_sock.protocol is None
 
-    @patch("asyncio.get_event_loop")
-    async def test_async_context_manager(self, mock_get_loop):
+    async def test_async_context_manager(self, endpoint_calls, rec_transport):
         """Test using socket as async context manager."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
-
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
-
         async with AsyncUDPSocket("0.0.0.0", 8080) as sock:
             assert sock.transport is not None
 
-        mock_transport.close.assert_called_once()
+        assert rec_transport.calls == [("close",)]
 
-    @patch("asyncio.get_event_loop")
-    async def test_async_context_manager_exception(self, mock_get_loop):
+    async def test_async_context_manager_exception(self, endpoint_calls, rec_transport):
         """Test context manager cleanup on exception."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
-
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
-
         with pytest.raises(ValueError):
             async with AsyncUDPSocket("0.0.0.0", 8080) as sock:
                 raise ValueError("Test error")
 
         # Should still close
-        mock_transport.close.assert_called_once()
+        assert rec_transport.calls == [("close",)]
 
-    @patch("asyncio.get_event_loop")
-    async def test_multiple_sends(self, mock_get_loop):
-        """Test multiple send operations."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
+    async def test_send_many(self, bound_async_sock, rec_transport):
+        """Test sending a batch of datagrams in one call."""
+        packets = [
+            (b"data1", ("127.0.0.1", 9000)),
+            (b"data2", ("127.0.0.1", 9001)),
+            (b"data3", ("192.168.1.1", 8080)),
+        ]
 
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
-
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.bind()
-
-        await sock.send_to(b"data1", ("127.0.0.1", 9000))
-        await sock.send_to(b"data2", ("127.0.0.1", 9001))
-        await sock.send_to(b"data3", ("192.168.1.1", 8080))
+        await bound_async_sock.send_many(packets)
 
-        assert mock_transport.sendto.call_count == 3
+        assert rec_transport.calls == [("sendto", d, a) for d, a in packets]
 
-    @patch("asyncio.get_event_loop")
-    async def test_send_empty_data(self, mock_get_loop):
-        """Test sending empty data."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
-
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
-
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.bind()
-        await sock.send_to(b"", ("127.0.0.1", 9000))
-
-        mock_transport.sendto.assert_called_once_with(b"", ("127.0.0.1", 9000))
-
-    @patch("asyncio.get_event_loop")
-    async def test_receive_empty_data(self, mock_get_loop):
-        """Test receiving empty data."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
-
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
-
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.bind()
-
-        sock.protocol.datagram_received(b"", ("127.0.0.1", 9000))
-
-        data, address = await sock.receive_from()
-
-        assert data == b""
-        assert address == ("127.0.0.1", 9000)
-
-    @patch("asyncio.get_event_loop")
-    async def test_multiple_receives(self, mock_get_loop):
-        """Test receiving multiple datagrams."""
-        mock_transport = Mock()
-        mock_protocol = AsyncUDPProtocol()
+    async def test_send_many_not_bound(self, unbound_async_sock):
+        """Test sending a batch when not bound raises error."""
+        with pytest.raises(ConnectionError, match="Socket not bound"):
+            await unbound_async_sock.send_many([(b"data", ("127.0.0.1", 9000))])
 
-        mock_loop = Mock()
-        mock_loop.create_datagram_endpoint = AsyncMock(
-            return_value=(mock_transport, mock_protocol)
-        )
-        mock_get_loop.return_value = mock_loop
+    @pytest.mark.parametrize("packets", PACKETS)
+    async def test_send_to_packets(self, bound_async_sock, rec_transport, packets):
+        """Test each send_to call reaches the transport in order."""
+        for data, addr in packets:
+            await bound_async_sock.send_to(data, addr)
 
-        sock = AsyncUDPSocket("0.0.0.0", 8080)
-        await sock.bind()
+        assert rec_transport.calls == [("sendto", d, a) for d, a in packets]
 
-        # Simulate multiple received datagrams
-        sock.protocol.datagram_received(b"data1", ("127.0.0.1", 9000))
-        sock.protocol.datagram_received(b"data2", ("127.0.0.1", 9001))
-        sock.protocol.datagram_received(b"data3", ("192.168.1.1", 8080))
+    @pytest.mark.parametrize("packets", PACKETS)
+    async def test_receive_from_packets(self, bound_async_sock, packets):
+        """Test receive_from returns datagrams in arrival order."""
+        for data, addr in packets:
+            bound_async_sock.protocol.datagram_received(data, addr)
 
-        results = []
-        for _ in range(3):
-            results.append(await sock.receive_from())
+        results = [await bound_async_sock.receive_from() for _ in packets]
 
-        assert len(results) == 3
-        assert results[0] == (b"data1", ("127.0.0.1", 9000))
-        assert results[1] == (b"data2", ("127.0.0.1", 9001))
-        assert results[2] == (b"data3", ("192.168.1.1", 8080))
+        assert results == packets
@@ -5,6 +5,51 @@ import socket
 from unittest.mock import Mock, patch
 
 from packerpy.transports.udp.sync_socket import SyncUDPSocket
+from tests.unit._fakes import RecordingSocket
+
+PACKETS = [
+    pytest.param([(b"", ("127.0.0.1", 9000))], id="empty"),
+    pytest.param(
+        [
+            (b"data1", ("127.0.0.1", 9000)),
+            (b"data2", ("127.0.0.1", 9001)),
+            (b"data3", ("192.168.1.1", 8080)),
+        ],
+        id="same-host",
+    ),
+    pytest.param(
+        [
+            (b"data1", ("127.0.0.1", 9000)),
+            (b"data2", ("192.168.1.1", 8080)),
+            (b"data3", ("10.0.0.1", 5555)),
+        ],
+        id="different-hosts",
+    ),
+]
+
+
+@pytest.fixture
+def rec_socket(monkeypatch):
+    """Make socket.socket return one RecordingSocket."""
+    rec_socket = RecordingSocket()
+    monkeypatch.setattr(socket, "socket", lambda *args, **kwargs: rec_socket)
+    return rec_socket
+
+
+@pytest.fixture
+def bound_sync_sock(rec_socket):
+    """Create a SyncUDPSocket bound to the recording socket."""
+    sock = SyncUDPSocket("0.0.0.0", 8080)
+    sock.bind()
+    rec_socket.calls.clear()
+    yield sock
+    sock.close()
+
+
+@pytest.fixture(scope="module")
+def unbound_sync_sock():
+    """Share one never-bound SyncUDPSocket across the not-bound tests."""
+    return SyncUDPSocket("0.0.0.0", 8080)
 
 
 class TestSyncUDPSocket:
@@ -18,6 +63,10 @@ class TestSyncUDPSocket:
         assert sock.port == 8080
         assert sock.socket is None
 
+    def test_slots_defined(self):
+        """Test the socket stores its state in slots, not an instance dict."""
+        assert not hasattr(SyncUDPSocket("0.0.0.0", 8080), "__dict__")
+
     def test_initialization_auto_port(self):
         """Test initialization with auto-assigned port."""
         sock = SyncUDPSocket("0.0.0.0", 0)
@@ -50,145 +99,85 @@ class TestSyncUDPSocket:
         # Port should be updated from getsockname
         assert sock.port == 54321
 
-    def test_send_to_not_bound(self):
+    def test_send_to_not_bound(self, unbound_sync_sock):
         """Test sending when not bound raises error."""
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-
         with pytest.raises(ConnectionError, match="Socket not bound"):
-            sock.send_to(b"data", ("127.0.0.1", 9000))
+            unbound_sync_sock.send_to(b"data", ("127.0.0.1", 9000))
 
-    @patch("socket.socket")
-    def test_send_to(self, mock_socket_class):
+    def test_send_to(self, rec_socket, bound_sync_sock):
         """Test sending data to address."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
+        bound_sync_sock.send_to(b"test data", ("127.0.0.1", 9000))
 
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-        sock.send_to(b"test data", ("127.0.0.1", 9000))
-
-        mock_socket.sendto.assert_called_once_with(b"test data", ("127.0.0.1", 9000))
+        assert rec_socket.calls == [("sendto", b"test data", ("127.0.0.1", 9000))]
 
-    def test_receive_from_not_bound(self):
+    def test_receive_from_not_bound(self, unbound_sync_sock):
         """Test receiving when not bound raises error."""
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-
         with pytest.raises(ConnectionError, match="Socket not bound"):
-            sock.receive_from()
+            unbound_sync_sock.receive_from()
 
-    @patch("socket.socket")
-    def test_receive_from(self, mock_socket_class):
+    def test_receive_from(self, rec_socket, bound_sync_sock):
         """Test receiving data from sender."""
-        mock_socket = Mock()
-        mock_socket.recvfrom.return_value = (b"response data", ("127.0.0.1", 9000))
-        mock_socket_class.return_value = mock_socket
+        rec_socket.datagrams.append((b"response data", ("127.0.0.1", 9000)))
 
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-        data, address = sock.receive_from()
+        data, address = bound_sync_sock.receive_from()
 
         assert data == b"response data"
         assert address == ("127.0.0.1", 9000)
-        mock_socket.recvfrom.assert_called_once_with(4096)
+        assert rec_socket.calls == [("recvfrom", 4096)]
 
-    @patch("socket.socket")
-    def test_receive_from_custom_buffer_size(self, mock_socket_class):
+    def test_receive_from_custom_buffer_size(self, rec_socket, bound_sync_sock):
         """Test receiving with custom buffer size."""
-        mock_socket = Mock()
-        mock_socket.recvfrom.return_value = (b"data", ("127.0.0.1", 9000))
-        mock_socket_class.return_value = mock_socket
+        rec_socket.datagrams.append((b"data", ("127.0.0.1", 9000)))
 
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-        sock.receive_from(buffer_size=8192)
+        bound_sync_sock.receive_from(buffer_size=8192)
 
-        mock_socket.recvfrom.assert_called_once_with(8192)
+        assert rec_socket.calls == [("recvfrom", 8192)]
 
-    @patch("socket.socket")
-    def test_close(self, mock_socket_class):
+    def test_close(self, rec_socket, bound_sync_sock):
         """Test closing socket."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
+        bound_sync_sock.close()
 
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-        sock.close()
-
-        mock_socket.close.assert_called_once()
-        assert sock.socket is None
+        assert rec_socket.calls == [("close",)]
+        assert bound_sync_sock.socket is None
 
-    def test_close_when_not_bound(self):
+    def test_close_when_not_bound(self, unbound_sync_sock):
         """Test closing when not bound does nothing."""
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.close()  # Should not raise
+        unbound_sync_sock.close()  # Should not raise
 
-        assert sock.socket is None
+        assert unbound_sync_sock.socket is None
 
-    @patch("socket.socket")
-    def test_context_manager(self, mock_socket_class):
+    def test_context_manager(self, rec_socket):
         """Test using socket as context manager."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-
         with SyncUDPSocket("0.0.0.0", 8080) as sock:
             assert sock.socket is not None
 
-        mock_socket.bind.assert_called_once()
-        mock_socket.close.assert_called_once()
+        assert rec_socket.calls == [("bind", ("0.0.0.0", 8080)), ("close",)]
 
-    @patch("socket.socket")
-    def test_context_manager_exception(self, mock_socket_class):
+    def test_context_manager_exception(self, rec_socket):
         """Test context manager cleanup on exception."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-
         with pytest.raises(ValueError):
             with SyncUDPSocket("0.0.0.0", 8080) as sock:
                 raise ValueError("Test error")
 
         # Should still close
-        mock_socket.close.assert_called_once()
-
-    @patch("socket.socket")
-    def test_multiple_sends(self, mock_socket_class):
-        """Test multiple send operations."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-
-        sock.send_to(b"data1", ("127.0.0.1", 9000))
-        sock.send_to(b"data2", ("127.0.0.1", 9001))
-        sock.send_to(b"data3", ("192.168.1.1", 8080))
-
-        assert mock_socket.sendto.call_count == 3
+        assert rec_socket.calls[-1] == ("close",)
 
-    @patch("socket.socket")
-    def test_send_empty_data(self, mock_socket_class):
-        """Test sending empty data."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-        sock.send_to(b"", ("127.0.0.1", 9000))
-
-        mock_socket.sendto.assert_called_once_with(b"", ("127.0.0.1", 9000))
+    def test_send_many(self, rec_socket, bound_sync_sock):
+        """Test sending a batch of datagrams in one call."""
+        packets = [
+            (b"data1", ("127.0.0.1", 9000)),
+            (b"data2", ("127.0.0.1", 9001)),
+            (b"data3", ("192.168.1.1", 8080)),
+        ]
 
-    @patch("socket.socket")
-    def test_receive_empty_data(self, mock_socket_class):
-        """Test receiving empty data."""
-        mock_socket = Mock()
-        mock_socket.recvfrom.return_value = (b"", ("127.0.0.1", 9000))
-        mock_socket_class.return_value = mock_socket
+        bound_sync_sock.send_many(packets)
 
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-        data, address = sock.receive_from()
+        assert rec_socket.calls == [("sendto", d, a) for d, a in packets]
 
-        assert data == b""
-        assert address == ("127.0.0.1", 9000)
+    def test_send_many_not_bound(self, unbound_sync_sock):
+        """Test sending a batch when not bound raises error."""
+        with pytest.raises(ConnectionError, match="Socket not bound"):
+            unbound_sync_sock.send_many([(b"data", ("127.0.0.1", 9000))])
 
     @patch("socket.socket")
     def test_bind_error(self, mock_socket_class):
@@ -202,39 +191,19 @@ class TestSyncUDPSocket:
         with pytest.raises(OSError, match="Address already in use"):
             sock.bind()
 
-    @patch("socket.socket")
-    def test_send_to_different_addresses(self, mock_socket_class):
-        """Test sending to different addresses."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
-
-        addresses = [("127.0.0.1", 9000), ("192.168.1.1", 8080), ("10.0.0.1", 5555)]
+    @pytest.mark.parametrize("packets", PACKETS)
+    def test_send_to_packets(self, rec_socket, bound_sync_sock, packets):
+        """Test each send_to call reaches sendto in order."""
+        for data, addr in packets:
+            bound_sync_sock.send_to(data, addr)
 
-        for i, addr in enumerate(addresses):
-            sock.send_to(f"data{i}".encode(), addr)
+        assert rec_socket.calls == [("sendto", d, a) for d, a in packets]
 
-        assert mock_socket.sendto.call_count == 3
-
-    @patch("socket.socket")
-    def test_receive_from_different_senders(self, mock_socket_class):
-        """Test receiving from different senders."""
-        mock_socket = Mock()
-        responses = [
-            (b"data1", ("127.0.0.1", 9000)),
-            (b"data2", ("192.168.1.1", 8080)),
-            (b"data3", ("10.0.0.1", 5555)),
-        ]
-        mock_socket.recvfrom.side_effect = responses
-        mock_socket_class.return_value = mock_socket
-
-        sock = SyncUDPSocket("0.0.0.0", 8080)
-        sock.bind()
+    @pytest.mark.parametrize("packets", PACKETS)
+    def test_receive_from_packets(self, rec_socket, bound_sync_sock, packets):
+        """Test receive_from returns datagrams in arrival order."""
+        rec_socket.datagrams.extend(packets)
 
-        results = []
-        for _ in range(3):
-            results.append(sock.receive_from())
+        results = [bound_sync_sock.receive_from() for _ in packets]
 
-        assert results == responses
+        assert results == packets